@@ -0,0 +1,22 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (C) 2026 Graz University of Technology.
+#
+# Invenio-Curations is free software; you can redistribute it and/or modify it
+# under the terms of the MIT License; see LICENSE file for more details.
+
+"""Create invenio-curations branch."""
+
+# revision identifiers, used by Alembic.
+revision = "59331def3911"
+down_revision = None
+branch_labels = ("invenio_curations",)
+depends_on = "dbdbc1b19cf2"
+
+
+def upgrade() -> None:
+    """Upgrade database."""
+
+
+def downgrade() -> None:
+    """Downgrade database."""
@@ -0,0 +1,57 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (C) 2026 Graz University of Technology.
+#
+# Invenio-Curations is free software; you can redistribute it and/or modify it
+# under the terms of the MIT License; see LICENSE file for more details.
+
+"""Create curation transition table."""
+
+import sqlalchemy as sa
+import sqlalchemy_utils
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "59856f64a754"
+down_revision = "59331def3911"
+branch_labels = ()
+depends_on = None
+
+
+def upgrade() -> None:
+    """Upgrade database."""
+    op.create_table(
+        "curations_transition",
+        sa.Column("id", sa.Integer(), autoincrement=True, nullable=False),
+        sa.Column("request_id", sqlalchemy_utils.types.uuid.UUIDType(), nullable=False),
+        sa.Column("status_from", sa.String(length=50), nullable=True),
+        sa.Column("status_to", sa.String(length=50), nullable=False),
+        sa.Column("duration", sa.Float(), nullable=True),
+        sa.Column("created", sa.DateTime(), nullable=False),
+        sa.PrimaryKeyConstraint("id", name=op.f("pk_curations_transition")),
+    )
+    op.create_index(
+        op.f("ix_curations_transition_request_id"),
+        "curations_transition",
+        ["request_id"],
+        unique=False,
+    )
+    op.create_index(
+        op.f("ix_curations_transition_created"),
+        "curations_transition",
+        ["created"],
+        unique=False,
+    )
+
+
+def downgrade() -> None:
+    """Downgrade database."""
+    op.drop_index(
+        op.f("ix_curations_transition_created"),
+        table_name="curations_transition",
+    )
+    op.drop_index(
+        op.f("ix_curations_transition_request_id"),
+        table_name="curations_transition",
+    )
+    op.drop_table("curations_transition")
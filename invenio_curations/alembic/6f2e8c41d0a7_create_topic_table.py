@@ -0,0 +1,97 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (C) 2026 Graz University of Technology.
+#
+# Invenio-Curations is free software; you can redistribute it and/or modify it
+# under the terms of the MIT License; see LICENSE file for more details.
+
+"""Create curation topic table."""
+
+import sqlalchemy as sa
+import sqlalchemy_utils
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "6f2e8c41d0a7"
+down_revision = "59856f64a754"
+branch_labels = ()
+depends_on = None
+
+
+BATCH_SIZE = 1000
+
+
+def _backfill() -> None:
+    """Add the topics of the existing curation requests, keeping the oldest ones.
+
+    Only the topics of the curation requests are read, in batches.
+    """
+    request_metadata = sa.table(
+        "request_metadata",
+        sa.column("id", sqlalchemy_utils.types.uuid.UUIDType()),
+        sa.column("json", sa.JSON()),
+        sa.column("created", sa.DateTime()),
+    )
+    curations_topic = sa.table(
+        "curations_topic",
+        sa.column("topic_type", sa.String()),
+        sa.column("topic_id", sa.String()),
+        sa.column("request_id", sqlalchemy_utils.types.uuid.UUIDType()),
+        sa.column("created", sa.DateTime()),
+    )
+
+    connection = op.get_bind()
+    rows = connection.execute(
+        sa.select(
+            request_metadata.c.id,
+            request_metadata.c.json["topic"],
+            request_metadata.c.created,
+        )
+        .where(request_metadata.c.json["type"].as_string() == "rdm-curation")
+        .order_by(request_metadata.c.created)
+        .execution_options(stream_results=True, yield_per=BATCH_SIZE),
+    )
+
+    seen: set[tuple[str, str]] = set()
+    for batch in rows.partitions():
+        topics = []
+        for id_, topic, created in batch:
+            for topic_type, topic_id in (topic or {}).items():
+                key = (topic_type, str(topic_id))
+                if key in seen:
+                    continue
+                seen.add(key)
+                topics.append(
+                    {
+                        "topic_type": topic_type,
+                        "topic_id": str(topic_id),
+                        "request_id": id_,
+                        "created": created,
+                    },
+                )
+
+        if topics:
+            op.bulk_insert(curations_topic, topics)
+
+
+def upgrade() -> None:
+    """Upgrade database."""
+    op.create_table(
+        "curations_topic",
+        sa.Column("topic_type", sa.String(length=50), nullable=False),
+        sa.Column("topic_id", sa.String(length=255), nullable=False),
+        sa.Column("request_id", sqlalchemy_utils.types.uuid.UUIDType(), nullable=True),
+        sa.Column("created", sa.DateTime(), nullable=False),
+        sa.PrimaryKeyConstraint(
+            "topic_type",
+            "topic_id",
+            name=op.f("pk_curations_topic"),
+        ),
+        sa.UniqueConstraint("request_id", name=op.f("uq_curations_topic_request_id")),
+    )
+    _backfill()
+
+
+def downgrade() -> None:
+    """Downgrade database."""
+    op.drop_table("curations_topic")
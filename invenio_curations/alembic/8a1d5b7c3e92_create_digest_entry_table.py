@@ -0,0 +1,47 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (C) 2026 Graz University of Technology.
+#
+# Invenio-Curations is free software; you can redistribute it and/or modify it
+# under the terms of the MIT License; see LICENSE file for more details.
+
+"""Create curation digest entry table."""
+
+import sqlalchemy as sa
+import sqlalchemy_utils
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "8a1d5b7c3e92"
+down_revision = "6f2e8c41d0a7"
+branch_labels = ()
+depends_on = None
+
+
+def upgrade() -> None:
+    """Upgrade database."""
+    op.create_table(
+        "curations_digest_entry",
+        sa.Column("id", sa.Integer(), autoincrement=True, nullable=False),
+        sa.Column("user_id", sa.Integer(), nullable=False),
+        sa.Column("notification_type", sa.String(length=255), nullable=False),
+        sa.Column("request_id", sqlalchemy_utils.types.uuid.UUIDType(), nullable=False),
+        sa.Column("title", sa.Text(), nullable=True),
+        sa.Column("created", sa.DateTime(), nullable=False),
+        sa.PrimaryKeyConstraint("id", name=op.f("pk_curations_digest_entry")),
+    )
+    op.create_index(
+        op.f("ix_curations_digest_entry_user_id"),
+        "curations_digest_entry",
+        ["user_id"],
+        unique=False,
+    )
+
+
+def downgrade() -> None:
+    """Downgrade database."""
+    op.drop_index(
+        op.f("ix_curations_digest_entry_user_id"),
+        table_name="curations_digest_entry",
+    )
+    op.drop_table("curations_digest_entry")
@@ -0,0 +1,37 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (C) 2026 Graz University of Technology.
+#
+# Invenio-Curations is free software; you can redistribute it and/or modify it
+# under the terms of the MIT License; see LICENSE file for more details.
+
+"""Create curation outbox event table."""
+
+import sqlalchemy as sa
+import sqlalchemy_utils
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "9c4f1e2a7b58"
+down_revision = "8a1d5b7c3e92"
+branch_labels = ()
+depends_on = None
+
+
+def upgrade() -> None:
+    """Upgrade database."""
+    op.create_table(
+        "curations_outbox_event",
+        sa.Column("id", sa.Integer(), autoincrement=True, nullable=False),
+        sa.Column("event_type", sa.String(length=255), nullable=False),
+        sa.Column("request_id", sqlalchemy_utils.types.uuid.UUIDType(), nullable=True),
+        sa.Column("payload", sa.JSON(), nullable=False),
+        sa.Column("attempts", sa.Integer(), nullable=False),
+        sa.Column("created", sa.DateTime(), nullable=False),
+        sa.PrimaryKeyConstraint("id", name=op.f("pk_curations_outbox_event")),
+    )
+
+
+def downgrade() -> None:
+    """Downgrade database."""
+    op.drop_table("curations_outbox_event")
@@ -0,0 +1,79 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (C) 2026 Graz University of Technology.
+#
+# Invenio-Curations is free software; you can redistribute it and/or modify it
+# under the terms of the MIT License; see LICENSE file for more details.
+
+"""Add curation request status to topic table."""
+
+import sqlalchemy as sa
+import sqlalchemy_utils
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "a3e7c9d2f614"
+down_revision = "9c4f1e2a7b58"
+branch_labels = ()
+depends_on = None
+
+
+def _backfill() -> None:
+    """Copy the status of the existing curation requests.
+
+    The accepted revisions are unknown, publishing checks these requests in the
+    search index until their next transition.
+    """
+    request_metadata = sa.table(
+        "request_metadata",
+        sa.column("id", sqlalchemy_utils.types.uuid.UUIDType()),
+        sa.column("json", sa.JSON()),
+    )
+    curations_topic = sa.table(
+        "curations_topic",
+        sa.column("request_id", sqlalchemy_utils.types.uuid.UUIDType()),
+        sa.column("status", sa.String()),
+    )
+
+    connection = op.get_bind()
+    rows = connection.execute(
+        sa.select(request_metadata.c.id, request_metadata.c.json)
+        .where(
+            request_metadata.c.id.in_(
+                sa.select(curations_topic.c.request_id).scalar_subquery(),
+            ),
+        )
+        .execution_options(stream_results=True),
+    )
+
+    statuses = [
+        {"id_": id_, "status": json["status"]}
+        for id_, json in rows
+        if json and json.get("status")
+    ]
+    if statuses:
+        connection.execute(
+            curations_topic.update()
+            .where(curations_topic.c.request_id == sa.bindparam("id_"))
+            .values(status=sa.bindparam("status")),
+            statuses,
+        )
+
+
+def upgrade() -> None:
+    """Upgrade database."""
+    op.add_column(
+        "curations_topic",
+        sa.Column("status", sa.String(length=50), nullable=True),
+    )
+    op.add_column(
+        "curations_topic",
+        sa.Column("accepted_revision_id", sa.Integer(), nullable=True),
+    )
+    _backfill()
+
+
+def downgrade() -> None:
+    """Downgrade database."""
+    op.drop_column("curations_topic", "accepted_revision_id")
+    op.drop_column("curations_topic", "status")
@@ -0,0 +1,53 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (C) 2026 Graz University of Technology.
+#
+# Invenio-Curations is free software; you can redistribute it and/or modify it
+# under the terms of the MIT License; see LICENSE file for more details.
+
+"""Create curation claim table."""
+
+import sqlalchemy as sa
+import sqlalchemy_utils
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "c5d8e1f3a926"
+down_revision = "a3e7c9d2f614"
+branch_labels = ()
+depends_on = None
+
+
+def upgrade() -> None:
+    """Upgrade database."""
+    op.create_table(
+        "curations_claim",
+        sa.Column(
+            "request_id",
+            sqlalchemy_utils.types.uuid.UUIDType(),
+            nullable=False,
+        ),
+        sa.Column("user_id", sa.Integer(), nullable=False),
+        sa.Column("created", sa.DateTime(), nullable=False),
+        sa.Column("expires", sa.DateTime(), nullable=False),
+        sa.PrimaryKeyConstraint("request_id", name=op.f("pk_curations_claim")),
+    )
+    op.create_index(
+        op.f("ix_curations_claim_user_id"),
+        "curations_claim",
+        ["user_id"],
+        unique=False,
+    )
+    op.create_index(
+        op.f("ix_curations_claim_expires"),
+        "curations_claim",
+        ["expires"],
+        unique=False,
+    )
+
+
+def downgrade() -> None:
+    """Downgrade database."""
+    op.drop_index(op.f("ix_curations_claim_expires"), table_name="curations_claim")
+    op.drop_index(op.f("ix_curations_claim_user_id"), table_name="curations_claim")
+    op.drop_table("curations_claim")
@@ -0,0 +1,135 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (C) 2026 Graz University of Technology.
+#
+# Invenio-Curations is free software; you can redistribute it and/or modify it
+# under the terms of the MIT License; see LICENSE file for more details.
+
+"""Command line interface for curations."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+import click
+from flask import current_app
+from flask.cli import with_appcontext
+
+# the commands are loaded by every `invenio` command, the services only when used
+if TYPE_CHECKING:
+    from .services.consistency import ConsistencyReport
+
+batch_size_option = click.option(
+    "--batch-size",
+    default=500,
+    show_default=True,
+    help="Number of requests checked per batch.",
+)
+workers_option = click.option(
+    "--workers",
+    default=4,
+    show_default=True,
+    help="Number of parallel workers checking the batches.",
+)
+verbose_option = click.option(
+    "--verbose",
+    "-v",
+    is_flag=True,
+    default=False,
+    help="List the affected request IDs.",
+)
+
+
+@click.group()
+def curations() -> None:
+    """Curations commands."""
+
+
+def _echo_report(report: ConsistencyReport, *, verbose: bool) -> None:
+    """Print the summary of a consistency report."""
+    duplicates = [id_ for ids in report.duplicates.values() for id_ in ids[1:]]
+    sections = [
+        ("Orphaned requests (topic does not exist)", report.orphaned),
+        ("Duplicate open requests for the same topic", duplicates),
+        ("Requests missing in the index", report.missing_in_index),
+        ("Requests outdated in the index", report.outdated_in_index),
+        ("Deleted requests still in the index", report.missing_in_db),
+        ("Requests without a tracked topic", list(report.untracked)),
+    ]
+
+    click.echo(f"Checked {report.checked} curation requests.")
+    for title, ids in sections:
+        click.secho(f"{title}: {len(ids)}", fg="red" if ids else "green")
+        if verbose:
+            for id_ in ids:
+                click.echo(f"  {id_}")
+
+    # not an inconsistency, these requests hold the review history of the records
+    click.echo(f"Requests of deleted records: {len(report.tombstoned)}")
+    if verbose:
+        for id_ in report.tombstoned:
+            click.echo(f"  {id_}")
+
+
+@curations.command("check")
+@batch_size_option
+@workers_option
+@verbose_option
+@with_appcontext
+def check(batch_size: int, workers: int, *, verbose: bool) -> None:
+    """Report inconsistencies between curation requests, topics and the index."""
+    from .services.consistency import CurationConsistencyChecker
+
+    checker = CurationConsistencyChecker(
+        current_app._get_current_object(),  # noqa: SLF001
+        batch_size=batch_size,
+        workers=workers,
+    )
+    report = checker.check()
+    _echo_report(report, verbose=verbose)
+
+    if not report.is_consistent:
+        raise SystemExit(1)
+
+
+@curations.command("repair")
+@batch_size_option
+@workers_option
+@verbose_option
+@click.option(
+    "--delete-tombstoned",
+    is_flag=True,
+    help="Delete the requests of deleted records too, i.e. their review history.",
+)
+@click.option("--yes-i-know", is_flag=True, help="Do not ask for confirmation.")
+@with_appcontext
+def repair(
+    batch_size: int,
+    workers: int,
+    *,
+    verbose: bool,
+    delete_tombstoned: bool,
+    yes_i_know: bool,
+) -> None:
+    """Check and repair inconsistencies of curation requests."""
+    from .services.consistency import CurationConsistencyChecker
+
+    checker = CurationConsistencyChecker(
+        current_app._get_current_object(),  # noqa: SLF001
+        batch_size=batch_size,
+        workers=workers,
+    )
+    report = checker.check()
+    _echo_report(report, verbose=verbose)
+
+    if report.is_consistent and not (delete_tombstoned and report.tombstoned):
+        return
+
+    if not yes_i_know:
+        click.confirm("Repair the inconsistencies?", abort=True)
+
+    errors = checker.repair(report, delete_tombstoned=delete_tombstoned)
+    for id_, error in errors.items():
+        click.secho(f"Could not repair request {id_}: {error}", fg="red")
+
+    click.echo("Queued index updates, run `invenio index run` to process them.")
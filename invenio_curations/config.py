@@ -5,33 +5,76 @@
 # Invenio-Curations is free software; you can redistribute it and/or modify it
 # under the terms of the MIT License; see LICENSE file for more details.
 
-"""Invenio module for curations."""
-
-from .notifications.builders import (
-    CurationRequestAcceptNotificationBuilder,
-    CurationRequestCritiqueNotificationBuilder,
-    CurationRequestResubmitNotificationBuilder,
-    CurationRequestReviewNotificationBuilder,
-    CurationRequestSubmitNotificationBuilder,
-)
-from .services import facets
-from .services.diff import DiffDescription
-
-CURATIONS_FACETS = {
-    "type": {
-        "facet": facets.type,
-        "ui": {
-            "field": "type",
+"""Invenio module for curations.
+
+Classes are referenced by import string, or (for values which are imported by the
+instance's configuration) built on first access, so that importing this module
+does not import the services and notification builders.
+"""
+
+from typing import Any
+
+
+def _facets() -> dict[str, dict]:
+    """Invenio requests facets."""
+    from .services import facets
+
+    return {
+        "type": {
+            "facet": facets.type,
+            "ui": {
+                "field": "type",
+            },
         },
-    },
-    "status": {
-        "facet": facets.status,
-        "ui": {
-            "field": "status",
+        "status": {
+            "facet": facets.status,
+            "ui": {
+                "field": "status",
+            },
         },
-    },
+    }
+
+
+def _notifications_builders() -> dict[str, type]:
+    """Curation related notification builders as map for easy import."""
+    from .notifications.builders import (
+        CurationRequestAcceptNotificationBuilder,
+        CurationRequestCritiqueNotificationBuilder,
+        CurationRequestResubmitNotificationBuilder,
+        CurationRequestReviewNotificationBuilder,
+        CurationRequestSubmitNotificationBuilder,
+    )
+
+    return {
+        builder.type: builder
+        for builder in [
+            CurationRequestAcceptNotificationBuilder,
+            CurationRequestCritiqueNotificationBuilder,
+            CurationRequestResubmitNotificationBuilder,
+            CurationRequestReviewNotificationBuilder,
+            CurationRequestSubmitNotificationBuilder,
+        ]
+    }
+
+
+_LAZY_VALUES = {
+    "CURATIONS_FACETS": _facets,
+    "CURATIONS_NOTIFICATIONS_BUILDERS": _notifications_builders,
 }
-"""Invenio requests facets."""
+
+
+def __getattr__(name: str) -> Any:
+    """Build the lazy configuration values on first access."""
+    if name in _LAZY_VALUES:
+        return _LAZY_VALUES[name]()
+
+    msg = f"module {__name__!r} has no attribute {name!r}"
+    raise AttributeError(msg)
+
+
+def __dir__() -> list[str]:
+    """List the lazy configuration values too, for them to be set as defaults."""
+    return sorted([*globals(), *_LAZY_VALUES])
 
 
 CURATIONS_ALLOW_PUBLISHING_EDITS = False
@@ -58,17 +101,108 @@ CURATIONS_SEARCH_REQUESTS = {
 }
 """Curation requests search configuration (i.e list of curations requests)"""
 
-CURATIONS_NOTIFICATIONS_BUILDERS = {
-    builder.type: builder
-    for builder in [
-        CurationRequestAcceptNotificationBuilder,
-        CurationRequestCritiqueNotificationBuilder,
-        CurationRequestResubmitNotificationBuilder,
-        CurationRequestReviewNotificationBuilder,
-        CurationRequestSubmitNotificationBuilder,
-    ]
-}
-"""Curation related notification builders as map for easy import."""
+CURATIONS_STATS_CACHE_TTL = 60
+"""Amount of seconds the curation queue statistics are cached for."""
+
+CURATIONS_STATS_AGE_BUCKETS = ["1d", "7d", "30d"]
+"""Boundaries of the age buckets for open requests in the queue statistics.
+
+Values are date math expressions relative to now, in ascending order.
+"""
+
+CURATIONS_TRANSITION_BUCKETS = [3600, 86400, 604800, 2592000]
+"""Upper bounds (in seconds) of the buckets for the status transition histograms.
+
+The histograms are reported as ``transitions`` in the queue statistics, e.g. the
+time from ``submitted`` to ``review`` or from ``critiqued`` to ``resubmitted``.
+"""
+
+CURATIONS_BULK_ACTION_MAX_ITEMS = 100
+"""Maximum number of curation requests a bulk action can be executed on."""
+
+CURATIONS_BULK_CREATE_CHUNK_SIZE = 500
+"""Number of records handled per task when creating curation requests in bulk."""
+
+CURATIONS_PENDING_QUEUE = "curations-pending"
+"""Name of the message queue holding records waiting for their curation request."""
+
+CURATIONS_PENDING_DELAY = 10
+"""Seconds to wait for more records before creating the queued curation requests.
+
+Records submitted via ``schedule_record_curation`` within this delay are grouped
+and handled in a single task execution.
+"""
+
+CURATIONS_EXPIRE_AFTER = None
+"""Expire open curation requests without activity for this long (a ``timedelta``).
+
+Expiration is performed by the ``expire_stale_curation_requests`` task, which has
+to be added to the ``CELERY_BEAT_SCHEDULE``. Disabled if set to ``None``.
+"""
+
+CURATIONS_EXPIRE_BATCH_SIZE = 100
+"""Number of curation requests expired per unit of work."""
+
+CURATIONS_TITLE_SYNC_DELAY = 0
+"""Seconds to defer the synchronization of request titles with their drafts' titles.
+
+Per default, the title of a curation request is updated in the same transaction as
+its draft. With a delay, all title changes of a draft within that time are written
+to its request with a single update by a background task.
+"""
+
+CURATIONS_METRICS_BACKEND = "invenio_curations.metrics:CurationsMetricsBackend"
+"""Metrics backend for the curations service and component hot paths.
+
+The default backend discards all metrics, and does not count the issued SQL
+statements at all. A custom backend can subclass
+:class:`invenio_curations.metrics.CurationsMetricsBackend` to export the call
+counters, latency histograms and number of issued DB/search queries.
+"""
+
+CURATIONS_NOTIFICATIONS_DIGEST = False
+"""Send the notifications about submitted curation requests to curators as digests.
+
+If enabled, these notifications are buffered per curator and sent as one message
+by the ``send_curation_digests`` task, which has to be scheduled periodically.
+"""
+
+CURATIONS_RECIPIENTS_CACHE_TTL = 300
+"""Seconds to cache the members of a role notified about curation requests.
+
+The cache of a role is invalidated when users are added to or removed from it.
+"""
+
+CURATIONS_RECIPIENTS_CHUNK_SIZE = 500
+"""Number of users looked up per search when resolving the members of a role."""
+
+CURATIONS_NOTIFICATIONS_OUTBOX = False
+"""Write curation notifications to an outbox instead of dispatching them on commit.
+
+The outbox is written in the same transaction as the curation action, and drained
+in batches of ``CURATIONS_OUTBOX_BATCH_SIZE`` by the ``dispatch_curation_outbox``
+task, which is triggered ``CURATIONS_OUTBOX_DELAY`` seconds after the first event.
+"""
+
+CURATIONS_OUTBOX_BATCH_SIZE = 500
+"""Number of outbox events dispatched per batch."""
+
+CURATIONS_OUTBOX_DELAY = 10
+"""Seconds to wait for more events before dispatching the outbox."""
+
+CURATIONS_OUTBOX_MAX_ATTEMPTS = 5
+"""Number of attempts to dispatch an outbox event, before leaving it for inspection."""
+
+CURATIONS_OUTBOX_WEBHOOK_URL = None
+"""URL to post compact payloads of the dispatched outbox events to, per event type.
+
+Example payload::
+
+    {
+        "type": "curation-request.submit",
+        "events": [{"request": "<id>", "status": "submitted", "created": "<date>"}]
+    }
+"""
 
 CURATIONS_ENABLE_REQUEST_COMMENTS = False
 """Enable or disable the generation of diff comments on ``rdm-curation`` requests.
@@ -78,10 +212,11 @@ based on the difference found between draft states of an unpublished record
 that is in the curation phase.
 """
 
-CURATIONS_COMMENTS_CLASSES = [DiffDescription]
+CURATIONS_COMMENTS_CLASSES = ["invenio_curations.services.diff:DiffDescription"]
 """Extend curations comment classes for more diff customization.
 
-List with all custom classes defined for rendering a change in a draft field.
+List with all custom classes (or their import strings) defined for rendering a
+change in a draft field.
 """
 
 CURATIONS_COMMENT_TEMPLATE_FILE = "comment-template.html"
@@ -91,6 +226,42 @@ Choose a file from the instance's templates folder to render the request comment
 More details in README.
 """
 
+CURATIONS_COMMENT_UPDATE_RETRIES = 3
+"""Number of retries when updating a diff comment fails due to a concurrent update.
+
+On each retry, the comment is read again and the diff is recomputed against the
+reference draft stored in it.
+"""
+
+CURATIONS_CLAIM_TTL = 1800
+"""Seconds a curator's claim on a curation request lasts, unless renewed.
+
+Curators claim a request when they start reviewing it (or explicitly via the API),
+so that others do not review the same request. Clients renew the claim periodically
+while the curator is working on the request; abandoned claims expire.
+"""
+
+CURATIONS_ASSIGNMENT_STRATEGY = (
+    "invenio_curations.services.assignment:CurationAssignmentStrategy"
+)
+"""Strategy assigning new curation requests to curators.
+
+Per default, the moderation role receives the curation requests and all curators are
+notified about them. The strategies in :mod:`invenio_curations.services.assignment`
+assign each request to one curator instead, in turn (``RoundRobinAssignment``), to the
+one with the fewest open requests (``LeastLoadedAssignment``) or to the least loaded
+curator of the draft's community (``CommunityAssignment``).
+"""
+
+CURATIONS_WORKLOAD_CACHE_TTL = 60
+"""Seconds to cache the number of open curation requests assigned to each curator."""
+
+CURATIONS_COMMUNITY_CURATORS = {}
+"""Curators responsible for the drafts of a community, for ``CommunityAssignment``.
+
+Maps community IDs to lists of user IDs, e.g. ``{"<community-id>": ["1", "2"]}``.
+"""
+
 CURATIONS_PRIVILEGED_ROLES = ["administration"]
 """Curation privileged roles.
 
@@ -100,3 +271,17 @@ to allow admins to publish records without having to perform the extra steps nec
 for approval.
 Also used for creating rdm-records demo records in testing.
 """
+
+CURATIONS_PRIVILEGED_CACHE_TTL = 300
+"""Seconds to cache if a user has one of the ``CURATIONS_PRIVILEGED_ROLES``.
+
+The cache of a user is invalidated when roles are added to or removed from them.
+"""
+
+CURATIONS_PERMISSIONS_CACHE = True
+"""Evaluate the curation permission conditions once per HTTP request.
+
+Rendering a record or request page checks many permissions, which all evaluate the
+same curation conditions (e.g. if a curation request exists for the record). With
+the cache, each condition is evaluated once per record and request.
+"""
@@ -7,23 +7,32 @@
 
 """Invenio module for generic and customizable curations."""
 
-from flask import Flask, g
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, cast
+
+from flask import Flask, current_app, g
 from flask_menu import current_menu
+from invenio_base.utils import obj_or_import_string
 from invenio_i18n import lazy_gettext as _
-from invenio_requests.proxies import current_requests_service
-from invenio_requests.services import RequestsService
 
 from . import config
+from .metrics import CurationsMetricsBackend, init_query_counting
+from .notifications.members import init_role_members_invalidation
 from .proxies import unproxy
-from .resources import CurationsResource, CurationsResourceConfig
-from .services import (
-    CurationRequestService,
-    CurationsServiceConfig,
-)
-from .views.ui import user_has_curations_management_role
+
+# The services and resources are imported on first use, as they pull in most of
+# the Invenio stack, which slows down short-lived processes (e.g. CLI commands).
+if TYPE_CHECKING:
+    from invenio_requests.services import RequestsService
+
+    from .resources import CurationsResource
+    from .services import CurationRequestService, CurationsServiceConfig
 
 
 def _get_requests_service() -> RequestsService:
+    from invenio_requests.proxies import current_requests_service
+
     return unproxy(current_requests_service)
 
 
@@ -32,6 +41,8 @@ class ServiceConfigs:
 
     def __init__(self, app: Flask) -> None:
         """Constructs."""
+        from .services import CurationsServiceConfig
+
         self._curations: CurationsServiceConfig = CurationsServiceConfig.build(app)
 
     @property
@@ -47,6 +58,8 @@ def finalize_app(app: Flask) -> None:
 
 def init_menu(app: Flask) -> None:  # noqa: ARG001
     """Initialize flask menu."""
+    from .views.ui import user_has_curations_management_role
+
     user_dashboard = current_menu.submenu("dashboard")
     user_dashboard.submenu("curation-overview").register(
         "invenio_curations.curation_requests_overview",
@@ -57,47 +70,80 @@ def init_menu(app: Flask) -> None:  # noqa: ARG001
 
 
 class InvenioCurations:
-    """Invenio-Curations extension."""
+    """Invenio-Curations extension.
+
+    The service and resource are initialized on first access.
+    """
 
     def __init__(self, app: Flask | None = None) -> None:
         """Extension initialization."""
-        self.curations_service: CurationRequestService | None = None
-        self.curations_resource: CurationsResource | None = None
+        self._curations_service: CurationRequestService | None = None
+        self._curations_resource: CurationsResource | None = None
+        self._app: Flask | None = None
+        self.metrics: CurationsMetricsBackend = CurationsMetricsBackend()
         if app:
             self.init_app(app)
 
     def init_app(self, app: Flask) -> None:
         """Flask application initialization."""
         self.init_config(app)
-        self.init_services(app)
-        self.init_resources(app)
+        self.init_metrics(app)
+        init_role_members_invalidation()
+        self._app = app
         app.extensions["invenio-curations"] = self
 
+    @property
+    def curations_service(self) -> CurationRequestService:
+        """The curation service."""
+        if self._curations_service is None:
+            self.init_services(self._app or current_app)
+        return cast("CurationRequestService", self._curations_service)
+
+    @property
+    def curations_resource(self) -> CurationsResource:
+        """The curation resource."""
+        if self._curations_resource is None:
+            self.init_resources(self._app or current_app)
+        return cast("CurationsResource", self._curations_resource)
+
     def init_config(self, app: Flask) -> None:
         """Initialize configuration."""
         for k in dir(config):
-            if k.startswith("CURATIONS_"):
-                app.config.setdefault(k, getattr(config, k))
+            # the lazy values are only built if the instance does not set them
+            if k.startswith("CURATIONS_") and k not in app.config:
+                app.config[k] = getattr(config, k)
         if app.config.get("REQUESTS_REVIEWERS_ENABLED"):
             msg = "Invenio-curations cannot be installed with reviewers feature enabled yet."
             raise Exception(msg)
 
+    def init_metrics(self, app: Flask) -> None:
+        """Initialize the metrics backend."""
+        backend_cls = obj_or_import_string(app.config["CURATIONS_METRICS_BACKEND"])
+        self.metrics = backend_cls()
+        # the default backend discards the query counts, hence they aren't counted
+        if backend_cls is not CurationsMetricsBackend:
+            init_query_counting()
+
     def service_configs(self, app: Flask) -> ServiceConfigs:
         """Customized service configs."""
         return ServiceConfigs(app)
 
     def init_services(self, app: Flask) -> None:
         """Initialize the service and resource for curations."""
+        from .services import CurationRequestService
+
         service_configs = self.service_configs(app)
 
-        self.curations_service = CurationRequestService(
+        self._curations_service = CurationRequestService(
             config=service_configs.curations,
             requests_service=_get_requests_service(),
         )
 
     def init_resources(self, app: Flask) -> None:
         """Init resources."""
-        self.curations_resource = CurationsResource(
+        from .resources import CurationsResource, CurationsResourceConfig
+
+        self._curations_resource = CurationsResource(
             service=self.curations_service,
             config=CurationsResourceConfig.build(app),
         )
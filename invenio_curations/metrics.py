@@ -0,0 +1,140 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (C) 2026 Graz University of Technology.
+#
+# Invenio-Curations is free software; you can redistribute it and/or modify it
+# under the terms of the MIT License; see LICENSE file for more details.
+
+"""Metrics for the curations service and components."""
+
+from collections import defaultdict
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass
+from functools import wraps
+from time import perf_counter
+from typing import Any
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+from .proxies import current_curations
+
+
+class CurationsMetricsBackend:
+    """Metrics backend which discards all metrics.
+
+    Subclass and set ``CURATIONS_METRICS_BACKEND`` to export the metrics, e.g. to a
+    Prometheus client or a StatsD daemon.
+    """
+
+    def increment(self, name: str, value: float = 1, **labels: str) -> None:
+        """Increment the counter ``name`` by ``value``."""
+
+    def observe(self, name: str, value: float, **labels: str) -> None:
+        """Add an observation of ``value`` to the histogram ``name``."""
+
+
+class InMemoryMetricsBackend(CurationsMetricsBackend):
+    """Metrics backend keeping all values in memory, mostly useful for testing."""
+
+    def __init__(self) -> None:
+        """Constructor."""
+        self.counters: dict[tuple, float] = defaultdict(float)
+        self.observations: dict[tuple, list[float]] = defaultdict(list)
+
+    def increment(self, name: str, value: float = 1, **labels: str) -> None:
+        """Increment the counter ``name`` by ``value``."""
+        self.counters[(name, *sorted(labels.items()))] += value
+
+    def observe(self, name: str, value: float, **labels: str) -> None:
+        """Add an observation of ``value`` to the histogram ``name``."""
+        self.observations[(name, *sorted(labels.items()))].append(value)
+
+
+@dataclass
+class QueryCount:
+    """Number of queries issued while counting."""
+
+    db: int = 0
+    search: int = 0
+
+
+_active_counts: ContextVar[tuple[QueryCount, ...]] = ContextVar(
+    "curations_query_counts",
+    default=(),
+)
+
+
+def _count_db_query(*_: Any, **__: Any) -> None:
+    """Count an SQL statement for all active counters."""
+    for count in _active_counts.get():
+        count.db += 1
+
+
+def count_search_query() -> None:
+    """Count a search query for all active counters."""
+    for count in _active_counts.get():
+        count.search += 1
+
+
+def init_query_counting() -> None:
+    """Listen to the SQL statements issued by any engine."""
+    if not event.contains(Engine, "before_cursor_execute", _count_db_query):
+        event.listen(Engine, "before_cursor_execute", _count_db_query)
+
+
+@contextmanager
+def count_queries() -> Iterator[QueryCount]:
+    """Count the DB and search queries issued within the context.
+
+    Counters can be nested, the outer counter includes the queries of the inner one.
+    """
+    count = QueryCount()
+    token = _active_counts.set((*_active_counts.get(), count))
+    try:
+        yield count
+    finally:
+        _active_counts.reset(token)
+
+
+def instrumented[**P, R](operation: str) -> Callable[[Callable[P, R]], Callable[P, R]]:
+    """Record calls, latency and issued queries of the decorated function."""
+
+    def decorator(func: Callable[P, R]) -> Callable[P, R]:
+        @wraps(func)
+        def wrapper(*args: P.args, **kwargs: P.kwargs) -> R:
+            backend: CurationsMetricsBackend = current_curations.metrics
+            status = "error"
+            start = perf_counter()
+            with count_queries() as queries:
+                try:
+                    result = func(*args, **kwargs)
+                    status = "success"
+                    return result
+                finally:
+                    backend.increment(
+                        "curations_operations_total",
+                        operation=operation,
+                        status=status,
+                    )
+                    backend.observe(
+                        "curations_operation_duration_seconds",
+                        perf_counter() - start,
+                        operation=operation,
+                    )
+                    backend.observe(
+                        "curations_operation_db_queries",
+                        queries.db,
+                        operation=operation,
+                    )
+                    backend.observe(
+                        "curations_operation_search_queries",
+                        queries.search,
+                        operation=operation,
+                    )
+
+        return wrapper
+
+    return decorator
@@ -0,0 +1,313 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (C) 2026 Graz University of Technology.
+#
+# Invenio-Curations is free software; you can redistribute it and/or modify it
+# under the terms of the MIT License; see LICENSE file for more details.
+
+"""Database models for curations."""
+
+from datetime import UTC, datetime, timedelta
+from uuid import UUID
+
+from invenio_db import db
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy_utils.types import UUIDType
+
+
+def utcnow() -> datetime:
+    """Naive UTC timestamp, as stored by the other Invenio models."""
+    return datetime.now(UTC).replace(tzinfo=None)
+
+
+class CurationTransition(db.Model):  # type: ignore[name-defined]
+    """Status transition of a curation request.
+
+    Every action on a curation request adds one row, holding the time the request
+    spent in its previous status. This keeps the history compact and allows to
+    compute latencies between statuses with a single query.
+    """
+
+    __tablename__ = "curations_transition"
+
+    id = db.Column(db.Integer, primary_key=True, autoincrement=True)
+
+    request_id = db.Column(UUIDType, nullable=False, index=True)
+    """ID of the curation request."""
+
+    status_from = db.Column(db.String(50), nullable=True)
+    """Status of the request before the transition."""
+
+    status_to = db.Column(db.String(50), nullable=False)
+    """Status of the request after the transition."""
+
+    duration = db.Column(db.Float, nullable=True)
+    """Seconds the request spent in ``status_from``."""
+
+    created = db.Column(db.DateTime, nullable=False, default=utcnow, index=True)
+    """Time of the transition."""
+
+    @classmethod
+    def record(
+        cls,
+        request_id: UUID | str,
+        status_from: str | None,
+        status_to: str,
+        since: datetime | None = None,
+    ) -> "CurationTransition":
+        """Add a transition, computing the time spent since the previous one.
+
+        :param request_id: The ID of the curation request.
+        :param status_from: The status before the transition.
+        :param status_to: The status after the transition.
+        :param since: Fallback start time if there is no previous transition.
+        """
+        now = utcnow()
+        previous = (
+            db.session.query(cls.created)
+            .filter(cls.request_id == request_id)
+            .order_by(cls.created.desc())
+            .limit(1)
+            .scalar()
+        )
+        start = previous or since
+        transition = cls(
+            request_id=request_id,
+            status_from=status_from,
+            status_to=status_to,
+            duration=(now - start).total_seconds() if start else None,
+            created=now,
+        )
+        db.session.add(transition)
+        return transition
+
+
+class CurationTopic(db.Model):  # type: ignore[name-defined]
+    """Topic of a curation request.
+
+    The primary key guarantees a single curation request per topic on the database
+    level, also for concurrent creations and independent of the search index.
+    """
+
+    __tablename__ = "curations_topic"
+
+    topic_type = db.Column(db.String(50), primary_key=True)
+    """Type of the topic reference, e.g. ``record``."""
+
+    topic_id = db.Column(db.String(255), primary_key=True)
+    """ID of the topic, e.g. the PID value of the record."""
+
+    request_id = db.Column(UUIDType, nullable=True, unique=True)
+    """ID of the curation request, set once the request is created."""
+
+    status = db.Column(db.String(50), nullable=True)
+    """Status of the curation request, kept up to date by its actions."""
+
+    accepted_revision_id = db.Column(db.Integer, nullable=True)
+    """Revision of the draft when the curation request was accepted."""
+
+    created = db.Column(db.DateTime, nullable=False, default=utcnow)
+
+    @classmethod
+    def claim(cls, topic_type: str, topic_id: str) -> "CurationTopic | None":
+        """Claim a topic for a new curation request.
+
+        The row is inserted in a savepoint. A concurrent transaction claiming the
+        same topic blocks until this one finishes, and then fails to claim it.
+
+        :returns: The claimed topic, or ``None`` if the topic is claimed already.
+        """
+        topic = cls(topic_type=topic_type, topic_id=str(topic_id))
+        try:
+            with db.session.begin_nested():
+                db.session.add(topic)
+        except IntegrityError:
+            return None
+        return topic
+
+    @classmethod
+    def get_request_ids(cls, topic_type: str, topic_ids: list[str]) -> dict[str, UUID]:
+        """Get the IDs of the curation requests per topic ID, with one query."""
+        if not topic_ids:
+            return {}
+
+        query = db.session.query(cls.topic_id, cls.request_id).filter(
+            cls.topic_type == topic_type,
+            cls.topic_id.in_([str(id_) for id_ in topic_ids]),
+        )
+        return dict(query.all())
+
+    @classmethod
+    def release(cls, request_id: UUID | str) -> None:
+        """Release the topic of a deleted curation request."""
+        db.session.query(cls).filter(cls.request_id == request_id).delete()
+
+    @classmethod
+    def update_status(
+        cls,
+        request_id: UUID | str,
+        status: str,
+        accepted_revision_id: int | None = None,
+    ) -> None:
+        """Keep track of the status of a curation request.
+
+        :param accepted_revision_id: The revision of the draft, if it was accepted.
+        """
+        db.session.query(cls).filter(cls.request_id == request_id).update(
+            {"status": status, "accepted_revision_id": accepted_revision_id},
+        )
+
+    def is_accepted(self, revision_id: int | None) -> bool | None:
+        """Check if a revision of the topic has been accepted.
+
+        :returns: ``None`` if unknown, i.e. the status is missing or the topic was
+            accepted in another revision.
+        """
+        if self.status is None:
+            return None
+        if self.status != "accepted":
+            return False
+        if revision_id is None or self.accepted_revision_id != revision_id:
+            return None
+        return True
+
+
+class CurationDigestEntry(db.Model):  # type: ignore[name-defined]
+    """Curation notification buffered for the next digest of a user."""
+
+    __tablename__ = "curations_digest_entry"
+
+    id = db.Column(db.Integer, primary_key=True, autoincrement=True)
+
+    user_id = db.Column(db.Integer, nullable=False, index=True)
+    """ID of the recipient."""
+
+    notification_type = db.Column(db.String(255), nullable=False)
+    """Type of the buffered notification, e.g. ``curation-request.submit``."""
+
+    request_id = db.Column(UUIDType, nullable=False)
+    """ID of the curation request."""
+
+    title = db.Column(db.Text, nullable=True)
+    """Title of the curation request at the time of the notification."""
+
+    created = db.Column(db.DateTime, nullable=False, default=utcnow)
+
+
+class CurationOutboxEvent(db.Model):  # type: ignore[name-defined]
+    """Curation event waiting to be dispatched.
+
+    The events are written in the same transaction as the action causing them, and
+    dispatched in batches afterwards.
+    """
+
+    __tablename__ = "curations_outbox_event"
+
+    id = db.Column(db.Integer, primary_key=True, autoincrement=True)
+
+    event_type = db.Column(db.String(255), nullable=False)
+    """Type of the event, i.e. of its notification, e.g. ``curation-request.submit``."""
+
+    request_id = db.Column(UUIDType, nullable=True)
+    """ID of the curation request."""
+
+    payload = db.Column(db.JSON, nullable=False)
+    """The dumped notification."""
+
+    attempts = db.Column(db.Integer, nullable=False, default=0)
+    """Number of failed dispatch attempts."""
+
+    created = db.Column(db.DateTime, nullable=False, default=utcnow)
+
+
+class CurationClaim(db.Model):  # type: ignore[name-defined]
+    """Claim of a curator on a curation request, to avoid duplicate reviews.
+
+    A claim is a lease: it expires unless it is renewed, after which other curators
+    can claim the request.
+    """
+
+    __tablename__ = "curations_claim"
+
+    request_id = db.Column(UUIDType, primary_key=True)
+    """ID of the claimed curation request."""
+
+    user_id = db.Column(db.Integer, nullable=False, index=True)
+    """ID of the curator holding the claim."""
+
+    created = db.Column(db.DateTime, nullable=False, default=utcnow)
+
+    expires = db.Column(db.DateTime, nullable=False, index=True)
+    """Time the claim expires, unless renewed."""
+
+    @classmethod
+    def acquire(
+        cls,
+        request_id: UUID | str,
+        user_id: int,
+        ttl: timedelta,
+    ) -> "CurationClaim | None":
+        """Claim a request, or renew the claim if it is held by the user already.
+
+        An expired claim of another user is taken over. Concurrent claims of the
+        same request are serialized by the primary key, only one of them succeeds.
+
+        :returns: The claim, or ``None`` if another user holds the claim.
+        """
+        now = utcnow()
+        claim = cls(
+            request_id=request_id,
+            user_id=user_id,
+            created=now,
+            expires=now + ttl,
+        )
+        try:
+            with db.session.begin_nested():
+                db.session.add(claim)
+        except IntegrityError:
+            pass
+        else:
+            return claim
+
+        updated = (
+            db.session.query(cls)
+            .filter(
+                cls.request_id == request_id,
+                db.or_(cls.user_id == user_id, cls.expires <= now),
+            )
+            .update(
+                {"user_id": user_id, "expires": now + ttl},
+                synchronize_session="fetch",
+            )
+        )
+        return db.session.get(cls, request_id) if updated else None
+
+    @classmethod
+    def renew(cls, request_id: UUID | str, user_id: int, ttl: timedelta) -> bool:
+        """Extend the claim of a user, unless it was taken over after it expired.
+
+        :returns: If the claim was renewed.
+        """
+        updated = (
+            db.session.query(cls)
+            .filter(cls.request_id == request_id, cls.user_id == user_id)
+            .update({"expires": utcnow() + ttl}, synchronize_session="fetch")
+        )
+        return bool(updated)
+
+    @classmethod
+    def release(cls, request_id: UUID | str, user_id: int | None = None) -> None:
+        """Release the claim on a request.
+
+        :param user_id: Only release the claim if it is held by this user.
+        """
+        query = db.session.query(cls).filter(cls.request_id == request_id)
+        if user_id is not None:
+            query = query.filter(cls.user_id == user_id)
+        query.delete(synchronize_session="fetch")
+
+    @classmethod
+    def claimed_request_ids(cls) -> list[UUID]:
+        """Get the IDs of all requests with an unexpired claim, with one query."""
+        query = db.session.query(cls.request_id).filter(cls.expires > utcnow())
+        return [request_id for (request_id,) in query]
@@ -0,0 +1,149 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (C) 2026 Graz University of Technology.
+#
+# Invenio-Curations is free software; you can redistribute it and/or modify it
+# under the terms of the MIT License; see LICENSE file for more details.
+
+"""Notification backends for curations."""
+
+from __future__ import annotations
+
+from collections import defaultdict
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import TYPE_CHECKING, Any, ClassVar
+
+from flask import current_app
+from invenio_access.permissions import system_identity
+from invenio_db import db
+from invenio_notifications.backends.base import NotificationBackend
+from invenio_notifications.backends.email import EmailNotificationBackend
+from invenio_notifications.models import Notification, Recipient
+from invenio_search.engine import dsl
+from invenio_users_resources.proxies import current_users_service
+
+from ..models import CurationDigestEntry
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+
+_caller_commits: ContextVar[bool] = ContextVar(
+    "curations_caller_commits",
+    default=False,
+)
+
+
+@contextmanager
+def caller_transaction() -> Iterator[None]:
+    """Leave committing the notifications sent within the context to the caller.
+
+    Used when notifications are dispatched eagerly within a transaction of the
+    caller, e.g. while the outbox holds the locks of its batch.
+    """
+    token = _caller_commits.set(True)
+    try:
+        yield
+    finally:
+        _caller_commits.reset(token)
+
+
+class CurationDigestBackend(NotificationBackend):
+    """Buffer curation notifications for the next digest of their recipients.
+
+    Instead of sending one message per notification, the notifications are stored
+    and sent as one aggregated message per recipient by :func:`send_digests`.
+    """
+
+    id: ClassVar[str] = "curation-digest"
+
+    def send(self, notification: Notification, recipient: Recipient) -> None:
+        """Store the notification for the recipient's next digest.
+
+        The entry is committed by the caller if it owns the transaction (see
+        :func:`caller_transaction`), otherwise by the backend, as the notification
+        workers do not commit.
+        """
+        request: dict[str, Any] = notification.context["request"]
+        db.session.add(
+            CurationDigestEntry(
+                user_id=int(recipient.data["id"]),
+                notification_type=notification.type,
+                request_id=request["id"],
+                title=request.get("title"),
+            ),
+        )
+        if not _caller_commits.get():
+            db.session.commit()
+
+
+DIGEST_NOTIFICATION_TYPE = "curation-request.digest"
+"""Notification type of the digest, used to look up its template."""
+
+
+def send_digests() -> dict[str, int]:
+    """Send the buffered curation notifications, one message per recipient.
+
+    The pending notifications are fetched with one query and their recipients with
+    one search. Notifications of recipients whose digest could not be sent are kept
+    for the next run. The removal of the other notifications is committed by the
+    caller, i.e. the ``send_curation_digests`` task.
+
+    :returns: The number of sent digests and of recipients that failed.
+    """
+    entries: list[CurationDigestEntry] = CurationDigestEntry.query.order_by(
+        CurationDigestEntry.created,
+    ).all()
+    if not entries:
+        return {"sent": 0, "failed": 0}
+
+    entries_per_user: dict[int, list[CurationDigestEntry]] = defaultdict(list)
+    for entry in entries:
+        entries_per_user[entry.user_id].append(entry)
+
+    users = current_users_service.scan(
+        system_identity,
+        extra_filter=dsl.Q("terms", id=[str(id_) for id_ in entries_per_user]),
+    )
+
+    backend = EmailNotificationBackend()
+    sent, failed = 0, 0
+    for user in users:
+        user_entries = entries_per_user.pop(int(user["id"]), [])
+        notification = Notification(
+            type=DIGEST_NOTIFICATION_TYPE,
+            context={
+                "entries": [
+                    {
+                        "type": entry.notification_type,
+                        "request_id": str(entry.request_id),
+                        "title": entry.title,
+                        "created": entry.created,
+                    }
+                    for entry in user_entries
+                ],
+            },
+        )
+        try:
+            backend.send(notification, Recipient(data=user))
+        except Exception:
+            current_app.logger.exception(
+                "Could not send curation digest to user %s.",
+                user["id"],
+            )
+            failed += 1
+            continue
+
+        CurationDigestEntry.query.filter(
+            CurationDigestEntry.id.in_([entry.id for entry in user_entries]),
+        ).delete(synchronize_session=False)
+        sent += 1
+
+    # the remaining users do not exist (anymore), nobody to send their digest to
+    orphaned_ids = [entry.id for e in entries_per_user.values() for entry in e]
+    if orphaned_ids:
+        CurationDigestEntry.query.filter(
+            CurationDigestEntry.id.in_(orphaned_ids),
+        ).delete(synchronize_session=False)
+
+    return {"sent": sent, "failed": failed}
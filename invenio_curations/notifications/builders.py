@@ -9,7 +9,7 @@
 
 from __future__ import annotations
 
-from typing import ClassVar
+from typing import Any, ClassVar
 
 from flask_principal import Identity
 from invenio_notifications.models import Notification
@@ -19,6 +19,7 @@ from invenio_notifications.services.filters import RecipientFilter
 from invenio_notifications.services.generators import (
     ContextGenerator,
     EntityResolve,
+    RecipientBackendGenerator,
     RecipientGenerator,
     UserEmailBackend,
 )
@@ -27,7 +28,11 @@ from invenio_requests.records.api import Request
 from invenio_users_resources.notifications.filters import UserPreferencesRecipientFilter
 from invenio_users_resources.notifications.generators import UserRecipient
 
-from .generators import GroupMembersRecipient
+from .generators import (
+    CuratorEmailBackend,
+    EntitySnapshotResolve,
+    ReceiverRecipient,
+)
 
 
 class CurationRequestActionNotificationBuilder(NotificationBuilder):
@@ -35,10 +40,11 @@ class CurationRequestActionNotificationBuilder(NotificationBuilder):
 
     type: ClassVar[str] = "curation-request"
 
+    # the request and its topic are passed as snapshots, see `build`
     context: ClassVar[list[ContextGenerator]] = [
-        EntityResolve(key="request"),
+        EntitySnapshotResolve(key="request"),
         EntityResolve(key="request.created_by"),
-        EntityResolve(key="request.topic"),
+        EntitySnapshotResolve(key="request.topic"),
         EntityResolve(key="request.receiver"),
         EntityResolve(key="executing_user"),
     ]
@@ -52,7 +58,7 @@ class CurationRequestActionNotificationBuilder(NotificationBuilder):
         UserRecipientFilter("executing_user"),
     ]
 
-    recipient_backends: ClassVar[list[UserEmailBackend]] = [
+    recipient_backends: ClassVar[list[RecipientBackendGenerator]] = [
         UserEmailBackend(),
     ]
 
@@ -72,10 +78,36 @@ class CurationRequestActionNotificationBuilder(NotificationBuilder):
             type=cls.type,
             context={
                 "executing_user": EntityResolverRegistry.reference_identity(identity),
-                "request": EntityResolverRegistry.reference_entity(request),
+                "request": cls.request_snapshot(request),
             },
         )
 
+    @classmethod
+    def request_snapshot(cls, request: Request) -> dict[str, Any]:
+        """Serialize the fields of the request and its topic used by the templates.
+
+        The snapshot is taken from the objects the action has in memory, so that
+        the notification workers do not have to resolve them again. The creator and
+        receiver are kept as references, as their resolution provides the data for
+        the recipients. The actions build their notifications after executing, so
+        that the snapshot holds the status the request transitioned to.
+        """
+        topic = request.topic.resolve()
+        return {
+            "id": str(request.id),
+            "number": request.get("number"),
+            "title": request.get("title"),
+            "status": request.status,
+            "type": request.type.type_id,
+            "created_by": request.created_by.reference_dict,
+            "receiver": request.receiver.reference_dict,
+            "receiver_type": next(iter(request.receiver.reference_dict)),
+            "topic": {
+                "id": topic["id"],
+                "metadata": {"title": topic.get("metadata", {}).get("title")},
+            },
+        }
+
 
 class CurationRequestSubmitNotificationBuilder(
     CurationRequestActionNotificationBuilder,
@@ -84,7 +116,10 @@ class CurationRequestSubmitNotificationBuilder(
 
     type: ClassVar[str] = f"{CurationRequestActionNotificationBuilder.type}.submit"
     recipients: ClassVar[list[RecipientGenerator]] = [
-        GroupMembersRecipient("request.receiver"),
+        ReceiverRecipient("request.receiver", "request.receiver_type"),
+    ]
+    recipient_backends: ClassVar[list[RecipientBackendGenerator]] = [
+        CuratorEmailBackend(),
     ]
 
 
@@ -95,7 +130,10 @@ class CurationRequestResubmitNotificationBuilder(
 
     type: ClassVar[str] = f"{CurationRequestActionNotificationBuilder.type}.resubmit"
     recipients: ClassVar[list[RecipientGenerator]] = [
-        GroupMembersRecipient("request.receiver"),
+        ReceiverRecipient("request.receiver", "request.receiver_type"),
+    ]
+    recipient_backends: ClassVar[list[RecipientBackendGenerator]] = [
+        CuratorEmailBackend(),
     ]
 
 
@@ -9,15 +9,36 @@
 
 from __future__ import annotations
 
-from typing import Any
+from typing import Any, cast
 
-from invenio_access.permissions import system_identity
-from invenio_accounts.models import Role
+from flask import current_app
+from invenio_notifications.backends.email import EmailNotificationBackend
 from invenio_notifications.models import Notification, Recipient
-from invenio_notifications.services.generators import RecipientGenerator
+from invenio_notifications.services.generators import (
+    EntityResolve,
+    RecipientBackendGenerator,
+    RecipientGenerator,
+)
 from invenio_records.dictutils import dict_lookup
-from invenio_search.engine import dsl
-from invenio_users_resources.proxies import current_users_service
+
+from .backends import CurationDigestBackend
+from .members import get_role_members
+
+
+class EntitySnapshotResolve(EntityResolve):
+    """Resolve an entity, unless the context holds a snapshot of it already.
+
+    Entity references (e.g. ``{"record": "abcd-1234"}``) never hold an ``id``,
+    whereas snapshots serialized when building the notification always do.
+    """
+
+    def __call__(self, notification: Notification) -> Notification:
+        """Update the required entity information, if not resolved yet."""
+        entity = dict_lookup(notification.context, self.key)
+        if "id" in entity:
+            return notification
+
+        return cast(Notification, super().__call__(notification))
 
 
 class GroupMembersRecipient(RecipientGenerator):
@@ -49,17 +70,77 @@ class GroupMembersRecipient(RecipientGenerator):
         """
         group: dict[str, Any] = dict_lookup(notification.context, self.key)
 
-        # Group service does not contain information about users.
-        role: Role = Role.query.filter(Role.id == group["id"]).one()
+        for user in get_role_members(group["id"]):
+            recipients[user["id"]] = Recipient(data=user)
+
+        return recipients
+
 
-        user_ids: list[str] = [str(u.id) for u in role.users]
+class ReceiverRecipient(GroupMembersRecipient):
+    """Receiver recipient generator, for a user or the members of a group/role.
 
-        if not user_ids:
-            return recipients
+    Curation requests are received by the moderation role, unless a curator is
+    assigned to them (see ``CURATIONS_ASSIGNMENT_STRATEGY``).
+    """
 
-        filter_: dsl.Q = dsl.Q("terms", **{"id": user_ids})
-        users = current_users_service.scan(system_identity, extra_filter=filter_)
-        for u in users:
-            recipients[u["id"]] = Recipient(data=u)
+    def __init__(self, key: str, type_key: str) -> None:
+        """Initialize the generator with a key.
+
+        Args:
+            key: The context key to look up the receiver information
+            type_key: The context key to look up the type of the receiver
+
+        """
+        super().__init__(key)
+        self.type_key = type_key
 
+    def __call__(
+        self,
+        notification: Notification,
+        recipients: dict[str, Recipient],
+    ) -> dict[str, Recipient]:
+        """Fetch the receiving user or the group members as recipients.
+
+        Args:
+            notification: The notification object containing context
+            recipients: Dictionary of existing recipients keyed by user ID
+
+        Returns:
+            Updated recipients dictionary with the receiver(s) added
+
+        """
+        # notifications built before users could receive requests lack the type
+        try:
+            receiver_type = dict_lookup(notification.context, self.type_key)
+        except KeyError:
+            receiver_type = "group"
+
+        if receiver_type != "user":
+            return super().__call__(notification, recipients)
+
+        user: dict[str, Any] = dict_lookup(notification.context, self.key)
+        recipients[user["id"]] = Recipient(data=user)
         return recipients
+
+
+class CuratorEmailBackend(RecipientBackendGenerator):
+    """Email backend for curators, buffering for digests if configured.
+
+    With ``CURATIONS_NOTIFICATIONS_DIGEST`` enabled, the notifications are stored by
+    the :class:`CurationDigestBackend` and sent as periodic digests.
+    """
+
+    def __call__(
+        self,
+        notification: Notification,  # noqa: ARG002
+        recipient: Recipient,  # noqa: ARG002
+        backends: list[str],
+    ) -> str:
+        """Add the backend ID to the backends of the recipient."""
+        backend_id = (
+            CurationDigestBackend.id
+            if current_app.config["CURATIONS_NOTIFICATIONS_DIGEST"]
+            else EmailNotificationBackend.id
+        )
+        backends.append(backend_id)
+        return backend_id
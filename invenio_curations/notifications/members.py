@@ -0,0 +1,120 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (C) 2026 Graz University of Technology.
+#
+# Invenio-Curations is free software; you can redistribute it and/or modify it
+# under the terms of the MIT License; see LICENSE file for more details.
+
+"""Cached role memberships for curations.
+
+Caches the members of the roles notified about curation requests, as well as
+which users have a privileged role. Only lightweight modules are imported on
+module level, as the cache invalidation is set up when the extension is
+initialized.
+"""
+
+from __future__ import annotations
+
+from itertools import batched
+from typing import Any
+
+from flask import current_app
+from invenio_accounts.models import Role, User, userrole
+from invenio_cache import current_cache
+from invenio_db import db
+from sqlalchemy import event
+
+_ROLE_MEMBERS_KEY = "invenio-curations:role-members:{role_id}"
+_PRIVILEGED_KEY = "invenio-curations:privileged:{user_id}"
+
+
+def get_role_members(role_id: str | int) -> list[dict]:
+    """Get the (serialized) users of a role.
+
+    The user IDs are resolved with one SQL query and the users are looked up in
+    chunks of ``CURATIONS_RECIPIENTS_CHUNK_SIZE``. The result is cached for
+    ``CURATIONS_RECIPIENTS_CACHE_TTL`` seconds, or until the role's members change.
+    """
+    key = _ROLE_MEMBERS_KEY.format(role_id=role_id)
+    members: list[dict] | None = current_cache.get(key)
+    if members is not None:
+        return members
+
+    # imported on first use, see the module's docstring
+    from invenio_access.permissions import system_identity
+    from invenio_search.engine import dsl
+    from invenio_users_resources.proxies import current_users_service
+
+    # Group service does not contain information about users.
+    user_ids = db.session.query(userrole.c.user_id).filter(
+        userrole.c.role_id == role_id,
+    )
+
+    members = []
+    chunk_size = current_app.config["CURATIONS_RECIPIENTS_CHUNK_SIZE"]
+    for chunk in batched((str(id_) for (id_,) in user_ids), chunk_size):
+        filter_: dsl.Q = dsl.Q("terms", **{"id": list(chunk)})
+        members.extend(
+            current_users_service.scan(system_identity, extra_filter=filter_),
+        )
+
+    current_cache.set(
+        key,
+        members,
+        timeout=current_app.config["CURATIONS_RECIPIENTS_CACHE_TTL"],
+    )
+    return members
+
+
+def is_user_privileged(user_id: int | str, privileged_roles: list[str]) -> bool:
+    """Check if a user has one of the privileged roles.
+
+    The result is cached for ``CURATIONS_PRIVILEGED_CACHE_TTL`` seconds, or until
+    the user's roles change.
+    """
+    key = _PRIVILEGED_KEY.format(user_id=user_id)
+    privileged: bool | None = current_cache.get(key)
+    if privileged is not None:
+        return privileged
+
+    user = db.session.get(User, user_id)
+    privileged = bool(user) and any(role in privileged_roles for role in user.roles)
+    current_cache.set(
+        key,
+        privileged,
+        timeout=current_app.config["CURATIONS_PRIVILEGED_CACHE_TTL"],
+    )
+    return privileged
+
+
+def _invalidate_role_members(role: Role) -> None:
+    """Invalidate the cached members of a role."""
+    if role.id is not None:
+        current_cache.delete(_ROLE_MEMBERS_KEY.format(role_id=role.id))
+
+
+def _invalidate_privileged(user: User) -> None:
+    """Invalidate the cached privileged decision of a user."""
+    if user.id is not None:
+        current_cache.delete(_PRIVILEGED_KEY.format(user_id=user.id))
+
+
+def _on_user_roles_change(user: User, role: Role, *_: Any) -> None:
+    _invalidate_role_members(role)
+    _invalidate_privileged(user)
+
+
+def _on_role_users_change(role: Role, user: User, *_: Any) -> None:
+    _invalidate_role_members(role)
+    _invalidate_privileged(user)
+
+
+def init_role_members_invalidation() -> None:
+    """Invalidate the cached role memberships when users are added or removed."""
+    for attribute, listener in [
+        (User.roles, _on_user_roles_change),
+        (Role.users, _on_role_users_change),
+    ]:
+        for identifier in ["append", "remove"]:
+            if not event.contains(attribute, identifier, listener):
+                event.listen(attribute, identifier, listener)
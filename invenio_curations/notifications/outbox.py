@@ -0,0 +1,174 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (C) 2026 Graz University of Technology.
+#
+# Invenio-Curations is free software; you can redistribute it and/or modify it
+# under the terms of the MIT License; see LICENSE file for more details.
+
+"""Transactional outbox for curation notifications."""
+
+from __future__ import annotations
+
+import json
+from collections import defaultdict
+from typing import Any
+from urllib.request import Request as HTTPRequest
+from urllib.request import urlopen
+
+from flask import current_app
+from invenio_db import db
+from invenio_notifications.models import Notification
+from invenio_notifications.proxies import current_notifications_manager
+from invenio_notifications.services.uow import NotificationOp
+from invenio_records_resources.services.uow import Operation, UnitOfWork
+
+from ..models import CurationOutboxEvent
+from .backends import caller_transaction
+
+WEBHOOK_TIMEOUT = 10
+"""Seconds to wait for the webhook endpoint to respond."""
+
+
+class OutboxNotificationOp(Operation):
+    """Write a notification to the outbox, in the transaction of the unit of work."""
+
+    def __init__(self, notification: Notification) -> None:
+        """Constructor."""
+        self._notification = notification
+
+    def on_register(self, uow: UnitOfWork) -> None:  # noqa: ARG002
+        """Add the outbox event, to be committed with the action causing it."""
+        request = self._notification.context.get("request", {})
+        db.session.add(
+            CurationOutboxEvent(
+                event_type=self._notification.type,
+                request_id=request.get("id"),
+                payload=self._notification.dumps(),
+            ),
+        )
+
+    def on_post_commit(self, uow: UnitOfWork) -> None:  # noqa: ARG002
+        """Schedule the dispatching of the outbox."""
+        # avoid circular import, the tasks module depends on the services
+        from ..tasks import schedule_outbox_dispatch
+
+        schedule_outbox_dispatch()
+
+
+def notification_op(notification: Notification) -> Operation:
+    """Get the operation sending a notification, via the outbox if configured."""
+    if current_app.config["CURATIONS_NOTIFICATIONS_OUTBOX"]:
+        return OutboxNotificationOp(notification)
+    return NotificationOp(notification)
+
+
+def _event_status(event_type: str) -> str | None:
+    """Get the status of the request after the action of the event type."""
+    # avoid circular import, the request type depends on the outbox
+    from ..requests.curation import CurationRequest
+
+    action_name = event_type.rsplit(".", 1)[-1]
+    action_cls = CurationRequest.available_actions.get(action_name)
+    return getattr(action_cls, "status_to", None)
+
+
+def _webhook_event(event: CurationOutboxEvent) -> dict[str, Any]:
+    """Get the compact payload of an event for the webhook."""
+    return {
+        "request": str(event.request_id),
+        "status": _event_status(event.event_type),
+        "created": event.created.isoformat(),
+    }
+
+
+def _post_webhook(url: str, event_type: str, events: list[dict[str, Any]]) -> None:
+    """Post the compact payloads of the events of one type to the webhook."""
+    body = {"type": event_type, "events": events}
+    http_request = HTTPRequest(  # noqa: S310
+        url,
+        data=json.dumps(body).encode(),
+        headers={"Content-Type": "application/json"},
+        method="POST",
+    )
+    with urlopen(http_request, timeout=WEBHOOK_TIMEOUT):  # noqa: S310
+        pass
+
+
+def _notify_webhook(url: str, events_per_type: dict[str, list[dict[str, Any]]]) -> None:
+    """Post the dispatched events to the webhook, one request per event type."""
+    for event_type, events in events_per_type.items():
+        try:
+            _post_webhook(url, event_type, events)
+        except OSError:
+            current_app.logger.exception(
+                "Could not post curation events to webhook %s.",
+                url,
+            )
+
+
+def dispatch_outbox(batch_size: int) -> int:
+    """Dispatch a batch of outbox events.
+
+    Repeated events of the same type for the same request are sent only once. The
+    batch is locked, so that concurrent dispatchers pick different events, and is
+    committed before the dispatched events are posted to the webhook. Events
+    failing ``CURATIONS_OUTBOX_MAX_ATTEMPTS`` times are kept, but not retried.
+
+    :returns: The number of events taken from the outbox.
+    """
+    max_attempts = current_app.config["CURATIONS_OUTBOX_MAX_ATTEMPTS"]
+    events: list[CurationOutboxEvent] = (
+        CurationOutboxEvent.query.filter(CurationOutboxEvent.attempts < max_attempts)
+        .order_by(CurationOutboxEvent.id)
+        .limit(batch_size)
+        .with_for_update(skip_locked=True)
+        .all()
+    )
+    if not events:
+        return 0
+
+    # keep the latest of repeated events, e.g. a request resubmitted several times
+    latest: dict[tuple[str, Any], CurationOutboxEvent] = {}
+    for event in events:
+        latest[(event.event_type, event.request_id)] = event
+
+    dispatched: list[CurationOutboxEvent] = []
+    for event in latest.values():
+        try:
+            # the locks of the batch are released by the commit below only
+            with caller_transaction():
+                current_notifications_manager.broadcast(
+                    Notification(**event.payload),
+                    eager=True,
+                )
+        except Exception:
+            current_app.logger.exception(
+                "Could not dispatch curation outbox event %s.",
+                event.id,
+            )
+            event.attempts += 1
+            if event.attempts >= max_attempts:
+                current_app.logger.error(
+                    "Giving up on curation outbox event %s after %s attempts.",
+                    event.id,
+                    event.attempts,
+                )
+            continue
+        dispatched.append(event)
+
+    webhook_events: dict[str, list[dict[str, Any]]] = defaultdict(list)
+    for event in dispatched:
+        webhook_events[event.event_type].append(_webhook_event(event))
+
+    failed = {event.id for event in latest.values()} - {e.id for e in dispatched}
+    for event in events:
+        if event.id not in failed:
+            db.session.delete(event)
+    # release the locks before calling the webhook, which might be slow
+    db.session.commit()
+
+    url = current_app.config["CURATIONS_OUTBOX_WEBHOOK_URL"]
+    if url and webhook_events:
+        _notify_webhook(url, webhook_events)
+
+    return len(events)
@@ -9,16 +9,23 @@
 
 from __future__ import annotations
 
+from datetime import timedelta
 from typing import Final
 
+from flask import current_app
 from flask_principal import Identity
+from invenio_access.permissions import system_user_id
 from invenio_i18n import lazy_gettext as _
-from invenio_notifications.services.uow import NotificationOp
+from invenio_pidstore.errors import PIDDoesNotExistError
+from invenio_rdm_records.records.api import RDMDraft
 from invenio_records_resources.services import EndpointLink
 from invenio_records_resources.services.uow import UnitOfWork
 from invenio_requests.customizations import RequestState, RequestType, actions
 from invenio_requests.customizations.actions import RequestAction
+from invenio_requests.records.api import Request
+from sqlalchemy.orm.exc import NoResultFound
 
+from invenio_curations.models import CurationClaim, CurationTopic, CurationTransition
 from invenio_curations.notifications.builders import (
     CurationRequestAcceptNotificationBuilder,
     CurationRequestCritiqueNotificationBuilder,
@@ -26,15 +33,75 @@ from invenio_curations.notifications.builders import (
     CurationRequestReviewNotificationBuilder,
     CurationRequestSubmitNotificationBuilder,
 )
+from invenio_curations.notifications.outbox import notification_op
 
+CLAIMABLE_STATUSES: Final[list[str]] = ["submitted", "resubmitted", "review"]
+"""Statuses of curation requests which curators can claim for their review."""
 
-class CurationCreateAndSubmitAction(actions.CreateAndSubmitAction):
+
+class CurationTransitionMixin:
+    """Record the status transition of the request when executing an action.
+
+    The new status is also stored with the topic of the request, and the claim on
+    the request is released once it is not in review anymore.
+    """
+
+    request: Request
+
+    def execute(self, identity: Identity, uow: UnitOfWork) -> None:
+        """Execute the action and keep track of the status transition."""
+        status_from = self.request.status
+        super().execute(identity, uow)  # type: ignore[misc]
+        CurationTransition.record(
+            self.request.id,
+            status_from,
+            self.request.status,
+            since=self.request.created,
+        )
+        # the accepted revision lets publishing check the acceptance without a search
+        accepted_revision_id = None
+        if self.request.status == "accepted":
+            accepted_revision_id = self._accepted_revision_id()
+        CurationTopic.update_status(
+            self.request.id,
+            self.request.status,
+            accepted_revision_id=accepted_revision_id,
+        )
+        if self.request.status not in CLAIMABLE_STATUSES:
+            CurationClaim.release(self.request.id)
+
+        # avoid circular import, the services depend on the request type
+        from ..services.utils import clear_request_cache
+
+        # the cached permission conditions may depend on the status
+        clear_request_cache()
+
+    def _accepted_revision_id(self) -> int | None:
+        """Get the revision of the accepted draft.
+
+        For edits of a published record, the topic resolves to the published record
+        instead of the draft under review, hence the draft is resolved explicitly.
+        """
+        record_id = self.request.topic.reference_dict.get("record")
+        if record_id is None:
+            return None
+        try:
+            return RDMDraft.pid.resolve(record_id, registered_only=False).revision_id
+        except (PIDDoesNotExistError, NoResultFound):
+            return None
+
+
+class CurationCreateAndSubmitAction(
+    CurationTransitionMixin,
+    actions.CreateAndSubmitAction,
+):
     """Create and submit a request."""
 
     def execute(self, identity: Identity, uow: UnitOfWork) -> None:
         """Execute the create & submit action."""
+        super().execute(identity, uow)
         uow.register(
-            NotificationOp(
+            notification_op(
                 CurationRequestSubmitNotificationBuilder.build(
                     identity=identity,
                     request=self.request,
@@ -42,10 +109,8 @@ class CurationCreateAndSubmitAction(actions.CreateAndSubmitAction):
             ),
         )
 
-        super().execute(identity, uow)
-
 
-class CurationSubmitAction(actions.SubmitAction):
+class CurationSubmitAction(CurationTransitionMixin, actions.SubmitAction):
     """Submit action for user access requests."""
 
     # list of statuses this action can be performed from
@@ -53,18 +118,18 @@ class CurationSubmitAction(actions.SubmitAction):
 
     def execute(self, identity: Identity, uow: UnitOfWork) -> None:
         """Execute the submit action."""
+        super().execute(identity, uow)
         uow.register(
-            NotificationOp(
+            notification_op(
                 CurationRequestSubmitNotificationBuilder.build(
                     identity=identity,
                     request=self.request,
                 ),
             ),
         )
-        super().execute(identity, uow)
 
 
-class CurationAcceptAction(actions.AcceptAction):
+class CurationAcceptAction(CurationTransitionMixin, actions.AcceptAction):
     """Accept a request."""
 
     # Require to go through review before accepting.
@@ -72,8 +137,9 @@ class CurationAcceptAction(actions.AcceptAction):
 
     def execute(self, identity: Identity, uow: UnitOfWork) -> None:
         """Execute the accept action."""
+        super().execute(identity, uow)
         uow.register(
-            NotificationOp(
+            notification_op(
                 CurationRequestAcceptNotificationBuilder.build(
                     identity=identity,
                     request=self.request,
@@ -81,17 +147,15 @@ class CurationAcceptAction(actions.AcceptAction):
             ),
         )
 
-        super().execute(identity, uow)
-
 
-class CurationDeclineAction(actions.DeclineAction):
+class CurationDeclineAction(CurationTransitionMixin, actions.DeclineAction):
     """Decline a request."""
 
     # Instead of declining, the record should be critiqued.
     status_from: Final[list[str]] = []
 
 
-class CurationCancelAction(actions.CancelAction):
+class CurationCancelAction(CurationTransitionMixin, actions.CancelAction):
     """Cancel a request."""
 
     # A user might want to cancel their request.
@@ -110,13 +174,13 @@ class CurationCancelAction(actions.CancelAction):
     ]
 
 
-class CurationExpireAction(actions.ExpireAction):
+class CurationExpireAction(CurationTransitionMixin, actions.ExpireAction):
     """Expire a request."""
 
     status_from: Final[list[str]] = ["submitted", "critiqued", "resubmitted"]
 
 
-class CurationDeleteAction(actions.DeleteAction):
+class CurationDeleteAction(CurationTransitionMixin, actions.DeleteAction):
     """Delete a request."""
 
     # When a user deletes their draft, the request will get deleted. Should be possible from every state.
@@ -136,16 +200,30 @@ class CurationDeleteAction(actions.DeleteAction):
     ]
 
 
-class CurationReviewAction(actions.RequestAction):
+class CurationReviewAction(CurationTransitionMixin, actions.RequestAction):
     """Mark request as review."""
 
     status_from: Final[list[str]] = ["submitted", "resubmitted"]
     status_to: Final[str] = "review"
 
     def execute(self, identity: Identity, uow: UnitOfWork) -> None:
-        """Execute the review action."""
+        """Execute the review action, claiming the request for the reviewing curator."""
+        if identity.id not in (None, system_user_id):
+            claim = CurationClaim.acquire(
+                self.request.id,
+                identity.id,
+                timedelta(seconds=current_app.config["CURATIONS_CLAIM_TTL"]),
+            )
+            if claim is None:
+                # avoid circular import, the services depend on the request type
+                from ..services.errors import CurationRequestClaimedError
+
+                action = "review"
+                raise CurationRequestClaimedError(action)
+
+        super().execute(identity, uow)
         uow.register(
-            NotificationOp(
+            notification_op(
                 CurationRequestReviewNotificationBuilder.build(
                     identity=identity,
                     request=self.request,
@@ -153,10 +231,8 @@ class CurationReviewAction(actions.RequestAction):
             ),
         )
 
-        super().execute(identity, uow)
-
 
-class CurationCritiqueAction(actions.RequestAction):
+class CurationCritiqueAction(CurationTransitionMixin, actions.RequestAction):
     """Request changes for request."""
 
     status_from: Final[list[str]] = ["review"]
@@ -164,8 +240,9 @@ class CurationCritiqueAction(actions.RequestAction):
 
     def execute(self, identity: Identity, uow: UnitOfWork) -> None:
         """Execute the critique action."""
+        super().execute(identity, uow)
         uow.register(
-            NotificationOp(
+            notification_op(
                 CurationRequestCritiqueNotificationBuilder.build(
                     identity=identity,
                     request=self.request,
@@ -173,10 +250,8 @@ class CurationCritiqueAction(actions.RequestAction):
             ),
         )
 
-        super().execute(identity, uow)
-
 
-class CurationResubmitAction(actions.RequestAction):
+class CurationResubmitAction(CurationTransitionMixin, actions.RequestAction):
     """Mark request as ready for review."""
 
     status_from: Final[list[str]] = [
@@ -189,18 +264,18 @@ class CurationResubmitAction(actions.RequestAction):
 
     def execute(self, identity: Identity, uow: UnitOfWork) -> None:
         """Execute the resubmit action."""
+        super().execute(identity, uow)
         uow.register(
-            NotificationOp(
+            notification_op(
                 CurationRequestResubmitNotificationBuilder.build(
                     identity=identity,
                     request=self.request,
                 ),
             ),
         )
-        super().execute(identity, uow)
 
 
-class CurationPendingResubmissionAction(actions.RequestAction):
+class CurationPendingResubmissionAction(CurationTransitionMixin, actions.RequestAction):
     """Mark request in a pending state, waiting to be resubmitted."""
 
     status_from: Final[list[str]] = [
@@ -264,7 +339,7 @@ class CurationRequest(RequestType):
     creator_can_be_none: Final[bool] = False
     topic_can_be_none: Final[bool] = False
     allowed_creator_ref_types: Final[list[str]] = ["user", "community"]
-    allowed_receiver_ref_types: Final[list[str]] = ["group"]
+    allowed_receiver_ref_types: Final[list[str]] = ["group", "user"]
     allowed_topic_ref_types: Final[list[str]] = ["record"]
 
     links_item: Final = {
@@ -19,12 +19,17 @@ from flask_resources import (
     create_error_handler,
 )
 from invenio_records_resources.resources import RecordResourceConfig
+from invenio_records_resources.resources.errors import ErrorHandlersMixin
 from invenio_records_resources.resources.records.headers import etag_headers
 from invenio_records_resources.services.base.config import ConfiguratorMixin, FromConfig
+from invenio_requests.errors import CannotExecuteActionError
 from invenio_requests.resources.requests.config import RequestSearchRequestArgsSchema
 
 from ..services.errors import (
+    CurationClaimNotHeldError,
+    CurationRequestClaimedError,
     CurationRequestNotAcceptedError,
+    NoUnclaimedCurationRequestError,
     OpenRecordCurationRequestAlreadyExistsError,
     RoleNotFoundError,
 )
@@ -36,8 +41,11 @@ from ..services.errors import (
 class CurationsSearchRequestArgsSchema(RequestSearchRequestArgsSchema):
     """Add parameter to parse tags."""
 
+    unclaimed = ma.fields.Bool()
+
 
 request_error_handlers = {
+    **ErrorHandlersMixin.error_handlers,
     OpenRecordCurationRequestAlreadyExistsError: create_error_handler(
         lambda e: HTTPJSONException(
             code=400,
@@ -62,6 +70,30 @@ request_error_handlers = {
             description=str(e),
         ),
     ),
+    CannotExecuteActionError: create_error_handler(
+        lambda e: HTTPJSONException(
+            code=400,
+            description=str(e),
+        ),
+    ),
+    CurationRequestClaimedError: create_error_handler(
+        lambda e: HTTPJSONException(
+            code=409,
+            description=str(e.description),
+        ),
+    ),
+    CurationClaimNotHeldError: create_error_handler(
+        lambda e: HTTPJSONException(
+            code=409,
+            description=str(e.description),
+        ),
+    ),
+    NoUnclaimedCurationRequestError: create_error_handler(
+        lambda e: HTTPJSONException(
+            code=404,
+            description=str(e.description),
+        ),
+    ),
 }
 
 
@@ -77,9 +109,15 @@ class CurationsResourceConfig(RecordResourceConfig, ConfiguratorMixin):
     routes: Final = {
         "list": "/",
         "data": "/data",
+        "stats": "/stats",
+        "bulk_action": "/actions/<action>",
+        "claim": "/<request_id>/claim",
+        "claim_next": "/claim-next",
     }
 
     request_view_args: Final = {
+        "action": ma.fields.Str(),
+        "request_id": ma.fields.Str(),
         "reference_type": ma.fields.Str(),
         "reference_id": ma.fields.Str(),
     }
@@ -76,6 +76,12 @@ class CurationsResource(RecordResource):
             route("GET", p(routes["list"]), self.search),
             route("POST", p(routes["list"]), self.create),
             route("GET", p(routes["data"]), self.get_curations_data),
+            route("GET", p(routes["stats"]), self.get_stats),
+            route("POST", p(routes["bulk_action"]), self.bulk_execute_action),
+            route("POST", p(routes["claim"]), self.claim),
+            route("PUT", p(routes["claim"]), self.heartbeat),
+            route("DELETE", p(routes["claim"]), self.release),
+            route("POST", p(routes["claim_next"]), self.claim_next),
         ]
 
     @request_extra_args
@@ -110,3 +116,55 @@ class CurationsResource(RecordResource):
     def get_curations_data(self) -> tuple[dict[str, Any], int]:
         """Create an item."""
         return self.service.get_curations_data(g.identity), 200
+
+    @response_handler()
+    def get_stats(self) -> tuple[dict[str, Any], int]:
+        """Get the curation queue statistics."""
+        return self.service.get_stats(g.identity), 200
+
+    @request_view_args
+    @request_data
+    @response_handler()
+    def bulk_execute_action(self) -> tuple[dict[str, Any], int]:
+        """Execute an action on many curation requests at once."""
+        result = self.service.bulk_execute_action(
+            g.identity,
+            resource_requestctx.view_args["action"],
+            resource_requestctx.data or {},
+        )
+        return result, 200
+
+    @request_view_args
+    @response_handler()
+    def claim(self) -> tuple[dict[str, Any], int]:
+        """Claim a curation request for reviewing it."""
+        claim = self.service.claim(
+            g.identity,
+            resource_requestctx.view_args["request_id"],
+        )
+        return claim, 200
+
+    @request_view_args
+    @response_handler()
+    def heartbeat(self) -> tuple[dict[str, Any], int]:
+        """Renew the claim on a curation request."""
+        claim = self.service.heartbeat(
+            g.identity,
+            resource_requestctx.view_args["request_id"],
+        )
+        return claim, 200
+
+    @request_view_args
+    @response_handler()
+    def release(self) -> tuple[str, int]:
+        """Release the claim on a curation request."""
+        self.service.release(
+            g.identity,
+            resource_requestctx.view_args["request_id"],
+        )
+        return "", 204
+
+    @response_handler()
+    def claim_next(self) -> tuple[dict[str, Any], int]:
+        """Claim the oldest unclaimed curation request waiting for a review."""
+        return self.service.claim_next(g.identity), 200
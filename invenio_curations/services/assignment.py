@@ -0,0 +1,119 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (C) 2026 Graz University of Technology.
+#
+# Invenio-Curations is free software; you can redistribute it and/or modify it
+# under the terms of the MIT License; see LICENSE file for more details.
+
+"""Strategies assigning new curation requests to curators.
+
+The strategy is configured with ``CURATIONS_ASSIGNMENT_STRATEGY``. A curator
+assigned by the strategy becomes the receiver of the curation request (instead of
+the moderation role), and is the only one notified about it.
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from flask import current_app
+from invenio_cache import current_cache
+
+from ..notifications.members import get_role_members
+from ..proxies import current_curations_service
+
+if TYPE_CHECKING:
+    from invenio_accounts.models import Role
+    from invenio_rdm_records.records.api import RDMDraft
+
+_ROUND_ROBIN_KEY = "invenio-curations:assignment:round-robin:{role_id}"
+
+
+class CurationAssignmentStrategy:
+    """Strategy assigning curation requests to curators.
+
+    Per default, no curator is assigned and the moderation role receives the
+    curation requests.
+    """
+
+    def assign(self, topic: RDMDraft, role: Role) -> str | None:  # noqa: ARG002
+        """Get the ID of the curator to assign the curation request of the topic to.
+
+        ``None`` keeps the moderation role as the receiver.
+        """
+        return None
+
+    def curators(self, topic: RDMDraft, role: Role) -> list[str]:  # noqa: ARG002
+        """Get the IDs of the curators eligible for the topic, in a stable order."""
+        return sorted((member["id"] for member in get_role_members(role.id)), key=int)
+
+
+class RoundRobinAssignment(CurationAssignmentStrategy):
+    """Assign the curators of the moderation role in turn.
+
+    The position in the rotation is a counter in the cache, shared by all processes.
+    It is incremented atomically (e.g. with Redis), so that concurrent submissions
+    are assigned to different curators.
+    """
+
+    def assign(self, topic: RDMDraft, role: Role) -> str | None:
+        """Get the next curator in the rotation."""
+        curators = self.curators(topic, role)
+        if not curators:
+            return None
+
+        # the counter starts at 1, `inc` returns None if the cache is not writable
+        position: int = current_cache.inc(_ROUND_ROBIN_KEY.format(role_id=role.id)) or 1
+        return curators[(position - 1) % len(curators)]
+
+
+class LeastLoadedAssignment(CurationAssignmentStrategy):
+    """Assign the curator with the fewest open curation requests.
+
+    The open requests per curator are looked up in the cached workload index, see
+    :meth:`~invenio_curations.services.CurationRequestService.get_workload`.
+    """
+
+    def assign(self, topic: RDMDraft, role: Role) -> str | None:
+        """Get the least loaded curator, the first one in case of a tie."""
+        curators = self.curators(topic, role)
+        if not curators:
+            return None
+
+        workload = current_curations_service.get_workload(curators)
+        return min(curators, key=workload.__getitem__)
+
+
+class CommunityAssignment(LeastLoadedAssignment):
+    """Assign the least loaded curator responsible for the draft's community.
+
+    The curators of a community are configured in ``CURATIONS_COMMUNITY_CURATORS``,
+    drafts of other communities (or without any) are assigned to the least loaded
+    curator of the moderation role.
+    """
+
+    def curators(self, topic: RDMDraft, role: Role) -> list[str]:
+        """Get the curators of the first configured community of the draft."""
+        members = super().curators(topic, role)
+        community_curators = current_app.config["CURATIONS_COMMUNITY_CURATORS"]
+
+        for community_id in self._community_ids(topic):
+            configured = {str(id_) for id_ in community_curators.get(community_id, [])}
+            curators = [id_ for id_ in members if id_ in configured]
+            if curators:
+                return curators
+
+        return members
+
+    @staticmethod
+    def _community_ids(topic: RDMDraft) -> list[str]:
+        """Get the community the draft is submitted to, followed by its communities."""
+        community_ids = []
+        review = topic.parent.review
+        if review is not None:
+            receiver = review.receiver.reference_dict
+            if "community" in receiver:
+                community_ids.append(receiver["community"])
+
+        community_ids.extend(topic.parent.communities.ids)
+        return community_ids
@@ -14,8 +14,11 @@ from typing import Any, Final, cast
 import dictdiffer
 from flask import current_app
 from invenio_i18n import lazy_gettext as _
+from invenio_records_resources.services.errors import RevisionIdMismatchError
 from invenio_requests.proxies import current_events_service
 
+from ..metrics import CurationsMetricsBackend, instrumented
+from ..proxies import current_curations
 from .diff import DIFF_TYPE, DiffProcessorBase
 from .events import CurationCommentEventType
 
@@ -122,11 +125,18 @@ class CommentProcessor:
 
         :param new_data: The updated comment.
         :param crt_comment_event: The existing comment.
+
+        :raises RevisionIdMismatchError: If the comment was updated concurrently.
         """
         if crt_comment_event is None:
             raise CurationCommentError
 
-        payload = {"payload": {"content": new_data}}
+        payload = {
+            "payload": {
+                **crt_comment_event.get("payload", {}),
+                "content": new_data,
+            },
+        }
 
         try:
             current_events_service.update(
@@ -135,6 +145,8 @@ class CommentProcessor:
                 payload,
                 revision_id=crt_comment_event.get("revision_id"),
             )
+        except RevisionIdMismatchError:
+            raise
         except Exception as e:  # noqa: BLE001
             # TODO: revise the exception handling for comment feature
             current_app.logger.warning(e, exc_info=True)
@@ -193,11 +205,45 @@ class CommentProcessor:
     ) -> None:
         """Compute diff between 2 draft states and update the comment with the result.
 
+        If the comment was updated concurrently (e.g. by an autosave of the draft),
+        it is read again and the diff is recomputed against the reference draft
+        stored in it, up to ``CURATIONS_COMMENT_UPDATE_RETRIES`` times.
+
         :param event: The comment event to update.
         :param new_data: Latest state of the record.
         :param msg: Flag to differentiate between request states.
         :param errors: Add to errors list to display a message if something bad happens.
         """
+        metrics: CurationsMetricsBackend = current_curations.metrics
+        retries = current_app.config["CURATIONS_COMMENT_UPDATE_RETRIES"]
+
+        for attempt in range(retries + 1):
+            try:
+                self._update_event_with_diff(event, new_data, msg)
+            except RevisionIdMismatchError:
+                metrics.increment("curations_comment_update_conflicts_total")
+                if attempt == retries:
+                    metrics.increment("curations_comment_update_failures_total")
+                    current_app.logger.warning(
+                        "Could not update curation comment %s after %s retries.",
+                        event.get("id"),
+                        retries,
+                    )
+                    return
+                event = current_events_service.read(
+                    self._identity,
+                    event["id"],
+                ).to_dict()
+            else:
+                return
+
+    def _update_event_with_diff(self, event: dict, new_data: dict, msg: str) -> None:
+        """Update the comment with the diff against its reference draft.
+
+        :param event: The comment event to update.
+        :param new_data: Latest state of the record.
+        :param msg: Flag to differentiate between request states.
+        """
         payload = event.get("payload")
         if payload is None:
             msg = "Got empty payload from event"
@@ -248,6 +294,7 @@ class CommentProcessor:
             str(current_draft) if reference_draft else None,
         )
 
+    @instrumented("comment.process_comment")
     def process_comment(
         self,
         request: dict,
@@ -10,9 +10,12 @@
 """Component for checking curations."""
 
 from abc import ABC
+from contextvars import ContextVar
+from copy import deepcopy
 from typing import Any, cast
 
 import dictdiffer
+from flask import current_app
 from flask_principal import Identity
 from invenio_access.permissions import system_identity
 from invenio_drafts_resources.services.records.components import ServiceComponent
@@ -23,12 +26,20 @@ from invenio_requests.services import RequestsService
 from invenio_search import RecordsSearchV2
 from werkzeug.datastructures import ImmutableMultiDict
 
+from ..metrics import instrumented
+from ..models import CurationTopic
 from ..proxies import current_curations_service
 from . import CurationRequestService
 from .comment import CommentProcessor
 from .diff import DiffProcessor
 from .errors import CurationRequestNotAcceptedError
-from .utils import is_identity_privileged
+from .utils import clear_request_cache, is_identity_privileged
+
+_draft_snapshots: ContextVar[dict[str, dict] | None] = ContextVar(
+    "curations_draft_snapshots",
+    default=None,
+)
+"""Stored data of the drafts being updated, see ``CurationSnapshotComponent``."""
 
 
 def _get_curations_service() -> CurationRequestService:
@@ -51,9 +62,34 @@ def _skip_curations_flow(privileged_roles: list[str], identity: Identity) -> boo
     return is_identity_privileged(privileged_roles, identity)
 
 
+class CurationSnapshotComponent(ServiceComponent, ABC):
+    """Service component keeping the state of a draft before its update.
+
+    Components may change the nested structures of a draft in place, which are
+    shared with its stored data until the unit of work commits the draft. Hence the
+    component has to be registered before all others, for the ``CurationComponent``
+    to compare the draft with its actual previous state.
+    """
+
+    def update_draft(
+        self,
+        identity: Identity,  # noqa: ARG002
+        data: dict | None = None,  # noqa: ARG002
+        record: RDMDraft | None = None,
+        errors: list[dict] | None = None,  # noqa: ARG002
+    ) -> None:
+        """Take a snapshot of the stored data of the draft."""
+        snapshots = _draft_snapshots.get()
+        if snapshots is None:
+            snapshots = {}
+            _draft_snapshots.set(snapshots)
+        snapshots[record["id"]] = deepcopy(record.model.json)  # type: ignore[index, union-attr]
+
+
 class CurationComponent(ServiceComponent, ABC):
     """Service component for access integration."""
 
+    @instrumented("component.publish")
     def publish(
         self,
         identity: Identity,
@@ -71,6 +107,13 @@ class CurationComponent(ServiceComponent, ABC):
             msg = "Unexpected publish action with undefined draft."
             raise RuntimeError(msg)
 
+        # the prefetched or stored acceptance is cheaper than the checks below
+        review_accepted = _get_curations_service().prefetched_acceptance(draft)
+        if review_accepted is None:
+            review_accepted = _get_curations_service().accepted_marker(draft)
+        if review_accepted:
+            return
+
         if _skip_curations_flow(_get_curations_service().privileged_roles, identity):
             # configured roles can publish without curation workflow
             return
@@ -81,14 +124,15 @@ class CurationComponent(ServiceComponent, ABC):
         if has_been_published and _get_curations_service().allow_publishing_edits:
             return
 
-        review_accepted = _get_curations_service().accepted_record(
-            system_identity,
-            draft,
-        )
+        if review_accepted is None:
+            review_accepted = bool(
+                _get_curations_service().accepted_record(system_identity, draft),
+            )
 
         if not review_accepted:
             raise CurationRequestNotAcceptedError
 
+    @instrumented("component.delete_draft")
     def delete_draft(
         self,
         identity: Identity,  # noqa: ARG002
@@ -98,11 +142,7 @@ class CurationComponent(ServiceComponent, ABC):
         force: bool = False,  # noqa: ARG002
     ) -> None:
         """Delete a draft."""
-        request = _get_curations_service().get_review(
-            system_identity,
-            draft,
-            expand=True,
-        )
+        request = _get_curations_service().get_review_summary(draft)
 
         # No open request. Nothing to do.
         if request is None:
@@ -111,6 +151,8 @@ class CurationComponent(ServiceComponent, ABC):
         # New record or new version -> request can be removed.
         if record is None:
             _get_requests_service().delete(system_identity, request["id"], uow=self.uow)
+            CurationTopic.release(request["id"])
+            clear_request_cache()
             return
 
         # Delete draft for a published record.
@@ -131,23 +173,33 @@ class CurationComponent(ServiceComponent, ABC):
         errors: list[dict] | None = None,  # noqa: ARG002
     ) -> None:
         """Update request title if record title has changed."""
-        updated_draft_title = (data or {}).get("metadata", {}).get("title")
-        current_draft_title = (record or {}).get("metadata", {}).get("title")
-
-        if current_draft_title != updated_draft_title:
-            title = updated_draft_title or record["id"]  # type: ignore[index]
-            patch_request = {
-                "title": f"RDM Curation: {title}",
-            }
-
-            # Using system identity, to not have to update the default request can_update permission.
-            # Data will be checked in the requests service.
-            _get_requests_service().update(
-                system_identity,
-                request["id"],
-                patch_request,
-                uow=self.uow,
-            )
+        updated_draft = {
+            "id": record["id"],  # type: ignore[index]
+            "metadata": (data or {}).get("metadata", {}),
+        }
+        curations_service = _get_curations_service()
+        if not curations_service.needs_title_update(request, updated_draft):
+            return
+
+        if current_app.config["CURATIONS_TITLE_SYNC_DELAY"]:
+            # avoid circular import, the tasks module depends on the services
+            from ..tasks import schedule_request_title_sync
+
+            schedule_request_title_sync(request["id"], record["id"])  # type: ignore[index]
+            return
+
+        curations_service.update_title(request, updated_draft, uow=self.uow)
+
+    def _snapshot_draft(self, record: RDMDraft, snapshot: dict | None) -> RDMDraft:
+        """Get the state of the draft before the update.
+
+        The stored data stays in the draft's model until the unit of work commits
+        the draft, building the snapshot from it saves resolving and loading the
+        draft again. Preferably, the data was copied by the
+        ``CurationSnapshotComponent`` before any component changed it in place.
+        """
+        data = snapshot if snapshot is not None else deepcopy(record.model.json)
+        return cast(RDMDraft, self.service.draft_cls(data, model=record.model))
 
     def _prepare_data(
         self,
@@ -190,6 +242,7 @@ class CurationComponent(ServiceComponent, ABC):
             errors,
         )
 
+    @instrumented("component.update_draft")
     def update_draft(
         self,
         identity: Identity,
@@ -198,6 +251,10 @@ class CurationComponent(ServiceComponent, ABC):
         errors: list[dict] | None = None,
     ) -> None:
         """Update draft handler."""
+        # the snapshot is taken on every update, it is dropped even if not needed
+        snapshots = _draft_snapshots.get() or {}
+        snapshot = snapshots.pop(record["id"], None)  # type: ignore[index]
+
         has_published_record = record is not None and record.is_published
         if has_published_record and _get_curations_service().allow_publishing_edits:
             return
@@ -205,19 +262,12 @@ class CurationComponent(ServiceComponent, ABC):
         if _skip_curations_flow(_get_curations_service().privileged_roles, identity):
             return
 
-        request = _get_curations_service().get_review(
-            system_identity,
-            record,
-            expand=True,
-        )
+        request = _get_curations_service().get_review_summary(record)
 
         if not request:
             return
 
-        current_draft: RDMDraft = self.service.draft_cls.pid.resolve(
-            record["id"],  # type: ignore[index]
-            registered_only=False,
-        )
+        current_draft = self._snapshot_draft(record, snapshot)  # type: ignore[arg-type]
 
         self._check_update_request(
             identity,
@@ -0,0 +1,307 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (C) 2026 Graz University of Technology.
+#
+# Invenio-Curations is free software; you can redistribute it and/or modify it
+# under the terms of the MIT License; see LICENSE file for more details.
+
+"""Consistency checks for curation requests."""
+
+from collections import defaultdict, deque
+from collections.abc import Callable, Iterable, Iterator
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass, field
+from itertools import batched
+from typing import Any
+
+from flask import Flask
+from invenio_access.permissions import system_identity
+from invenio_db import db
+from invenio_db.uow import UnitOfWork
+from invenio_pidstore.models import PersistentIdentifier, PIDStatus
+from invenio_requests.customizations import RequestState
+from invenio_requests.proxies import current_requests_service
+from invenio_requests.records.models import RequestMetadata
+from invenio_search.engine import dsl
+
+from ..models import CurationTopic
+from ..requests import CurationRequest
+
+
+@dataclass
+class ConsistencyReport:
+    """Inconsistencies found between curation requests, their topics and the index."""
+
+    checked: int = 0
+    orphaned: list[str] = field(default_factory=list)
+    """Requests whose topic does not exist anymore."""
+
+    tombstoned: list[str] = field(default_factory=list)
+    """Requests whose record was deleted, these hold the record's review history."""
+
+    duplicates: dict[str, list[str]] = field(default_factory=dict)
+    """Open requests per topic with more than one of them, oldest first."""
+
+    missing_in_index: list[str] = field(default_factory=list)
+    outdated_in_index: list[str] = field(default_factory=list)
+    missing_in_db: list[str] = field(default_factory=list)
+    """Requests still present in the index after their deletion."""
+
+    untracked: dict[str, tuple[str, str]] = field(default_factory=dict)
+    """Topics per request without an entry in the topics table."""
+
+    @property
+    def is_consistent(self) -> bool:
+        """Check if no inconsistencies were found.
+
+        The requests of deleted records are not considered inconsistent.
+        """
+        return not (
+            self.orphaned
+            or self.duplicates
+            or self.missing_in_index
+            or self.outdated_in_index
+            or self.missing_in_db
+            or self.untracked
+        )
+
+
+@dataclass
+class _BatchResult:
+    """Result of checking a single batch of requests."""
+
+    orphaned: list[str] = field(default_factory=list)
+    tombstoned: list[str] = field(default_factory=list)
+    missing_in_index: list[str] = field(default_factory=list)
+    outdated_in_index: list[str] = field(default_factory=list)
+    missing_in_db: list[str] = field(default_factory=list)
+    untracked: dict[str, tuple[str, str]] = field(default_factory=dict)
+
+
+class CurationConsistencyChecker:
+    """Check and repair the consistency of curation requests.
+
+    The requests are streamed from the database in batches. Each batch is checked
+    by one of several worker threads, resolving the topics of all its requests with
+    one query and comparing the revisions against the index with one search. At most
+    twice as many batches as workers are read ahead of the checks.
+    """
+
+    def __init__(self, app: Flask, batch_size: int = 500, workers: int = 4) -> None:
+        """Constructor."""
+        self.app = app
+        self.batch_size = batch_size
+        self.workers = workers
+
+    @property
+    def _open_statuses(self) -> set[str]:
+        return {
+            status
+            for status, state in CurationRequest.available_statuses.items()
+            if state == RequestState.OPEN
+        }
+
+    def _search(self, extra_filter: dsl.Q) -> Any:
+        return current_requests_service.create_search(
+            system_identity,
+            current_requests_service.record_cls,
+            current_requests_service.config.search,
+            extra_filter=extra_filter,
+        )
+
+    def _stream_db(self) -> Iterator[tuple[str, int, dict, str]]:
+        """Stream ID, version ID, topic and status of all curation requests."""
+        query = (
+            db.session.query(
+                RequestMetadata.id,
+                RequestMetadata.version_id,
+                RequestMetadata.json["topic"],
+                RequestMetadata.json["status"].as_string(),
+            )
+            .filter(
+                RequestMetadata.json["type"].as_string() == CurationRequest.type_id,
+            )
+            .order_by(RequestMetadata.created)
+            .execution_options(yield_per=self.batch_size)
+        )
+        for id_, version_id, topic, status in query:
+            yield str(id_), version_id, topic or {}, status
+
+    def _stream_index(self) -> Iterator[str]:
+        """Stream the IDs of all curation requests in the index."""
+        search = self._search(dsl.Q("term", type=CurationRequest.type_id))
+        for hit in search.source(["id"]).scan():
+            yield hit.meta.id
+
+    def _check_db_batch(self, batch: list[tuple[str, int, dict, str]]) -> _BatchResult:
+        """Check the topics and index state of a batch of requests."""
+        result = _BatchResult()
+
+        record_ids = {topic["record"] for _, _, topic, _ in batch if "record" in topic}
+        record_statuses = dict(
+            db.session.query(
+                PersistentIdentifier.pid_value,
+                PersistentIdentifier.status,
+            ).filter(
+                PersistentIdentifier.pid_type == "recid",
+                PersistentIdentifier.pid_value.in_(record_ids),
+            ),
+        )
+
+        ids = [id_ for id_, _, _, _ in batch]
+        tracked_ids = {
+            str(id_)
+            for (id_,) in db.session.query(CurationTopic.request_id).filter(
+                CurationTopic.request_id.in_(ids),
+            )
+        }
+
+        search = self._search(dsl.Q("ids", values=ids))
+        search = search.source(["id"]).params(version=True)[: len(ids)]
+        indexed_revisions = {hit.meta.id: hit.meta.version for hit in search.execute()}
+
+        for id_, version_id, topic, _ in batch:
+            record_status = record_statuses.get(topic.get("record"))
+            if record_status is None:
+                result.orphaned.append(id_)
+            elif record_status == PIDStatus.DELETED:
+                result.tombstoned.append(id_)
+            elif id_ not in tracked_ids:
+                topic_type, topic_id = next(iter(topic.items()))
+                result.untracked[id_] = (topic_type, str(topic_id))
+
+            if id_ not in indexed_revisions:
+                result.missing_in_index.append(id_)
+            # the index holds the revision ID, which is the version ID minus one
+            elif indexed_revisions[id_] < version_id - 1:
+                result.outdated_in_index.append(id_)
+
+        return result
+
+    def _check_index_batch(self, ids: list[str]) -> _BatchResult:
+        """Check that the indexed requests of a batch still exist."""
+        existing = {
+            str(id_)
+            for (id_,) in db.session.query(RequestMetadata.id).filter(
+                RequestMetadata.id.in_(ids),
+            )
+        }
+        return _BatchResult(missing_in_db=[id_ for id_ in ids if id_ not in existing])
+
+    def _in_app_context[**P, R](self, func: Callable[P, R]) -> Callable[P, R]:
+        """Run the function in its own application context (i.e. DB session)."""
+
+        def wrapper(*args: P.args, **kwargs: P.kwargs) -> R:
+            with self.app.app_context():
+                return func(*args, **kwargs)
+
+        return wrapper
+
+    def _map_bounded[T, R](
+        self,
+        executor: ThreadPoolExecutor,
+        func: Callable[[T], R],
+        batches: Iterable[T],
+    ) -> Iterator[R]:
+        """Map the batches in the executor, reading them only as workers free up."""
+        pending: deque[Future[R]] = deque()
+        for batch in batches:
+            if len(pending) >= self.workers * 2:
+                yield pending.popleft().result()
+            pending.append(executor.submit(func, batch))
+
+        while pending:
+            yield pending.popleft().result()
+
+    def check(self) -> ConsistencyReport:
+        """Check all curation requests."""
+        report = ConsistencyReport()
+        open_requests_per_topic: dict[str, list[str]] = defaultdict(list)
+        results = []
+
+        def db_batches() -> Iterator[list[tuple[str, int, dict, str]]]:
+            for batch in batched(self._stream_db(), self.batch_size):
+                for id_, _, topic, status in batch:
+                    report.checked += 1
+                    if status in self._open_statuses and "record" in topic:
+                        open_requests_per_topic[topic["record"]].append(id_)
+                yield list(batch)
+
+        with ThreadPoolExecutor(max_workers=self.workers) as executor:
+            results.extend(
+                self._map_bounded(
+                    executor,
+                    self._in_app_context(self._check_db_batch),
+                    db_batches(),
+                ),
+            )
+            results.extend(
+                self._map_bounded(
+                    executor,
+                    self._in_app_context(self._check_index_batch),
+                    (list(b) for b in batched(self._stream_index(), self.batch_size)),
+                ),
+            )
+
+        for result in results:
+            report.orphaned.extend(result.orphaned)
+            report.tombstoned.extend(result.tombstoned)
+            report.missing_in_index.extend(result.missing_in_index)
+            report.outdated_in_index.extend(result.outdated_in_index)
+            report.missing_in_db.extend(result.missing_in_db)
+            report.untracked.update(result.untracked)
+
+        report.duplicates = {
+            topic: ids for topic, ids in open_requests_per_topic.items() if len(ids) > 1
+        }
+        return report
+
+    def repair(
+        self,
+        report: ConsistencyReport,
+        *,
+        delete_tombstoned: bool = False,
+    ) -> dict[str, str]:
+        """Repair the inconsistencies of a report.
+
+        Orphaned requests and all but the oldest of duplicate open requests are
+        deleted, untracked topics are added to the topics table and outdated index
+        entries are queued for (re-)indexing or deletion.
+
+        :param delete_tombstoned: Delete the requests of deleted records as well,
+            i.e. the review history of these records.
+        :returns: The errors per request ID which could not be repaired.
+        """
+        errors = {}
+        duplicates = [id_ for ids in report.duplicates.values() for id_ in ids[1:]]
+        tombstoned = report.tombstoned if delete_tombstoned else []
+        to_delete = dict.fromkeys([*report.orphaned, *tombstoned, *duplicates])
+        for id_ in to_delete:
+            try:
+                with UnitOfWork(db.session) as uow:
+                    current_requests_service.delete(system_identity, id_, uow=uow)
+                    CurationTopic.release(id_)
+                    uow.commit()
+            except Exception as e:  # noqa: BLE001
+                errors[id_] = str(e)
+
+        for id_, (topic_type, topic_id) in report.untracked.items():
+            if id_ in to_delete:
+                continue
+            curation_topic = CurationTopic.claim(topic_type, topic_id)
+            if curation_topic is None:
+                errors[id_] = f"Topic {topic_type}:{topic_id} is claimed already."
+                continue
+            curation_topic.request_id = id_
+        db.session.commit()
+
+        indexer = current_requests_service.indexer
+        to_index = [
+            id_
+            for id_ in [*report.missing_in_index, *report.outdated_in_index]
+            if id_ not in to_delete
+        ]
+        indexer.bulk_index(to_index)
+        indexer.bulk_delete(report.missing_in_db)
+
+        return errors
@@ -8,6 +8,7 @@
 """Record curation service errors."""
 
 from invenio_i18n import lazy_gettext as _
+from invenio_requests.errors import CannotExecuteActionError
 
 
 class OpenRecordCurationRequestAlreadyExistsError(Exception):
@@ -30,3 +31,29 @@ class RoleNotFoundError(Exception):
         super().__init__(
             _("A role with name '%(name)s' does not exist.", name=role_name),
         )
+
+
+class CurationRequestClaimedError(CannotExecuteActionError):
+    """The curation request is claimed by another curator.
+
+    As the action cannot be executed, bulk actions report it for the request
+    instead of failing.
+    """
+
+    description = _("The curation request is claimed by another curator.")
+
+    def __init__(self, action: str) -> None:
+        """Initialise error."""
+        super().__init__(action, reason=self.description)
+
+
+class CurationClaimNotHeldError(Exception):
+    """The curator does not hold a claim on the curation request."""
+
+    description = _("You do not hold a claim on this curation request.")
+
+
+class NoUnclaimedCurationRequestError(Exception):
+    """There is no unclaimed curation request to review."""
+
+    description = _("There is no unclaimed curation request to review.")
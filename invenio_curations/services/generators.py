@@ -8,11 +8,12 @@
 
 """Curations related generators."""
 
-from collections.abc import Callable
+from collections.abc import Callable, Hashable
+from functools import partial
 from itertools import chain
 from typing import Any, cast
 
-from flask_principal import Need, RoleNeed
+from flask_principal import Identity, Need, RoleNeed
 from invenio_access.permissions import Permission, system_identity
 from invenio_pidstore.errors import PIDDoesNotExistError
 from invenio_rdm_records.records.api import RDMDraft
@@ -20,9 +21,12 @@ from invenio_rdm_records.requests.entity_resolvers import RDMRecordProxy
 from invenio_records_permissions.generators import ConditionalGenerator, Generator
 from invenio_requests.customizations.request_types import RequestType
 from invenio_requests.records.api import Request
+from invenio_search.engine import dsl
 
 from ..proxies import current_curations_service, unproxy
+from ..requests import CurationRequest
 from .service import CurationRequestService
+from .utils import request_cached
 
 
 class IfRequestTypes(ConditionalGenerator):
@@ -48,7 +52,57 @@ class IfRequestTypes(ConditionalGenerator):
         return False
 
 
-class CurationRequestsConditionalGenerator(ConditionalGenerator):
+class CachedConditionalGenerator(ConditionalGenerator):
+    """Conditional generator evaluating its condition once per request.
+
+    A page with many permission checks evaluates the same conditions for the same
+    record over and over. The condition is cached per subject (see
+    :meth:`_cache_key`), the needs and excludes per generator, identity and subject.
+    Subclasses implement :meth:`_evaluate` instead of ``_condition``.
+    """
+
+    def _cache_key(self, **__: Any) -> Hashable | None:
+        """Key of the condition's subject, ``None`` to not cache the evaluation."""
+        return None
+
+    def _evaluate(self, **__: Any) -> bool:
+        """To be overridden by children classes."""
+        raise NotImplementedError
+
+    def _condition(self, **kwargs: Any) -> bool:
+        """Evaluate the condition, once per subject and request."""
+        return request_cached(
+            f"condition:{type(self).__name__}",
+            self._cache_key(**kwargs),
+            partial(self._evaluate, **kwargs),
+        )
+
+    def _generator_key(self, kwargs: dict[str, Any]) -> Hashable | None:
+        """Key of the needs and excludes of this generator."""
+        key = self._cache_key(**kwargs)
+        if key is None:
+            return None
+        identity = kwargs.get("identity")
+        return (id(self), getattr(identity, "id", None), key)
+
+    def needs(self, **kwargs: Any) -> set[Need]:
+        """Set of needs granting permission, once per subject and request."""
+        return request_cached(
+            "needs",
+            self._generator_key(kwargs),
+            partial(super().needs, **kwargs),
+        )
+
+    def excludes(self, **kwargs: Any) -> set[Need]:
+        """Set of needs denying permission, once per subject and request."""
+        return request_cached(
+            "excludes",
+            self._generator_key(kwargs),
+            partial(super().excludes, **kwargs),
+        )
+
+
+class CurationRequestsConditionalGenerator(CachedConditionalGenerator):
     """Base class for request-based curation condition generators."""
 
     _curations_service: CurationRequestService = unproxy(current_curations_service)
@@ -66,15 +120,17 @@ class CurationRequestsConditionalGenerator(ConditionalGenerator):
         self.record_access_func = record_access_func
         super().__init__(then_ or [], else_ or [])
 
-    def _condition(self, **__: Any) -> bool:
-        """To be overridden by children classes."""
-        raise NotImplementedError
+    def _cache_key(self, request: Request | None = None, **__: Any) -> Hashable | None:
+        """The request and the function getting its record."""
+        if request is None or request.id is None:
+            return None
+        return (str(request.id), self.record_access_func)
 
 
 class IfCurationRequestAccepted(CurationRequestsConditionalGenerator):
     """Request-oriented generator checking if a curation request has been accepted."""
 
-    def _condition(self, request: Request | None = None, **__: Any) -> bool:
+    def _evaluate(self, request: Request | None = None, **__: Any) -> bool:
         """Check if the curation request for the record has been accepted."""
         if request is None:
             return False
@@ -90,7 +146,7 @@ class IfCurationRequestAccepted(CurationRequestsConditionalGenerator):
 class IfCurationRequestBasedExists(CurationRequestsConditionalGenerator):
     """Request-oriented generator checking if a curation request exists."""
 
-    def _condition(self, request: Request | None = None, **__: Any) -> bool:
+    def _evaluate(self, request: Request | None = None, **__: Any) -> bool:
         """Check if a curation request exists when other request type is submitted."""
         if request is None:
             return False
@@ -129,6 +185,11 @@ class EntityReferenceServicePermission(Generator):
         """Get the specified entity of the request."""
         return getattr(request, self.entity_field)  # type: ignore[arg-type]
 
+    def _resolve_entity(self, request: Request, entity: RDMRecordProxy) -> RDMDraft:
+        """Resolve the entity, once per request."""
+        key = (self.entity_field, str(request.id)) if request.id else None
+        return request_cached("entities", key, entity.resolve)
+
     def needs(self, request: Request | None = None, **kwargs: Any) -> set[Need]:
         """Set of needs granting permission."""
         if request is None:
@@ -137,7 +198,7 @@ class EntityReferenceServicePermission(Generator):
         entity = self._get_entity(request)
         permission = self._get_permission(entity)
         try:
-            record = entity.resolve()
+            record = self._resolve_entity(request, entity)
         except PIDDoesNotExistError:
             # Could not resolve topic. This may happen when trying to serialize a request and checking its permissions.
             # The referenced entity could be deleted, which would result in not being able to serialize instead. Instead,
@@ -157,7 +218,7 @@ class EntityReferenceServicePermission(Generator):
         entity = self._get_entity(request)
         permission = self._get_permission(entity)
         try:
-            record = entity.resolve()
+            record = self._resolve_entity(request, entity)
         except PIDDoesNotExistError:
             # Could not resolve topic. This may happen when trying to serialize a request and checking its permissions.
             # The referenced entity could be deleted, which would result in not being able to serialize instead. Instead,
@@ -186,12 +247,39 @@ class CurationModerators(Generator):
         return [RoleNeed(self._curations_service.moderation_role_name)]
 
 
-class IfCurationRecordBasedExists(ConditionalGenerator):
+class CurationRequestModerators(CurationModerators):
+    """Allow the `moderation` role to access all curation requests.
+
+    Curation requests assigned to a curator are received by the curator instead of
+    the moderation role, the other curators can still find and review them.
+    """
+
+    def query_filter(
+        self,
+        identity: Identity | None = None,
+        **__: Any,
+    ) -> dsl.Q | list:
+        """Match the curation requests for the moderation role."""
+        if identity is None or not any(
+            need in identity.provides for need in self.needs()
+        ):
+            return []
+
+        return dsl.Q("term", **{"type": CurationRequest.type_id})
+
+
+class IfCurationRecordBasedExists(CachedConditionalGenerator):
     """Record-oriented generator checking if a curation request exists."""
 
     _curations_service: CurationRequestService = unproxy(current_curations_service)
 
-    def _condition(self, record: RDMDraft | None = None, **__: Any) -> bool:
+    def _cache_key(self, record: RDMDraft | None = None, **__: Any) -> Hashable | None:
+        """The ID of the record, drafts and their records share the curation request."""
+        if record is None:
+            return None
+        return record.get("id")
+
+    def _evaluate(self, record: RDMDraft | None = None, **__: Any) -> bool:
         """Check if the record has a curation request or not."""
         if record is None:
             return False
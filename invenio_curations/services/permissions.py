@@ -23,6 +23,7 @@ from invenio_requests.services.generators import Creator, Receiver
 from ..requests.curation import CurationRequest
 from .generators import (
     CurationModerators,
+    CurationRequestModerators,
     IfCurationRecordBasedExists,
     IfCurationRequestAccepted,
     IfCurationRequestBasedExists,
@@ -34,17 +35,24 @@ from .generators import (
 class CurationRDMRecordPermissionPolicy(RDMRecordPermissionPolicy):
     """RDM record policy for curations."""
 
+    # one instance shared by all actions, so that its evaluation for a record is
+    # cached and reused by all permission checks of a request
+    curation_moderators = IfCurationRecordBasedExists(
+        then_=[CurationModerators()],
+        else_=[],
+    )
+
     can_preview = RDMRecordPermissionPolicy.can_preview + [
-        IfCurationRecordBasedExists(then_=[CurationModerators()], else_=[]),
+        curation_moderators,
     ]
     can_view = RDMRecordPermissionPolicy.can_view + [
-        IfCurationRecordBasedExists(then_=[CurationModerators()], else_=[]),
+        curation_moderators,
     ]
     can_read = RDMRecordPermissionPolicy.can_read + [
-        IfCurationRecordBasedExists(then_=[CurationModerators()], else_=[]),
+        curation_moderators,
     ]
     can_read_files = RDMRecordPermissionPolicy.can_read_files + [
-        IfCurationRecordBasedExists(then_=[CurationModerators()], else_=[]),
+        curation_moderators,
     ]
 
     # in order to get all base permissions in, we just add ours instead of adapting the then_ clause of the base permission
@@ -54,10 +62,10 @@ class CurationRDMRecordPermissionPolicy(RDMRecordPermissionPolicy):
     ]
 
     can_read_draft = RDMRecordPermissionPolicy.can_read_draft + [
-        IfCurationRecordBasedExists(then_=[CurationModerators()], else_=[]),
+        curation_moderators,
     ]
     can_draft_read_files = RDMRecordPermissionPolicy.can_draft_read_files + [
-        IfCurationRecordBasedExists(then_=[CurationModerators()], else_=[]),
+        curation_moderators,
     ]
 
     # in order to get all base permissions in, we just add ours instead of adapting the then_ clause of the base permission
@@ -79,7 +87,7 @@ class CurationRDMRecordPermissionPolicy(RDMRecordPermissionPolicy):
     )
 
     can_media_read_files = RDMRecordPermissionPolicy.can_media_read_files + [
-        IfCurationRecordBasedExists(then_=[CurationModerators()], else_=[]),
+        curation_moderators,
     ]
     can_media_get_content_files = (
         RDMRecordPermissionPolicy.can_media_get_content_files
@@ -99,6 +107,14 @@ class CurationRDMRequestsPermissionPolicy(RDMRequestsPermissionPolicy):
         else_=[],
     )
 
+    # curation requests assigned to a curator are received by the curator, all
+    # curators can still read and review them
+    curation_request_moderators = IfRequestTypes(
+        [CurationRequest],
+        then_=[CurationRequestModerators()],
+        else_=[],
+    )
+
     # Only allow community-submission requests to be accepted after the rdm-curation request has been accepted
     # (if curation request exists).
     _can_communities_curation_accept: Final = [
@@ -119,6 +135,7 @@ class CurationRDMRequestsPermissionPolicy(RDMRequestsPermissionPolicy):
             then_=_can_communities_curation_accept,
             else_=RDMRequestsPermissionPolicy.can_action_accept,
         ),
+        curation_request_moderators,
     ]
 
     # Update can read and can comment with new states
@@ -129,6 +146,7 @@ class CurationRDMRequestsPermissionPolicy(RDMRequestsPermissionPolicy):
             then_=[
                 Creator(),
                 Receiver(),
+                CurationRequestModerators(),
                 TopicPermission(permission_name="can_review"),
                 SystemProcess(),
             ],
@@ -144,7 +162,12 @@ class CurationRDMRequestsPermissionPolicy(RDMRequestsPermissionPolicy):
     ]
 
     # Add new actions
-    can_action_review = RDMRequestsPermissionPolicy.can_action_accept
-    can_action_critique = RDMRequestsPermissionPolicy.can_action_accept
+    can_action_review = RDMRequestsPermissionPolicy.can_action_accept + [
+        curation_request_moderators,
+    ]
+    can_action_critique = can_action_review
+    can_action_decline = RDMRequestsPermissionPolicy.can_action_decline + [
+        curation_request_moderators,
+    ]
     can_action_resubmit = can_action_submit
     can_action_pending_resubmission = can_action_resubmit
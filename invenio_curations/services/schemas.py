@@ -0,0 +1,23 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (C) 2026 Graz University of Technology.
+#
+# Invenio-Curations is free software; you can redistribute it and/or modify it
+# under the terms of the MIT License; see LICENSE file for more details.
+
+"""Schemas of the data passed to the curation service."""
+
+from typing import Any
+
+from marshmallow import Schema, fields, validate
+
+
+class BulkActionSchema(Schema):
+    """Schema of the requests a bulk action is executed on."""
+
+    ids = fields.List(fields.String(), required=True)
+
+    def __init__(self, *, max_items: int, **kwargs: Any) -> None:
+        """Constructor, limiting the number of requests to ``max_items``."""
+        super().__init__(**kwargs)
+        self.fields["ids"].validators.append(validate.Length(min=1, max=max_items))
@@ -7,32 +7,79 @@
 
 """Curation service."""
 
+from collections.abc import Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from datetime import UTC, datetime, timedelta
+from itertools import batched
+from time import time
 from typing import Any, cast
+from uuid import UUID
 
 from flask import current_app
-from flask_principal import AnonymousIdentity, Identity
+from flask_principal import AnonymousIdentity, Identity, RoleNeed
 from flask_security import SQLAlchemyUserDatastore
-from invenio_access.permissions import system_identity
-from invenio_accounts.models import Role
+from invenio_access.permissions import Permission, system_identity, system_process
+from invenio_accounts.models import Role, User
 from invenio_accounts.proxies import current_datastore
+from invenio_base.utils import obj_or_import_string
+from invenio_cache import current_cache
+from invenio_db import db
 from invenio_db.uow import UnitOfWork
 from invenio_i18n import gettext as _
+from invenio_pidstore.models import PersistentIdentifier
 from invenio_rdm_records.records.api import RDMDraft
+from invenio_records_resources.services.errors import PermissionDeniedError
 from invenio_records_resources.services.records.results import RecordItem, RecordList
-from invenio_records_resources.services.uow import unit_of_work
+from invenio_records_resources.services.uow import RecordCommitOp, unit_of_work
+from invenio_requests.customizations import RequestActions
 from invenio_requests.customizations.request_types import RequestType
+from invenio_requests.errors import CannotExecuteActionError, NoSuchActionError
 from invenio_requests.proxies import current_request_type_registry
+from invenio_requests.records.api import Request
+from invenio_requests.records.models import RequestEventModel
 from invenio_requests.registry import TypeRegistry
 from invenio_requests.services import RequestsService
 from invenio_requests.services.results import ResolverRegistry
 from invenio_search.engine import dsl
+from sqlalchemy import case, func
+from sqlalchemy.orm.exc import NoResultFound
 from werkzeug.datastructures import ImmutableMultiDict
 
+from ..metrics import count_search_query, instrumented
+from ..models import CurationClaim, CurationTopic, CurationTransition
 from ..proxies import unproxy
 from ..requests import CurationRequest
+from ..requests.curation import CLAIMABLE_STATUSES, CurationExpireAction
+from .assignment import CurationAssignmentStrategy
 from .diff import DiffElement
-from .errors import OpenRecordCurationRequestAlreadyExistsError, RoleNotFoundError
-from .utils import is_identity_privileged
+from .errors import (
+    CurationClaimNotHeldError,
+    CurationRequestClaimedError,
+    NoUnclaimedCurationRequestError,
+    OpenRecordCurationRequestAlreadyExistsError,
+    RoleNotFoundError,
+)
+from .schemas import BulkActionSchema
+from .uow import BulkIndexOp
+from .utils import clear_request_cache, is_identity_privileged
+
+_prefetched_acceptances: ContextVar[dict[str, bool] | None] = ContextVar(
+    "curations_prefetched_acceptances",
+    default=None,
+)
+"""Acceptance of records, prefetched for a batch of publications."""
+
+CLAIM_NEXT_CANDIDATES = 10
+"""Number of requests tried when claiming the next one, in case others are faster."""
+
+_WORKLOAD_KEY = "invenio-curations:workload"
+_ASSIGNMENTS_KEY = "invenio-curations:workload:{computed}:{user_id}"
+
+
+def _assignments_key(index: dict[str, Any], user_id: str) -> str:
+    """Get the key counting the assignments to a user since the index was computed."""
+    return _ASSIGNMENTS_KEY.format(computed=index["computed"], user_id=user_id)
 
 
 class EmptyResultList:
@@ -54,6 +101,9 @@ class CurationRequestService:
     _request_type_registry: TypeRegistry = unproxy(current_request_type_registry)
     _datastore: SQLAlchemyUserDatastore = unproxy(current_datastore)
 
+    summary_fields: tuple[str, ...] = ("id", "status", "is_open", "title")
+    """Fields of the curation requests returned by :meth:`get_review_summary`."""
+
     def __init__(self, requests_service: RequestsService, **__: Any) -> None:
         """Service initialisation as a sub-service of requests."""
         self.requests_service = requests_service
@@ -80,9 +130,9 @@ class CurationRequestService:
         return cast(str, role)
 
     @property
-    def moderation_role(self) -> str:
+    def moderation_role(self) -> Role | None:
         """Get the configured ``CURATIONS_MODERATION_ROLE`` role."""
-        return cast(str, self._datastore.find_role(self.moderation_role_name))
+        return cast(Role | None, self._datastore.find_role(self.moderation_role_name))
 
     @property
     def request_type_cls(self) -> type[RequestType]:
@@ -103,10 +153,10 @@ class CurationRequestService:
     @property
     def comments_mapping(self) -> list[DiffElement]:
         """Curations specific comment classes."""
-        return cast(
-            list[DiffElement],
-            current_app.config.get("CURATIONS_COMMENTS_CLASSES"),
-        )
+        return [
+            cast(DiffElement, obj_or_import_string(element))
+            for element in current_app.config.get("CURATIONS_COMMENTS_CLASSES", [])
+        ]
 
     @property
     def comment_template_file(self) -> str:
@@ -118,6 +168,63 @@ class CurationRequestService:
         """Curations roles that can bypass the curation approvals."""
         return cast(list[str], current_app.config.get("CURATIONS_PRIVILEGED_ROLES"))
 
+    @property
+    def stats_cache_ttl(self) -> int:
+        """Get the configured value of ``CURATIONS_STATS_CACHE_TTL``."""
+        return cast(int, current_app.config.get("CURATIONS_STATS_CACHE_TTL", 60))
+
+    @property
+    def stats_age_buckets(self) -> list[str]:
+        """Get the configured value of ``CURATIONS_STATS_AGE_BUCKETS``."""
+        return cast(
+            list[str],
+            current_app.config.get("CURATIONS_STATS_AGE_BUCKETS", ["1d", "7d", "30d"]),
+        )
+
+    @property
+    def bulk_action_max_items(self) -> int:
+        """Get the configured value of ``CURATIONS_BULK_ACTION_MAX_ITEMS``."""
+        return cast(
+            int,
+            current_app.config.get("CURATIONS_BULK_ACTION_MAX_ITEMS", 100),
+        )
+
+    @property
+    def transition_buckets(self) -> list[int]:
+        """Get the configured value of ``CURATIONS_TRANSITION_BUCKETS``."""
+        return cast(
+            list[int],
+            current_app.config.get(
+                "CURATIONS_TRANSITION_BUCKETS",
+                [3600, 86400, 604800, 2592000],
+            ),
+        )
+
+    @property
+    def claim_ttl(self) -> timedelta:
+        """Get the configured value of ``CURATIONS_CLAIM_TTL``."""
+        return timedelta(seconds=current_app.config.get("CURATIONS_CLAIM_TTL", 1800))
+
+    @property
+    def assignment_strategy(self) -> CurationAssignmentStrategy:
+        """Get the configured ``CURATIONS_ASSIGNMENT_STRATEGY``."""
+        strategy_cls = obj_or_import_string(
+            current_app.config["CURATIONS_ASSIGNMENT_STRATEGY"],
+        )
+        return cast(CurationAssignmentStrategy, strategy_cls())
+
+    @property
+    def workload_cache_ttl(self) -> int:
+        """Get the configured value of ``CURATIONS_WORKLOAD_CACHE_TTL``."""
+        return cast(int, current_app.config.get("CURATIONS_WORKLOAD_CACHE_TTL", 60))
+
+    def _require_moderator(self, identity: Identity, action_name: str) -> None:
+        """Only allow the moderation role (and system processes) to continue."""
+        permission = Permission(RoleNeed(self.moderation_role_name), system_process)
+        if not permission.allows(identity):
+            raise PermissionDeniedError(action_name)
+
+    @instrumented("get_review")
     def get_review(
         self,
         identity: Identity,
@@ -129,6 +236,7 @@ class CurationRequestService:
         # Assume there is only one item in the reference dict
         topic_key, topic_value = next(iter(topic_reference.items()))
 
+        count_search_query()
         results: RecordList = self.requests_service.search(
             identity,
             extra_filter=dsl.query.Bool(
@@ -146,6 +254,34 @@ class CurationRequestService:
 
         return cast(dict[str, Any], next(results.hits))
 
+    @instrumented("get_review_summary")
+    def get_review_summary(self, topic: RDMDraft) -> dict[str, Any] | None:
+        """Get the main fields of the curation review for a topic.
+
+        Unlike :meth:`get_review`, only the fields in :attr:`summary_fields` are
+        fetched from the index, without expanding entities or building a result item.
+        """
+        topic_reference: dict = ResolverRegistry.reference_entity(topic)
+        topic_key, topic_value = next(iter(topic_reference.items()))
+
+        search = self.requests_service.create_search(
+            system_identity,
+            self.requests_service.record_cls,
+            self.requests_service.config.search,
+            extra_filter=dsl.query.Bool(
+                "must",
+                must=[
+                    dsl.Q("term", **{"type": self.request_type_cls.type_id}),
+                    dsl.Q("term", **{f"topic.{topic_key}": topic_value}),
+                ],
+            ),
+        )
+
+        count_search_query()
+        hits = search.source(list(self.summary_fields))[:1].execute()
+        return hits[0].to_dict() if hits else None
+
+    @instrumented("accepted_record")
     def accepted_record(
         self,
         identity: Identity,
@@ -156,6 +292,7 @@ class CurationRequestService:
         # Assume there is only one item in the reference dict
         topic_key, topic_value = next(iter(topic_reference.items()))
 
+        count_search_query()
         results: RecordList = self.requests_service.search(
             identity,
             extra_filter=dsl.query.Bool(
@@ -170,15 +307,132 @@ class CurationRequestService:
         )
         return next(results.hits) if results.total > 0 else None
 
+    def accepted_marker(self, record: RDMDraft) -> bool | None:
+        """Check if the current revision of a record has been accepted, without a search.
+
+        The status of the curation request is stored with its topic, together with
+        the revision of the draft it was accepted in.
+
+        :returns: ``None`` if the stored status is missing or stale, in which case
+            :meth:`accepted_record` has to be used instead.
+        """
+        topic_reference = ResolverRegistry.reference_entity(record)
+        topic_key, topic_value = next(iter(topic_reference.items()))
+        curation_topic = db.session.get(CurationTopic, (topic_key, str(topic_value)))
+        if curation_topic is None:
+            return None
+        return curation_topic.is_accepted(record.revision_id)
+
+    @instrumented("accepted_records")
+    def accepted_records(self, identity: Identity, record_ids: list[str]) -> set[str]:
+        """Get the IDs of the records that have been accepted, with a single search.
+
+        :param record_ids: The PID values of the records.
+        """
+        if not record_ids:
+            return set()
+
+        topic_ids = [str(id_) for id_ in record_ids]
+        search = self.requests_service.create_search(
+            identity,
+            self.requests_service.record_cls,
+            self.requests_service.config.search,
+            extra_filter=dsl.query.Bool(
+                "must",
+                must=[
+                    dsl.Q("term", **{"type": self.request_type_cls.type_id}),
+                    dsl.Q("terms", **{"topic.record": topic_ids}),
+                    dsl.Q("term", **{"is_open": False}),
+                    dsl.Q("term", **{"status": "accepted"}),
+                ],
+            ),
+        )
+
+        count_search_query()
+        return {hit.topic.record for hit in search.source(["topic"]).scan()}
+
+    @contextmanager
+    def prefetch_acceptances(self, record_ids: list[str]) -> Iterator[set[str]]:
+        """Check the acceptance of many records for publishing them in a batch.
+
+        Within the context, the ``CurationComponent`` uses the prefetched acceptance
+        of these records instead of searching for each of them::
+
+            with current_curations_service.prefetch_acceptances(ids):
+                for id_ in ids:
+                    current_rdm_records_service.publish(identity, id_)
+
+        :param record_ids: The PID values of the drafts to publish.
+        :returns: The IDs of the accepted records.
+        """
+        accepted = self.accepted_records(system_identity, record_ids)
+        token = _prefetched_acceptances.set(
+            {str(id_): str(id_) in accepted for id_ in record_ids},
+        )
+        try:
+            yield accepted
+        finally:
+            _prefetched_acceptances.reset(token)
+
+    def prefetched_acceptance(self, record: RDMDraft | dict) -> bool | None:
+        """Get the acceptance of a record prefetched for a batch, if any."""
+        prefetched = _prefetched_acceptances.get()
+        if prefetched is None:
+            return None
+        return prefetched.get(str(record["id"]))
+
+    def _request_title(self, topic: RDMDraft | dict) -> str:
+        """Title of the curation request for a topic."""
+        return "RDM Curation: {title}".format(
+            title=topic.get("metadata", {}).get("title") or topic["id"],
+        )
+
+    def needs_title_update(self, request: dict, topic: RDMDraft | dict) -> bool:
+        """Check if the title of a curation request differs from its topic's one."""
+        return bool(request.get("title") != self._request_title(topic))
+
+    @unit_of_work()
+    def update_title(
+        self,
+        request: dict,
+        topic: RDMDraft | dict,
+        uow: UnitOfWork | None = None,
+    ) -> bool:
+        """Synchronize the title of a curation request with the title of its topic.
+
+        The request is only written (and reindexed) if its stored title differs.
+
+        :returns: If the request was updated.
+        """
+        if not self.needs_title_update(request, topic):
+            return False
+
+        # Using system identity, to not have to update the default request can_update permission.
+        # Data will be checked in the requests service.
+        self.requests_service.update(
+            system_identity,
+            request["id"],
+            {"title": self._request_title(topic)},
+            uow=uow,
+        )
+        return True
+
+    @instrumented("create")
     @unit_of_work()
     def create(
         self,
         identity: Identity,
         data: dict[str, Any] | None = None,
         uow: UnitOfWork | None = None,
+        *,
+        exist_ok: bool = False,
         **kwargs: Any,
     ) -> RecordItem:
-        """Create a RDMCuration request and submit it."""
+        """Create a RDMCuration request and submit it.
+
+        :param exist_ok: Return the existing curation request of the topic instead
+            of raising an error, e.g. for retried submissions.
+        """
         role = self.moderation_role
         if not role:
             raise RoleNotFoundError(self.moderation_role_name)
@@ -194,26 +448,36 @@ class CurationRequestService:
             else None
         )
 
+        # the receiver may review and accept the request, only the system can choose
+        # it, e.g. to reassign the request to another curator
+        receiver_reference = data.pop("receiver", None)  # type: ignore[union-attr]
         receiver = (
-            ResolverRegistry.resolve_entity_proxy(data.pop("receiver", None)).resolve()  # type: ignore[union-attr]
-            if "receiver" in data  # type: ignore[operator]
-            else role
+            ResolverRegistry.resolve_entity_proxy(receiver_reference).resolve()  # type: ignore[union-attr]
+            if receiver_reference and system_process in identity.provides
+            else None
         )
 
-        default_data = {
-            "title": "RDM Curation: {title}".format(
-                title=topic.metadata.get("title", topic["id"]),
-            ),
-        }
+        default_data = {"title": self._request_title(topic)}
+        topic_reference: dict = ResolverRegistry.reference_entity(topic)
+        topic_key, topic_value = next(iter(topic_reference.items()))
 
-        # using system identity to ensure a request is fetched, if it exists. Even if the user would not have access.
-        if self.get_review(system_identity, topic):
-            raise OpenRecordCurationRequestAlreadyExistsError
+        # the database (not the search index) ensures one request per topic, also
+        # for concurrent creations
+        curation_topic = CurationTopic.claim(topic_key, topic_value)
+        if curation_topic is None:
+            if not exist_ok:
+                raise OpenRecordCurationRequestAlreadyExistsError
+            request_id = CurationTopic.get_request_ids(topic_key, [topic_value])
+            return self.requests_service.read(identity, request_id[topic_value])
 
         if data:
             default_data.update(data)
 
-        return self.requests_service.create(
+        # assigned only now, as no curator should be assigned to an existing request
+        if receiver is None:
+            receiver = self._assign_receiver(topic, role)
+
+        item = self.requests_service.create(
             identity,
             default_data,
             self.request_type_cls,
@@ -223,7 +487,289 @@ class CurationRequestService:
             uow=uow,
             **kwargs,
         )
+        curation_topic.request_id = item.id
+        curation_topic.status = item.data["status"]
+        clear_request_cache()
+        return item
+
+    @instrumented("create_for_drafts")
+    @unit_of_work()
+    def create_for_drafts(
+        self,
+        identity: Identity,
+        record_ids: list[str],
+        creator: dict[str, str] | None = None,
+        uow: UnitOfWork | None = None,
+    ) -> dict[str, list[str]]:
+        """Create and submit curation requests for many drafts in one unit of work.
+
+        The drafts are resolved and the existing curation requests are looked up
+        with one query each, drafts which already have a curation request (also
+        from a concurrent creation) are skipped. The requests themselves are still
+        created one by one through the requests service, which indexes each of
+        them.
+
+        :param record_ids: The PID values of the drafts.
+        :param creator: Reference to the creator of the requests, e.g.
+            ``{"user": "1"}``.
+        :returns: The IDs of the created requests, as well as the record IDs that
+            were skipped because a request exists already or the draft is missing.
+        """
+        role = self.moderation_role
+        if not role:
+            raise RoleNotFoundError(self.moderation_role_name)
+
+        pids = PersistentIdentifier.query.filter(
+            PersistentIdentifier.pid_type == "recid",
+            PersistentIdentifier.pid_value.in_(record_ids),
+        ).all()
+        drafts = RDMDraft.get_records([pid.object_uuid for pid in pids])
+        existing = set(
+            CurationTopic.get_request_ids("record", [draft["id"] for draft in drafts]),
+        )
+        creator_entity = (
+            ResolverRegistry.resolve_entity_proxy(creator).resolve()
+            if creator
+            else None
+        )
+
+        created = []
+        for draft in drafts:
+            if draft["id"] in existing:
+                continue
+
+            curation_topic = CurationTopic.claim("record", draft["id"])
+            if curation_topic is None:
+                existing.add(draft["id"])
+                continue
+
+            item = self.requests_service.create(
+                identity,
+                {"title": self._request_title(draft)},
+                self.request_type_cls,
+                self._assign_receiver(draft, role),
+                creator=creator_entity,
+                topic=draft,
+                uow=uow,
+            )
+            curation_topic.request_id = item.id
+            curation_topic.status = item.data["status"]
+            created.append(item.id)
+
+        clear_request_cache()
+        found = {draft["id"] for draft in drafts}
+        return {
+            "created": created,
+            "existing": [id_ for id_ in record_ids if id_ in existing],
+            "missing": [id_ for id_ in record_ids if id_ not in found],
+        }
+
+    @instrumented("bulk_execute_action")
+    @unit_of_work()
+    def bulk_execute_action(
+        self,
+        identity: Identity,
+        action: str,
+        data: dict[str, Any],
+        uow: UnitOfWork | None = None,
+    ) -> dict[str, list[dict[str, str]]]:
+        """Execute an action on many curation requests in a single unit of work.
+
+        Each request is handled in its own savepoint, so that a failing request does
+        not prevent the action on the others. Returns the results and errors per
+        request.
+
+        :param data: The IDs of the requests, e.g. ``{"ids": ["<request-id>"]}``.
+        """
+        schema = BulkActionSchema(max_items=self.bulk_action_max_items)
+        ids = schema.load(data)["ids"]
+
+        return self._execute_action_many(identity, action, ids, uow)  # type: ignore[arg-type]
+
+    def _execute_action_many(
+        self,
+        identity: Identity,
+        action: str,
+        ids: list[str],
+        uow: UnitOfWork,
+    ) -> dict[str, list[dict[str, str]]]:
+        """Execute an action on many curation requests, each in its own savepoint.
+
+        The requests are not indexed one by one, but all of them with a single bulk
+        index operation after the commit.
+        """
+        hits: list[dict[str, str]] = []
+        errors: list[dict[str, str]] = []
+
+        valid_ids = []
+        for id_ in ids:
+            try:
+                valid_ids.append(str(UUID(str(id_))))
+            except ValueError:
+                errors.append({"id": str(id_), "message": _("Invalid request ID.")})
+
+        # fetch all requests with one query, to check their type upfront
+        requests = {
+            str(request.id): request
+            for request in Request.get_records(valid_ids)
+            if request.type.type_id == self.request_type_cls.type_id
+        }
+
+        for id_ in valid_ids:
+            if id_ not in requests:
+                errors.append({"id": id_, "message": _("Curation request not found.")})
+                continue
+
+            try:
+                with db.session.begin_nested():
+                    request = self._execute_action_unindexed(
+                        identity,
+                        requests[id_],
+                        action,
+                        uow,
+                    )
+            except (
+                CannotExecuteActionError,
+                NoSuchActionError,
+                PermissionDeniedError,
+            ) as e:
+                errors.append(
+                    {"id": id_, "message": str(getattr(e, "description", e))},
+                )
+                continue
+
+            hits.append({"id": id_, "status": request["status"]})
+
+        uow.register(
+            BulkIndexOp(
+                self.requests_service.indexer,
+                [hit["id"] for hit in hits],
+            ),
+        )
+        return {"hits": hits, "errors": errors}
+
+    def _execute_action_unindexed(
+        self,
+        identity: Identity,
+        request: Request,
+        action: str,
+        uow: UnitOfWork,
+    ) -> Request:
+        """Execute an action like the requests service, without indexing the request.
+
+        The caller is responsible for indexing the request after the commit.
+        """
+        requests_service = self.requests_service
+        requests_service.require_permission(
+            identity,
+            f"action_{action}",
+            request=request,
+        )
+        action_obj = RequestActions.get_action(request, action)
+        if not action_obj.can_execute():
+            raise CannotExecuteActionError(action)
+
+        action_obj.execute(identity, uow)
+        requests_service.run_components(
+            "execute_action",
+            identity,
+            data=None,
+            record=request,
+            uow=uow,
+        )
+        uow.register(RecordCommitOp(request, indexer=None))
+        return request
+
+    def _stale_request_ids(self, older_than: datetime) -> list[str]:
+        """Get the IDs of expirable curation requests without activity since a date."""
+        search = self.requests_service.create_search(
+            system_identity,
+            self.requests_service.record_cls,
+            self.requests_service.config.search,
+            extra_filter=dsl.query.Bool(
+                "must",
+                must=[
+                    dsl.Q("term", **{"type": self.request_type_cls.type_id}),
+                    dsl.Q("terms", status=CurationExpireAction.status_from),
+                    dsl.Q("range", updated={"lt": older_than.isoformat()}),
+                ],
+            ),
+        )
+
+        count_search_query()
+        ids = [hit.id for hit in search.source(["id"]).scan()]
+        return self._without_events_since(ids, older_than)
 
+    def _without_events_since(
+        self,
+        request_ids: list[str],
+        since: datetime,
+        chunk_size: int = 1000,
+    ) -> list[str]:
+        """Exclude the requests with timeline events (e.g. comments) since a date.
+
+        Adding or editing a comment does not update the request itself, hence its
+        events are checked separately, with one query per chunk of requests.
+        """
+        if since.tzinfo is not None:
+            # the events' timestamps are stored as naive UTC
+            since = since.astimezone(UTC).replace(tzinfo=None)
+
+        active: set[str] = set()
+        for chunk in batched(request_ids, chunk_size):
+            query = (
+                db.session.query(RequestEventModel.request_id)
+                .filter(
+                    RequestEventModel.request_id.in_(chunk),
+                    RequestEventModel.updated >= since,
+                )
+                .distinct()
+            )
+            active.update(str(id_) for (id_,) in query)
+
+        return [id_ for id_ in request_ids if id_ not in active]
+
+    @instrumented("expire_stale")
+    def expire_stale(
+        self,
+        older_than: datetime,
+        *,
+        batch_size: int = 100,
+        dry_run: bool = False,
+    ) -> dict[str, list]:
+        """Expire curation requests without activity since the given date.
+
+        The stale requests are found with a single search (and a query for their
+        latest events), and expired in batches with one unit of work per batch.
+        The requests of a batch are indexed with a single bulk request, after the
+        batch was committed.
+
+        :param older_than: Expire requests that were neither updated nor had any
+            timeline event (e.g. a comment) since this date.
+        :param batch_size: Number of requests to expire per unit of work.
+        :param dry_run: Only report the stale requests, without expiring them.
+        """
+        ids = self._stale_request_ids(older_than)
+        result: dict[str, list] = {"hits": [], "errors": []}
+        if dry_run:
+            result["hits"] = [{"id": id_, "status": None} for id_ in ids]
+            return result
+
+        for batch in batched(ids, batch_size):
+            with UnitOfWork(db.session) as uow:
+                batch_result = self._execute_action_many(
+                    system_identity,
+                    "expire",
+                    list(batch),
+                    uow,
+                )
+                uow.commit()
+            result["hits"].extend(batch_result["hits"])
+            result["errors"].extend(batch_result["errors"])
+
+        return result
+
+    @instrumented("search")
     def search(
         self,
         identity: Identity,
@@ -233,11 +779,20 @@ class CurationRequestService:
         expand: bool = False,
         **kwargs: Any,
     ) -> RecordList:
-        """Search for curation requests."""
+        """Search for curation requests.
+
+        With the ``unclaimed`` parameter, requests claimed by a curator are excluded.
+        """
         if type(identity) is AnonymousIdentity:
             # secret link users do not have permissions to search requests
             return EmptyResultList()
 
+        must_not = []
+        if params and params.get("unclaimed"):
+            claimed_ids = CurationClaim.claimed_request_ids()
+            must_not.append(dsl.Q("ids", values=[str(id_) for id_ in claimed_ids]))
+
+        count_search_query()
         return self.requests_service.search(
             identity,
             extra_filter=dsl.query.Bool(
@@ -245,6 +800,7 @@ class CurationRequestService:
                 must=[
                     dsl.Q("term", **{"type": self.request_type_cls.type_id}),
                 ],
+                must_not=must_not,
             ),
             params=params,
             search_preference=search_preference,
@@ -252,6 +808,339 @@ class CurationRequestService:
             **kwargs,
         )
 
+    def _age_ranges(self) -> list[dict[str, str]]:
+        """Build the ``date_range`` buckets from the configured age boundaries."""
+        ranges = []
+        previous = None
+        for boundary in self.stats_age_buckets:
+            bucket = {"key": f"<{boundary}", "from": f"now-{boundary}"}
+            if previous is not None:
+                bucket["key"] = f"{previous}-{boundary}"
+                bucket["to"] = f"now-{previous}"
+            ranges.append(bucket)
+            previous = boundary
+
+        if previous is not None:
+            ranges.append({"key": f">{previous}", "to": f"now-{previous}"})
+
+        return ranges
+
+    def _compute_stats(self) -> dict[str, Any]:
+        """Run a single aggregation query over all curation requests."""
+        search = self.requests_service.create_search(
+            system_identity,
+            self.requests_service.record_cls,
+            self.requests_service.config.search,
+            extra_filter=dsl.Q("term", **{"type": self.request_type_cls.type_id}),
+        )
+        search = search.extra(track_total_hits=True)[:0]
+
+        age_ranges = self._age_ranges()
+        search.aggs.bucket("status", "terms", field="status", size=50)
+        search.aggs.bucket(
+            "submitted",
+            "date_histogram",
+            field="created",
+            calendar_interval="week",
+            min_doc_count=1,
+        )
+        open_requests = search.aggs.bucket(
+            "open",
+            "filter",
+            filter=dsl.Q("term", is_open=True),
+        )
+        open_requests.bucket("age", "date_range", field="created", ranges=age_ranges)
+        open_requests.bucket("idle", "date_range", field="updated", ranges=age_ranges)
+        open_requests.bucket("groups", "terms", field="receiver.group", size=100)
+        open_requests.bucket("users", "terms", field="receiver.user", size=1000)
+
+        count_search_query()
+        response = search.execute()
+        aggs = response.aggregations
+
+        def _buckets(agg: Any) -> dict[str, int]:
+            return {str(b.key): b.doc_count for b in agg.buckets}
+
+        return {
+            "total": response.hits.total.value,
+            "status": _buckets(aggs.status),
+            "submitted": [
+                {"date": b.key_as_string, "count": b.doc_count}
+                for b in aggs.submitted.buckets
+            ],
+            "open": {
+                "total": aggs.open.doc_count,
+                "age": _buckets(aggs.open.age),
+                "idle": _buckets(aggs.open.idle),
+                "receivers": {
+                    **{f"group:{k}": v for k, v in _buckets(aggs.open.groups).items()},
+                    **{f"user:{k}": v for k, v in _buckets(aggs.open.users).items()},
+                },
+            },
+        }
+
+    def _compute_transition_metrics(self) -> dict[str, Any]:
+        """Compute latency histograms per status transition from the history table.
+
+        The histograms are cumulative (as in Prometheus), keyed by the upper bound
+        of each bucket in seconds.
+        """
+        buckets = self.transition_buckets
+        duration = CurationTransition.duration
+        bucket = case(
+            *[(duration <= bound, index) for index, bound in enumerate(buckets)],
+            else_=len(buckets),
+        )
+        rows = (
+            db.session.query(
+                CurationTransition.status_from,
+                CurationTransition.status_to,
+                bucket,
+                func.count(),
+                func.sum(duration),
+            )
+            .filter(duration.isnot(None))
+            .group_by(
+                CurationTransition.status_from,
+                CurationTransition.status_to,
+                bucket,
+            )
+            .all()
+        )
+
+        histograms: dict[str, dict[str, Any]] = {}
+        for status_from, status_to, index, count, total in rows:
+            histogram = histograms.setdefault(
+                f"{status_from}->{status_to}",
+                {"count": 0, "sum": 0.0, "buckets": [0] * (len(buckets) + 1)},
+            )
+            histogram["count"] += count
+            histogram["sum"] += total or 0.0
+            histogram["buckets"][index] += count
+
+        for histogram in histograms.values():
+            cumulative = 0
+            labelled = {}
+            for bound, count in zip(
+                [*map(str, buckets), "+Inf"],
+                histogram["buckets"],
+                strict=True,
+            ):
+                cumulative += count
+                labelled[bound] = cumulative
+            histogram["buckets"] = labelled
+
+        return histograms
+
+    def get_stats(self, identity: Identity) -> dict[str, Any]:
+        """Get aggregated statistics over the curation queue.
+
+        The statistics are computed with a single aggregation query and cached for
+        ``CURATIONS_STATS_CACHE_TTL`` seconds, as they are identical for all curators.
+        """
+        self._require_moderator(identity, "read_curation_stats")
+
+        cache_key = "invenio-curations:stats"
+        stats = current_cache.get(cache_key)
+        if stats is None:
+            stats = self._compute_stats()
+            stats["transitions"] = self._compute_transition_metrics()
+            current_cache.set(cache_key, stats, timeout=self.stats_cache_ttl)
+
+        return cast(dict[str, Any], stats)
+
+    def get_workload(self, user_ids: list[str]) -> dict[str, int]:
+        """Get the number of open curation requests assigned to each given curator.
+
+        The workload index is computed with a single aggregation query and cached for
+        ``CURATIONS_WORKLOAD_CACHE_TTL`` seconds. The assignments in the meantime are
+        counted per curator next to the index, as the new requests are not
+        searchable yet.
+        """
+        index = current_cache.get(_WORKLOAD_KEY)
+        if index is None:
+            index = {"computed": time(), "workload": self._compute_workload()}
+            current_cache.set(_WORKLOAD_KEY, index, timeout=self.workload_cache_ttl)
+
+        assigned = current_cache.get_many(
+            *[_assignments_key(index, user_id) for user_id in user_ids],
+        )
+        return {
+            user_id: index["workload"].get(user_id, 0) + (count or 0)
+            for user_id, count in zip(user_ids, assigned, strict=True)
+        }
+
+    def _compute_workload(self) -> dict[str, int]:
+        """Count the open curation requests per receiving user."""
+        search = self.requests_service.create_search(
+            system_identity,
+            self.requests_service.record_cls,
+            self.requests_service.config.search,
+            extra_filter=dsl.Q("term", **{"type": self.request_type_cls.type_id})
+            & dsl.Q("term", is_open=True),
+        )
+        search = search[:0]
+        search.aggs.bucket("users", "terms", field="receiver.user", size=1000)
+
+        count_search_query()
+        response = search.execute()
+        return {str(b.key): b.doc_count for b in response.aggregations.users.buckets}
+
+    def _count_assignment(self, user_id: str) -> None:
+        """Count an assignment since the cached workload index was computed."""
+        index = current_cache.get(_WORKLOAD_KEY)
+        if index is None:
+            return
+
+        remaining = int(self.workload_cache_ttl - (time() - index["computed"]))
+        if remaining > 0:
+            # the counter expires with the index, incrementing it keeps the expiry
+            key = _assignments_key(index, user_id)
+            current_cache.add(key, 0, timeout=remaining)
+            current_cache.inc(key)
+
+    def _assign_receiver(self, topic: RDMDraft, role: Role) -> Role | User:
+        """Get the receiver of a new curation request, see ``assignment_strategy``."""
+        user_id = self.assignment_strategy.assign(topic, role)
+        if user_id is None:
+            return role
+
+        self._count_assignment(user_id)
+        return cast(
+            User,
+            ResolverRegistry.resolve_entity_proxy({"user": user_id}).resolve(),
+        )
+
+    def _dump_claim(self, claim: CurationClaim) -> dict[str, Any]:
+        """Serialize a claim."""
+        return {
+            "request_id": str(claim.request_id),
+            "user_id": str(claim.user_id),
+            "expires": claim.expires.isoformat(),
+        }
+
+    def _curation_request(self, request_id: str) -> Request:
+        """Get a curation request, other requests are not found."""
+        request = Request.get_record(request_id)
+        if request.type.type_id != self.request_type_cls.type_id:
+            raise NoResultFound
+        return request
+
+    def _claimable_request(self, request_id: str) -> Request:
+        """Get a curation request which can be claimed."""
+        request = self._curation_request(request_id)
+        if request.status not in CLAIMABLE_STATUSES:
+            action = "claim"
+            raise CannotExecuteActionError(
+                action,
+                reason=_("Request is not in review."),
+            )
+        return request
+
+    @unit_of_work()
+    def claim(
+        self,
+        identity: Identity,
+        request_id: str,
+        uow: UnitOfWork | None = None,  # noqa: ARG002
+    ) -> dict[str, Any]:
+        """Claim a curation request for reviewing it, or renew the own claim.
+
+        The claim expires after ``CURATIONS_CLAIM_TTL`` seconds, unless it is renewed
+        with :meth:`heartbeat`. As with :meth:`claim_next`, requests assigned to other
+        curators cannot be claimed.
+        """
+        self._require_moderator(identity, "claim")
+        request = self._claimable_request(request_id)
+        receiver = request.receiver.reference_dict
+        if receiver.get("user", str(identity.id)) != str(identity.id):
+            action = "claim"
+            raise CannotExecuteActionError(
+                action,
+                reason=_("Request is assigned to another curator."),
+            )
+
+        claim = CurationClaim.acquire(request.id, identity.id, self.claim_ttl)
+        if claim is None:
+            action = "claim"
+            raise CurationRequestClaimedError(action)
+        return self._dump_claim(claim)
+
+    @unit_of_work()
+    def heartbeat(
+        self,
+        identity: Identity,
+        request_id: str,
+        uow: UnitOfWork | None = None,  # noqa: ARG002
+    ) -> dict[str, Any]:
+        """Renew the claim of the curator on a curation request."""
+        self._require_moderator(identity, "claim")
+        request = self._claimable_request(request_id)
+
+        if not CurationClaim.renew(request.id, identity.id, self.claim_ttl):
+            raise CurationClaimNotHeldError
+        return self._dump_claim(db.session.get(CurationClaim, request.id))
+
+    @unit_of_work()
+    def release(
+        self,
+        identity: Identity,
+        request_id: str,
+        uow: UnitOfWork | None = None,  # noqa: ARG002
+    ) -> None:
+        """Release the claim of the curator on a curation request."""
+        self._require_moderator(identity, "claim")
+        request = self._curation_request(request_id)
+        CurationClaim.release(request.id, user_id=identity.id)
+
+    @unit_of_work()
+    def claim_next(
+        self,
+        identity: Identity,
+        uow: UnitOfWork | None = None,  # noqa: ARG002
+    ) -> dict[str, Any]:
+        """Claim the oldest unclaimed curation request waiting for a review.
+
+        The claimed requests are excluded with one query, and the oldest remaining
+        ones (not assigned to other curators) are looked up with one search. Since
+        concurrent curators might claim the same request, the next candidates are
+        tried if the claim fails.
+        """
+        self._require_moderator(identity, "claim")
+        claimed_ids = CurationClaim.claimed_request_ids()
+
+        search = self.requests_service.create_search(
+            system_identity,
+            self.requests_service.record_cls,
+            self.requests_service.config.search,
+            extra_filter=dsl.query.Bool(
+                "must",
+                must=[
+                    dsl.Q("term", **{"type": self.request_type_cls.type_id}),
+                    dsl.Q("terms", status=["submitted", "resubmitted"]),
+                ],
+                must_not=[
+                    dsl.Q("ids", values=[str(id_) for id_ in claimed_ids]),
+                    # requests assigned to other curators
+                    dsl.query.Bool(
+                        must=[dsl.Q("exists", field="receiver.user")],
+                        must_not=[
+                            dsl.Q("term", **{"receiver.user": str(identity.id)}),
+                        ],
+                    ),
+                ],
+            ),
+        )
+
+        count_search_query()
+        candidates = search.source(["id"]).sort("created")[:CLAIM_NEXT_CANDIDATES]
+        for hit in candidates.execute():
+            claim = CurationClaim.acquire(hit.id, identity.id, self.claim_ttl)
+            if claim is not None:
+                return self._dump_claim(claim)
+
+        raise NoUnclaimedCurationRequestError
+
     def get_curations_data(
         self,
         identity: Identity,
@@ -0,0 +1,32 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (C) 2026 Graz University of Technology.
+#
+# Invenio-Curations is free software; you can redistribute it and/or modify it
+# under the terms of the MIT License; see LICENSE file for more details.
+
+"""Unit of work operations of the curation service."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from invenio_records_resources.services.uow import Operation
+
+if TYPE_CHECKING:
+    from invenio_indexer.api import RecordIndexer
+    from invenio_records_resources.services.uow import UnitOfWork
+
+
+class BulkIndexOp(Operation):
+    """Index many records with a single bulk request, after the commit."""
+
+    def __init__(self, indexer: RecordIndexer, ids: list[str]) -> None:
+        """Constructor."""
+        self._indexer = indexer
+        self._ids = ids
+
+    def on_commit(self, uow: UnitOfWork) -> None:  # noqa: ARG002
+        """Queue the records for the bulk indexer."""
+        if self._ids:
+            self._indexer.bulk_index(self._ids)
@@ -8,10 +8,14 @@
 
 """Utils module."""
 
+from collections.abc import Callable, Hashable
+from typing import Any, cast
+
 import nh3
+from flask import current_app, g, has_request_context
 from flask_principal import Identity
-from invenio_accounts.models import User
-from invenio_db import db
+
+from ..notifications.members import is_user_privileged
 
 
 class HTMLParseError(Exception):
@@ -30,10 +34,42 @@ def cleanup_html_tags(text: str) -> str:
 
 
 def is_identity_privileged(privileged_roles: list[str], identity: Identity) -> bool:
-    """Check if given identity is privileged in curation context."""
-    user = db.session.get(User, identity.id)
+    """Check if given identity is privileged in curation context.
+
+    The decision is cached per user, see
+    :func:`~invenio_curations.notifications.members.is_user_privileged`.
+    """
+    if identity.id is None:
+        return False
+
+    return is_user_privileged(identity.id, privileged_roles)
+
+
+def request_cached[T](
+    namespace: str,
+    key: Hashable | None,
+    compute: Callable[[], T],
+) -> T:
+    """Compute the value for the key once per request.
+
+    Outside of a request (e.g. in tasks), without a key or with
+    ``CURATIONS_PERMISSIONS_CACHE`` disabled, the value is always computed.
+    """
+    if (
+        key is None
+        or not has_request_context()
+        or not current_app.config["CURATIONS_PERMISSIONS_CACHE"]
+    ):
+        return compute()
+
+    cache: dict[str, dict[Hashable, Any]] = g.setdefault("curations_cache", {})
+    values = cache.setdefault(namespace, {})
+    if key not in values:
+        values[key] = compute()
+    return cast(T, values[key])
 
-    if user:
-        return any(role in privileged_roles for role in user.roles)
 
-    return False
+def clear_request_cache() -> None:
+    """Drop the values cached in the request, e.g. after a curation request changed."""
+    if has_request_context():
+        g.pop("curations_cache", None)
@@ -1,29 +1,305 @@
 # -*- coding: utf-8 -*-
 #
 # This file is part of Invenio.
-# Copyright (C) 2024-2025 Graz University of Technology.
+# Copyright (C) 2024-2026 Graz University of Technology.
 #
 # Invenio-Curations is free software; you can redistribute it and/or modify it
 # under the terms of the MIT License; see LICENSE file for more details.
 
 """Celery tasks for curations."""
 
+from __future__ import annotations
+
+import warnings
+from collections import defaultdict
+from datetime import UTC, datetime
+from itertools import batched
+from typing import TYPE_CHECKING, Any
+
+from celery import current_app as current_celery_app
 from celery import shared_task
 from flask import current_app
 from invenio_access.permissions import system_identity
-from invenio_rdm_records.records.api import RDMDraft
+from invenio_cache import current_cache
+from invenio_db import db
+from invenio_search.engine import search
+from kombu.simple import SimpleQueue
+from sqlalchemy.exc import OperationalError
 
 from .proxies import current_curations_service, unproxy
-from .services import CurationRequestService
-from .services.errors import OpenRecordCurationRequestAlreadyExistsError
 
+# Celery workers import the tasks on startup, the records, requests and notification
+# modules are only imported when a task needs them.
+if TYPE_CHECKING:
+    from kombu.message import Message
 
-@shared_task(ignore_result=True)
-def request_record_curation(topic: RDMDraft, user_id: str) -> None:
-    """Creates a task to request moderation for a RDM record."""
+    from .services import CurationRequestService
+
+TRANSIENT_ERRORS = (
+    OperationalError,
+    search.exceptions.ConnectionError,
+    search.exceptions.ConnectionTimeout,
+)
+"""Errors on which tasks are retried with an exponential backoff."""
+
+_PENDING_SCHEDULED_KEY = "invenio-curations:pending-scheduled"
+_OUTBOX_SCHEDULED_KEY = "invenio-curations:outbox-scheduled"
+_TITLE_SYNC_SCHEDULED_KEY = "invenio-curations:title-sync-scheduled:{request_id}"
+
+
+def _create_curation_requests(record_ids: list[str], user_id: str | None) -> None:
+    """Create the curation requests for the given records in one unit of work."""
     _curations_service: CurationRequestService = unproxy(current_curations_service)
+    result = _curations_service.create_for_drafts(
+        system_identity,
+        record_ids,
+        creator={"user": str(user_id)} if user_id else None,
+    )
+    if result["missing"]:
+        current_app.logger.warning(
+            "Could not find drafts to request curation for: %s",
+            ", ".join(result["missing"]),
+        )
+
+
+def _pending_queue(connection: Any) -> SimpleQueue:
+    """Get the message queue holding the pending curation requests."""
+    return connection.SimpleQueue(current_app.config["CURATIONS_PENDING_QUEUE"])
+
+
+def schedule_record_curation(record_id: str, user_id: str | None = None) -> None:
+    """Queue a record for the creation of its curation request.
+
+    Records queued within ``CURATIONS_PENDING_DELAY`` seconds are grouped and
+    handled in a single execution of :func:`process_pending_curations`.
+    """
+    with current_celery_app.pool.acquire(block=True) as connection:
+        queue = _pending_queue(connection)
+        queue.put({"id": str(record_id), "user_id": user_id})
+        queue.close()
+
+    delay = current_app.config["CURATIONS_PENDING_DELAY"]
+    if current_cache.add(_PENDING_SCHEDULED_KEY, 1, timeout=delay * 2):
+        process_pending_curations.apply_async(countdown=delay)
+
+
+@shared_task(ignore_result=True)
+def request_record_curation(topic: dict | str, user_id: str) -> None:
+    """Request curation for a record.
+
+    Deprecated, call :func:`schedule_record_curation` directly instead: it only
+    queues the record, which does not need a task of its own. For backwards
+    compatibility, a (serialized) draft is accepted too.
+    """
+    warnings.warn(
+        "request_record_curation is deprecated, use schedule_record_curation.",
+        DeprecationWarning,
+        stacklevel=2,
+    )
+    record_id = topic if isinstance(topic, str) else topic["id"]
+    schedule_record_curation(record_id, user_id=user_id)
+
+
+@shared_task(
+    ignore_result=True,
+    autoretry_for=TRANSIENT_ERRORS,
+    retry_backoff=True,
+    max_retries=5,
+)
+def request_records_curation(record_ids: list[str], user_id: str | None = None) -> None:
+    """Create curation requests for many records, e.g. when importing records.
+
+    Larger lists are split into chunks of ``CURATIONS_BULK_CREATE_CHUNK_SIZE``,
+    each of them processed by its own task in a single unit of work.
+    """
+    chunk_size = current_app.config["CURATIONS_BULK_CREATE_CHUNK_SIZE"]
+    if len(record_ids) > chunk_size:
+        for chunk in batched(record_ids, chunk_size):
+            request_records_curation.delay(list(chunk), user_id=user_id)
+        return
+
+    _create_curation_requests(record_ids, user_id)
+
+
+def _create_pending_curation_requests(
+    messages: list[Message],
+    user_id: str | None,
+) -> Exception | None:
+    """Create the curation requests for the queued records of a user.
+
+    The requests are created in one unit of work. If that fails, the records are
+    handled one by one, so that a failing record does not hold back the others.
+    The messages of records failing with a transient error are requeued and the
+    error is returned, the others are acknowledged (and their errors logged).
+    """
     try:
-        _curations_service.create(system_identity, topic=topic, user_id=user_id)
-    except OpenRecordCurationRequestAlreadyExistsError as ex:
-        # Request already exists. Just log the warning.
-        current_app.logger.warning(ex.description)
+        _create_curation_requests([m.payload["id"] for m in messages], user_id)
+    except TRANSIENT_ERRORS as e:
+        for message in messages:
+            message.requeue()
+        return e
+    except Exception:
+        if len(messages) > 1:
+            errors = [
+                _create_pending_curation_requests([message], user_id)
+                for message in messages
+            ]
+            return next((e for e in errors if e is not None), None)
+
+        current_app.logger.exception(
+            "Could not create the curation request for record %s",
+            messages[0].payload["id"],
+        )
+
+    for message in messages:
+        message.ack()
+    return None
+
+
+@shared_task(
+    ignore_result=True,
+    autoretry_for=TRANSIENT_ERRORS,
+    retry_backoff=True,
+    max_retries=5,
+)
+def process_pending_curations() -> None:
+    """Create the curation requests for all queued records.
+
+    Consumes up to ``CURATIONS_BULK_CREATE_CHUNK_SIZE`` queued records, grouped by
+    the requesting user. The records failing with a transient error are put back
+    into the queue to be picked up by the retry, records failing otherwise are
+    dropped.
+    """
+    # allow new submissions to schedule another run from now on
+    current_cache.delete(_PENDING_SCHEDULED_KEY)
+    max_items = current_app.config["CURATIONS_BULK_CREATE_CHUNK_SIZE"]
+
+    with current_celery_app.pool.acquire(block=True) as connection:
+        queue = _pending_queue(connection)
+        messages = []
+        try:
+            while len(messages) < max_items:
+                messages.append(queue.get_nowait())
+        except queue.Empty:
+            pass
+
+        messages_per_user: dict[str | None, list[Message]] = defaultdict(list)
+        for message in messages:
+            messages_per_user[message.payload["user_id"]].append(message)
+
+        try:
+            errors = [
+                _create_pending_curation_requests(user_messages, user_id)
+                for user_id, user_messages in messages_per_user.items()
+            ]
+        finally:
+            queue.close()
+
+    error = next((e for e in errors if e is not None), None)
+    if error is not None:
+        raise error
+
+    # more records might be waiting than handled in one go
+    if len(messages) == max_items:
+        process_pending_curations.delay()
+
+
+def schedule_request_title_sync(request_id: str, record_id: str) -> None:
+    """Schedule the synchronization of a request's title with its draft's title.
+
+    All title changes within ``CURATIONS_TITLE_SYNC_DELAY`` seconds are handled by
+    a single execution of :func:`sync_request_title`.
+    """
+    delay = current_app.config["CURATIONS_TITLE_SYNC_DELAY"]
+    key = _TITLE_SYNC_SCHEDULED_KEY.format(request_id=request_id)
+    if current_cache.add(key, 1, timeout=delay * 2):
+        sync_request_title.apply_async(args=[request_id, record_id], countdown=delay)
+
+
+@shared_task(
+    ignore_result=True,
+    autoretry_for=TRANSIENT_ERRORS,
+    retry_backoff=True,
+    max_retries=5,
+)
+def sync_request_title(request_id: str, record_id: str) -> None:
+    """Update the title of a curation request to the latest title of its draft."""
+    # allow later title changes to schedule another run from now on
+    current_cache.delete(_TITLE_SYNC_SCHEDULED_KEY.format(request_id=request_id))
+
+    from invenio_rdm_records.records.api import RDMDraft
+    from invenio_requests.proxies import current_requests_service
+
+    draft = RDMDraft.pid.resolve(record_id, registered_only=False)
+    request = current_requests_service.read(system_identity, request_id)
+
+    _curations_service: CurationRequestService = unproxy(current_curations_service)
+    _curations_service.update_title(request.to_dict(), draft)
+
+
+@shared_task(ignore_result=True)
+def expire_stale_curation_requests(*, dry_run: bool = False) -> None:
+    """Expire curation requests without activity for ``CURATIONS_EXPIRE_AFTER``."""
+    expire_after = current_app.config["CURATIONS_EXPIRE_AFTER"]
+    if not expire_after:
+        return
+
+    _curations_service: CurationRequestService = unproxy(current_curations_service)
+    result = _curations_service.expire_stale(
+        datetime.now(UTC) - expire_after,
+        batch_size=current_app.config["CURATIONS_EXPIRE_BATCH_SIZE"],
+        dry_run=dry_run,
+    )
+
+    ids = ", ".join(hit["id"] for hit in result["hits"])
+    if dry_run:
+        current_app.logger.info("Stale curation requests to expire: %s", ids)
+    else:
+        current_app.logger.info("Expired stale curation requests: %s", ids)
+
+    for error in result["errors"]:
+        current_app.logger.warning(
+            "Could not expire curation request %s: %s",
+            error["id"],
+            error["message"],
+        )
+
+
+@shared_task(ignore_result=True)
+def send_curation_digests() -> None:
+    """Send the buffered curation notifications as one digest per curator."""
+    from .notifications.backends import send_digests
+
+    result = send_digests()
+    db.session.commit()
+    current_app.logger.info(
+        "Sent %s curation digests, %s failed.",
+        result["sent"],
+        result["failed"],
+    )
+
+
+def schedule_outbox_dispatch() -> None:
+    """Schedule the dispatching of the outbox, once per ``CURATIONS_OUTBOX_DELAY``."""
+    delay = current_app.config["CURATIONS_OUTBOX_DELAY"]
+    if current_cache.add(_OUTBOX_SCHEDULED_KEY, 1, timeout=delay * 2):
+        dispatch_curation_outbox.apply_async(countdown=delay)
+
+
+@shared_task(
+    ignore_result=True,
+    autoretry_for=TRANSIENT_ERRORS,
+    retry_backoff=True,
+    max_retries=5,
+)
+def dispatch_curation_outbox() -> None:
+    """Dispatch the curation notifications written to the outbox, in batches."""
+    from .notifications.outbox import dispatch_outbox
+
+    # allow new events to schedule another run from now on
+    current_cache.delete(_OUTBOX_SCHEDULED_KEY)
+    batch_size = current_app.config["CURATIONS_OUTBOX_BATCH_SIZE"]
+
+    # more events might be waiting than handled in one go
+    if dispatch_outbox(batch_size) == batch_size:
+        dispatch_curation_outbox.delay()
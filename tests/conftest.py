@@ -11,9 +11,18 @@ See https://pytest-invenio.readthedocs.io/ for documentation on which test
 fixtures are available.
 """
 
+from collections.abc import Callable, Iterator
+from contextlib import AbstractContextManager, contextmanager
+from typing import Any
+
 import pytest
 from flask_principal import Identity, Need, RoleNeed, UserNeed
 from flask_security.utils import hash_password
+from flask_webpackext.manifest import (
+    JinjaManifest,
+    JinjaManifestEntry,
+    JinjaManifestLoader,
+)
 from invenio_access.permissions import system_identity
 from invenio_accounts.models import Role
 from invenio_accounts.proxies import current_datastore
@@ -24,21 +33,48 @@ from invenio_pidstore.errors import PIDDoesNotExistError
 from invenio_rdm_records import config
 from invenio_rdm_records.services.components import DefaultRecordsComponents
 from invenio_records_resources.services.records.results import RecordItem
+from invenio_search import current_search_client
 from invenio_vocabularies.proxies import current_service as vocabulary_service
+from sqlalchemy import event
 
-from invenio_curations.services.components import CurationComponent
+from invenio_curations.metrics import QueryCount, count_queries
+from invenio_curations.services.components import (
+    CurationComponent,
+    CurationSnapshotComponent,
+)
 from invenio_curations.services.permissions import (
     CurationRDMRecordPermissionPolicy,
     CurationRDMRequestsPermissionPolicy,
 )
 
 
+class MockJinjaManifest(JinjaManifest):
+    """Manifest with entries for all assets, to render pages without built assets."""
+
+    def __getitem__(self, key: str) -> JinjaManifestEntry:
+        """Get a manifest entry for the asset."""
+        return JinjaManifestEntry(key, [key])
+
+    def __getattr__(self, name: str) -> JinjaManifestEntry:
+        """Get a manifest entry for the asset."""
+        return self[name]
+
+
+class MockManifestLoader(JinjaManifestLoader):
+    """Manifest loader for the pages rendered in the tests."""
+
+    def load(self, filepath: str) -> MockJinjaManifest:  # noqa: ARG002
+        """Load the mock manifest."""
+        return MockJinjaManifest()
+
+
 @pytest.fixture(scope="module")
 def app_config(app_config):
     """Application config override."""
     # Generic configs
     app_config["THEME_FRONTPAGE"] = False
     app_config["REST_CSRF_ENABLED"] = False
+    app_config["WEBPACKEXT_MANIFEST_LOADER"] = MockManifestLoader
 
     # Curation Specific configs
     app_config["CURATIONS_PRIVILEGED_ROLES"] = ["administration", "bypass-curation"]
@@ -68,7 +104,9 @@ def app_config(app_config):
     app_config["RECORDS_REFRESOLVER_STORE"] = (
         "invenio_jsonschemas.proxies.current_refresolver_store"
     )
-    app_config["RDM_RECORDS_SERVICE_COMPONENTS"] = DefaultRecordsComponents + [
+    app_config["RDM_RECORDS_SERVICE_COMPONENTS"] = [
+        CurationSnapshotComponent,
+        *DefaultRecordsComponents,
         CurationComponent,
     ]
     app_config["RDM_COMMUNITY_REQUIRED_TO_PUBLISH"] = False
@@ -275,3 +313,74 @@ def community_simple(com_owner_identity, minimal_community):
 def community_bypass(bypass_curation_identity, minimal_community):
     """Get the community with the bypass-curation owner."""
     return _community_get_or_create(minimal_community, bypass_curation_identity)
+
+
+@pytest.fixture
+def query_budget(
+    app,
+    db,
+    monkeypatch,
+) -> Iterator[Callable[..., AbstractContextManager[tuple[QueryCount, QueryCount]]]]:
+    """Assert upper bounds for the queries issued within a block.
+
+    Counts the SQL statements sent to the database engine and the search requests
+    sent to the search engine's transport, as well as the search queries issued by
+    the curations service itself. Only the given budgets are asserted, without any
+    budget the block just measures e.g. a reference for relative budgets::
+
+        with query_budget() as (reference, _):
+            ...
+        with query_budget(db=reference.db + 1, search=reference.search):
+            ...
+    """
+    engine_counts: list[QueryCount] = []
+
+    def count_statement(*_: Any) -> None:
+        for count in engine_counts:
+            count.db += 1
+
+    transport = current_search_client.transport
+    perform_request = transport.perform_request
+
+    def counting_perform_request(method, url, *args: Any, **kwargs: Any) -> Any:
+        if url.split("?")[0].endswith(("_search", "_count", "_msearch")):
+            for count in engine_counts:
+                count.search += 1
+        return perform_request(method, url, *args, **kwargs)
+
+    engine = db.engine
+    event.listen(engine, "before_cursor_execute", count_statement)
+    monkeypatch.setattr(transport, "perform_request", counting_perform_request)
+
+    @contextmanager
+    def budget(
+        *,
+        db: int | None = None,
+        search: int | None = None,
+        curation_search: int | None = None,
+    ) -> Iterator[tuple[QueryCount, QueryCount]]:
+        engine_count = QueryCount()
+        engine_counts.append(engine_count)
+        try:
+            with count_queries() as curations_count:
+                yield engine_count, curations_count
+        finally:
+            engine_counts.remove(engine_count)
+
+        if db is not None:
+            assert engine_count.db <= db, (
+                f"{engine_count.db} SQL statements issued, budget is {db}"
+            )
+        if search is not None:
+            assert engine_count.search <= search, (
+                f"{engine_count.search} search requests issued, budget is {search}"
+            )
+        if curation_search is not None:
+            assert curations_count.search <= curation_search, (
+                f"{curations_count.search} curation search queries issued, "
+                f"budget is {curation_search}"
+            )
+
+    yield budget
+
+    event.remove(engine, "before_cursor_execute", count_statement)
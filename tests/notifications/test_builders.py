@@ -0,0 +1,101 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (C) 2026 Graz University of Technology.
+#
+# Invenio-Curations is free software; you can redistribute it and/or modify it
+# under the terms of the MIT License; see LICENSE file for more details.
+
+"""Test the notification builders for curation requests."""
+
+from flask import render_template
+from invenio_notifications.models import Notification
+from invenio_notifications.proxies import current_notifications_manager
+from invenio_rdm_records.proxies import current_rdm_records
+from invenio_requests import current_requests_service
+from invenio_requests.records.api import Request
+
+from invenio_curations import current_curations_service
+from invenio_curations.notifications.builders import (
+    CurationRequestSubmitNotificationBuilder,
+)
+
+
+def test_notification_rendered_from_snapshot(
+    app,
+    db,
+    curator_role,
+    location,
+    simple_identity,
+    basic_record_data,
+):
+    """Test that the notification renders the request as it was when built."""
+    records_service = current_rdm_records.records_service
+    title = basic_record_data["metadata"]["title"]
+    draft = records_service.create(identity=simple_identity, data=basic_record_data)
+    req = current_curations_service.create(
+        identity=simple_identity,
+        data={"topic": {"record": draft.id}},
+    )
+
+    builder = CurationRequestSubmitNotificationBuilder
+    notification = builder.build(simple_identity, Request.get_record(req.id))
+
+    # the draft is changed and deleted (with its request) before the dispatch
+    data = {
+        **basic_record_data,
+        "metadata": {**basic_record_data["metadata"], "title": "Changed title"},
+    }
+    records_service.update_draft(simple_identity, draft.id, data)
+    records_service.delete_draft(simple_identity, draft.id)
+
+    notification = Notification(**notification.dumps())
+    for generator in builder.context:
+        notification = generator(notification)
+
+    snapshot = notification.context["request"]
+    assert snapshot["id"] == str(req.id)
+    assert snapshot["title"] == title
+    assert snapshot["topic"] == {"id": draft.id, "metadata": {"title": title}}
+
+    rendered = render_template(
+        f"invenio_notifications/{builder.type}.jinja",
+        notification=notification.dumps(),
+    )
+    assert f"The record '{title}' was submitted for curation" in rendered
+    assert "Changed title" not in rendered
+
+
+def test_notification_snapshot_after_action(
+    app,
+    db,
+    curator_role,
+    location,
+    simple_identity,
+    curator_identity,
+    basic_record_data,
+    monkeypatch,
+):
+    """Test that the snapshot holds the status of the request after the action."""
+    broadcast = []
+    monkeypatch.setattr(
+        current_notifications_manager,
+        "broadcast",
+        lambda notification, **__: broadcast.append(notification),
+    )
+    draft = current_rdm_records.records_service.create(
+        identity=simple_identity,
+        data=basic_record_data,
+    )
+    req = current_curations_service.create(
+        identity=simple_identity,
+        data={"topic": {"record": draft.id}},
+    )
+    current_requests_service.execute_action(curator_identity, req.id, "review")
+    current_requests_service.execute_action(curator_identity, req.id, "accept")
+
+    statuses = [(n.type, n.context["request"]["status"]) for n in broadcast]
+    assert statuses == [
+        ("curation-request.submit", "submitted"),
+        ("curation-request.review", "review"),
+        ("curation-request.accept", "accepted"),
+    ]
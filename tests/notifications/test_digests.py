@@ -0,0 +1,97 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (C) 2026 Graz University of Technology.
+#
+# Invenio-Curations is free software; you can redistribute it and/or modify it
+# under the terms of the MIT License; see LICENSE file for more details.
+
+"""Test the digests of curation notifications."""
+
+from uuid import uuid4
+
+from invenio_notifications.models import Notification, Recipient
+from invenio_users_resources.records.api import UserAggregate
+
+from invenio_curations.models import CurationDigestEntry
+from invenio_curations.notifications import backends
+from invenio_curations.notifications.backends import (
+    CurationDigestBackend,
+    caller_transaction,
+    send_digests,
+)
+
+
+def _notify(user_id: int, title: str) -> str:
+    request_id = str(uuid4())
+    notification = Notification(
+        type="curation-request.submit",
+        context={"request": {"id": request_id, "title": title}},
+    )
+    CurationDigestBackend().send(notification, Recipient(data={"id": str(user_id)}))
+    return request_id
+
+
+def test_send_digests(app, db, users, monkeypatch):
+    """Test that the notifications are sent as one digest per recipient."""
+    UserAggregate.index.refresh()
+    curator, other_curator = users[1], users[3]
+    sent = []
+    failing = {str(other_curator.id)}
+
+    def _send(self, notification, recipient) -> None:
+        if recipient.data["id"] in failing:
+            msg = "Mail server unavailable"
+            raise RuntimeError(msg)
+        sent.append(
+            (
+                recipient.data["id"],
+                [entry["title"] for entry in notification.context["entries"]],
+            ),
+        )
+
+    monkeypatch.setattr(backends.EmailNotificationBackend, "send", _send)
+
+    _notify(curator.id, "First")
+    _notify(other_curator.id, "Other")
+    _notify(curator.id, "Second")
+    # the recipient was deleted in the meantime
+    _notify(users[-1].id + 1000, "Nobody")
+
+    assert send_digests() == {"sent": 1, "failed": 1}
+    assert sent == [(str(curator.id), ["First", "Second"])]
+
+    # the sent and orphaned entries are cleared, the failed ones are kept
+    remaining = CurationDigestEntry.query.all()
+    assert [(e.user_id, e.title) for e in remaining] == [(other_curator.id, "Other")]
+
+    failing.clear()
+    assert send_digests() == {"sent": 1, "failed": 0}
+    assert sent[-1] == (str(other_curator.id), ["Other"])
+    assert CurationDigestEntry.query.count() == 0
+    assert send_digests() == {"sent": 0, "failed": 0}
+
+
+def test_digest_entries_committed_by_caller(app, db, users, monkeypatch):
+    """Test that the entries are only committed if the caller does not."""
+    UserAggregate.index.refresh()
+    commits = []
+    monkeypatch.setattr(db.session, "commit", lambda: commits.append(True))
+    monkeypatch.setattr(
+        backends.EmailNotificationBackend,
+        "send",
+        lambda *_: None,
+    )
+
+    # e.g. within a batch of the outbox
+    with caller_transaction():
+        _notify(users[1].id, "First")
+    assert commits == []
+
+    # e.g. in the notification worker
+    _notify(users[1].id, "Second")
+    assert len(commits) == 1
+    assert CurationDigestEntry.query.count() == len(["First", "Second"])
+
+    # the task sending the digests commits the cleared entries
+    assert send_digests() == {"sent": 1, "failed": 0}
+    assert len(commits) == 1
@@ -0,0 +1,49 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (C) 2026 Graz University of Technology.
+#
+# Invenio-Curations is free software; you can redistribute it and/or modify it
+# under the terms of the MIT License; see LICENSE file for more details.
+
+"""Test the cached role memberships."""
+
+from invenio_cache import current_cache
+from invenio_users_resources.records.api import UserAggregate
+
+from invenio_curations.notifications.members import (
+    _PRIVILEGED_KEY,
+    _ROLE_MEMBERS_KEY,
+    get_role_members,
+    is_user_privileged,
+)
+
+
+def test_role_membership_change_invalidates_cache(app, db, users, curator_role):
+    """Test that adding and removing role members invalidates the cached lookups."""
+    datastore = app.extensions["security"].datastore
+    curator = users[1]
+    members_key = _ROLE_MEMBERS_KEY.format(role_id=curator_role.id)
+    privileged_key = _PRIVILEGED_KEY.format(user_id=curator.id)
+    current_cache.delete(members_key)
+    current_cache.delete(privileged_key)
+    UserAggregate.index.refresh()
+
+    assert get_role_members(curator_role.id) == []
+    assert not is_user_privileged(curator.id, [curator_role.name])
+    assert current_cache.get(members_key) == []
+    assert current_cache.get(privileged_key) is False
+
+    datastore.add_role_to_user(curator, curator_role)
+    db.session.commit()
+
+    assert current_cache.get(members_key) is None
+    assert current_cache.get(privileged_key) is None
+    members = get_role_members(curator_role.id)
+    assert [member["id"] for member in members] == [str(curator.id)]
+    assert is_user_privileged(curator.id, [curator_role.name])
+
+    datastore.remove_role_from_user(curator, curator_role)
+    db.session.commit()
+
+    assert get_role_members(curator_role.id) == []
+    assert not is_user_privileged(curator.id, [curator_role.name])
@@ -0,0 +1,190 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (C) 2026 Graz University of Technology.
+#
+# Invenio-Curations is free software; you can redistribute it and/or modify it
+# under the terms of the MIT License; see LICENSE file for more details.
+
+"""Test the outbox of curation notifications."""
+
+from typing import Any
+from uuid import uuid4
+
+import pytest
+from invenio_cache import current_cache
+from invenio_notifications.models import Notification
+from invenio_rdm_records.proxies import current_rdm_records
+from invenio_requests import current_requests_service
+from sqlalchemy import event
+
+from invenio_curations import current_curations_service, tasks
+from invenio_curations.models import CurationOutboxEvent
+from invenio_curations.notifications import outbox
+from invenio_curations.notifications.outbox import dispatch_outbox
+from invenio_curations.tasks import _OUTBOX_SCHEDULED_KEY
+
+
+def _add_event(db, event_type: str, request_id: str) -> CurationOutboxEvent:
+    notification = Notification(
+        type=event_type,
+        context={"request": {"id": request_id, "status": "submitted"}},
+    )
+    outbox_event = CurationOutboxEvent(
+        event_type=event_type,
+        request_id=request_id,
+        payload=notification.dumps(),
+    )
+    db.session.add(outbox_event)
+    db.session.commit()
+    return outbox_event
+
+
+@pytest.fixture
+def broadcasts(monkeypatch):
+    """Record the broadcast notifications, failing for the requests in `failing`."""
+    broadcast = []
+    failing = set()
+
+    def _broadcast(notification, *, eager=False) -> None:
+        request_id = notification.context["request"]["id"]
+        if request_id in failing:
+            msg = "Mail server unavailable"
+            raise RuntimeError(msg)
+        broadcast.append((notification.type, request_id))
+
+    monkeypatch.setattr(outbox.current_notifications_manager, "broadcast", _broadcast)
+    return broadcast, failing
+
+
+@pytest.fixture
+def webhook_posts(app, monkeypatch):
+    """Record the events posted to the webhook."""
+    posts = []
+    monkeypatch.setitem(app.config, "CURATIONS_OUTBOX_WEBHOOK_URL", "http://hook")
+    monkeypatch.setattr(
+        outbox,
+        "_post_webhook",
+        lambda _url, event_type, events: posts.append(
+            (event_type, [(e["request"], e["status"]) for e in events]),
+        ),
+    )
+    return posts
+
+
+def test_dispatch_outbox(app, db, broadcasts, webhook_posts):
+    """Test that the latest of repeated events is dispatched and posted once."""
+    broadcast, _ = broadcasts
+    first, second = str(uuid4()), str(uuid4())
+    events = [
+        _add_event(db, "curation-request.submit", first),
+        _add_event(db, "curation-request.submit", first),
+        _add_event(db, "curation-request.review", second),
+    ]
+
+    statements = []
+
+    def _record_statement(conn, cursor, statement, *args: Any) -> None:
+        statements.append(statement)
+
+    event.listen(db.engine, "before_cursor_execute", _record_statement)
+    try:
+        assert dispatch_outbox(batch_size=10) == len(events)
+    finally:
+        event.remove(db.engine, "before_cursor_execute", _record_statement)
+
+    assert broadcast == [
+        ("curation-request.submit", first),
+        ("curation-request.review", second),
+    ]
+    # the status after the action, not the one in the notification's snapshot
+    assert webhook_posts == [
+        ("curation-request.submit", [(first, "submitted")]),
+        ("curation-request.review", [(second, "review")]),
+    ]
+    assert CurationOutboxEvent.query.count() == 0
+
+    # concurrent dispatchers skip the events locked by others
+    if db.engine.dialect.name == "postgresql":
+        assert any("FOR UPDATE SKIP LOCKED" in s for s in statements)
+
+
+def test_dispatch_outbox_retries(app, db, broadcasts, webhook_posts, monkeypatch):
+    """Test that failed events are retried up to the maximum attempts."""
+    max_attempts = 2
+    monkeypatch.setitem(app.config, "CURATIONS_OUTBOX_MAX_ATTEMPTS", max_attempts)
+    broadcast, failing = broadcasts
+    failed, succeeded = str(uuid4()), str(uuid4())
+    failing.add(failed)
+    failed_event = _add_event(db, "curation-request.submit", failed)
+    succeeded_event = _add_event(db, "curation-request.submit", succeeded)
+
+    assert dispatch_outbox(batch_size=10) == len([failed_event, succeeded_event])
+    assert broadcast == [("curation-request.submit", succeeded)]
+    assert webhook_posts == [("curation-request.submit", [(succeeded, "submitted")])]
+    assert CurationOutboxEvent.query.all() == [failed_event]
+    assert failed_event.attempts == 1
+
+    # retried until the maximum attempts are reached
+    assert dispatch_outbox(batch_size=10) == 1
+    assert failed_event.attempts == max_attempts
+
+    # given up, the event is kept for inspection
+    failing.clear()
+    assert dispatch_outbox(batch_size=10) == 0
+    assert broadcast == [("curation-request.submit", succeeded)]
+    assert CurationOutboxEvent.query.all() == [failed_event]
+
+
+def test_outbox_written_by_actions(
+    app,
+    db,
+    curator_role,
+    location,
+    simple_identity,
+    curator_identity,
+    basic_record_data,
+    broadcasts,
+    webhook_posts,
+    monkeypatch,
+):
+    """Test that the notifications of actions are committed to the outbox."""
+    monkeypatch.setitem(app.config, "CURATIONS_NOTIFICATIONS_OUTBOX", value=True)
+    current_cache.delete(_OUTBOX_SCHEDULED_KEY)
+    scheduled = []
+    monkeypatch.setattr(
+        tasks.dispatch_curation_outbox,
+        "apply_async",
+        lambda **kwargs: scheduled.append(kwargs),
+    )
+    broadcast, _ = broadcasts
+
+    draft = current_rdm_records.records_service.create(
+        identity=simple_identity,
+        data=basic_record_data,
+    )
+    req = current_curations_service.create(
+        identity=simple_identity,
+        data={"topic": {"record": draft.id}},
+    )
+    current_requests_service.execute_action(curator_identity, req.id, "review")
+
+    # nothing was sent yet, the events were persisted with the actions
+    assert broadcast == []
+    assert len(scheduled) == 1
+    db.session.expire_all()
+    events = CurationOutboxEvent.query.order_by(CurationOutboxEvent.id).all()
+    assert [(e.event_type, str(e.request_id)) for e in events] == [
+        ("curation-request.submit", req.id),
+        ("curation-request.review", req.id),
+    ]
+
+    assert dispatch_outbox(batch_size=10) == len(events)
+    assert broadcast == [
+        ("curation-request.submit", req.id),
+        ("curation-request.review", req.id),
+    ]
+    assert webhook_posts == [
+        ("curation-request.submit", [(req.id, "submitted")]),
+        ("curation-request.review", [(req.id, "review")]),
+    ]
+    assert CurationOutboxEvent.query.count() == 0
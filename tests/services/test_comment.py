@@ -0,0 +1,62 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (C) 2026 Graz University of Technology.
+#
+# Invenio-Curations is free software; you can redistribute it and/or modify it
+# under the terms of the MIT License; see LICENSE file for more details.
+
+"""Test curation comments module."""
+
+from types import SimpleNamespace
+from typing import Any
+
+from invenio_access.permissions import system_identity
+from invenio_records_resources.services.errors import RevisionIdMismatchError
+from invenio_requests.proxies import current_events_service
+
+from invenio_curations.services.comment import CommentProcessor
+from invenio_curations.services.diff import DiffProcessorBase
+
+
+class StaticDiffProcessor(DiffProcessorBase):
+    """Diff processor rendering the number of diffs."""
+
+    def map_and_build_diffs(self, raw_diffs: list[tuple]) -> None:
+        """Store the diffs."""
+        self.raw_diffs = raw_diffs
+
+    def to_html(self, *args: Any) -> str:  # noqa: ARG002
+        """Render the number of diffs."""
+        return f"{len(self.raw_diffs)} changes"
+
+
+def test_comment_update_retries_on_conflict(app, monkeypatch):
+    """Test that a concurrently updated comment is read again and updated."""
+    event = {
+        "id": "event-id",
+        "type": "C",
+        "revision_id": 1,
+        "payload": {"content": "", "reference_draft": str({"title": "old"})},
+    }
+    updates = []
+
+    def update(identity, id_, data, revision_id=None) -> None:
+        updates.append(revision_id)
+        if revision_id == event["revision_id"]:
+            raise RevisionIdMismatchError(revision_id, revision_id + 1)
+
+    def read(identity, id_) -> SimpleNamespace:
+        return SimpleNamespace(to_dict=lambda: {**event, "revision_id": 2})
+
+    monkeypatch.setattr(current_events_service, "update", update)
+    monkeypatch.setattr(current_events_service, "read", read)
+
+    processor = CommentProcessor(system_identity, StaticDiffProcessor())
+    processor._compute_diff_and_update_event(  # noqa: SLF001
+        event,
+        {"title": "new"},
+        "resubmit",
+        [],
+    )
+
+    assert updates == [1, 2]
@@ -0,0 +1,118 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (C) 2026 Graz University of Technology.
+#
+# Invenio-Curations is free software; you can redistribute it and/or modify it
+# under the terms of the MIT License; see LICENSE file for more details.
+
+"""Test the curation service components."""
+
+from invenio_drafts_resources.services.records.components import ServiceComponent
+from invenio_rdm_records.proxies import current_rdm_records
+from invenio_requests import current_requests_service
+
+from invenio_curations import current_curations_service
+from invenio_curations.services.components import (
+    CurationSnapshotComponent,
+    _draft_snapshots,
+)
+
+
+def test_update_draft_snapshot(
+    app,
+    db,
+    curator_role,
+    location,
+    simple_identity,
+    curator_identity,
+    basic_record_data,
+    monkeypatch,
+):
+    """Test that the draft is compared to its state before the update."""
+    records_service = current_rdm_records.records_service
+    draft = records_service.create(identity=simple_identity, data=basic_record_data)
+    req = current_curations_service.create(
+        identity=simple_identity,
+        data={"topic": {"record": draft.id}},
+    )
+    current_requests_service.execute_action(curator_identity, req.id, "review")
+    current_requests_service.execute_action(curator_identity, req.id, "accept")
+
+    pid_field = records_service.draft_cls.pid
+    resolved = []
+    resolve = pid_field.resolve
+
+    def _resolve(pid_value, *args, **kwargs):  # noqa: ANN202, ANN002, ANN003
+        resolved.append(pid_value)
+        return resolve(pid_value, *args, **kwargs)
+
+    monkeypatch.setattr(pid_field, "resolve", _resolve)
+
+    # an unchanged draft does not need another review
+    records_service.update_draft(simple_identity, draft.id, basic_record_data)
+    # only the drafts service resolves the draft, not the curation component
+    assert resolved == [draft.id]
+    status = current_requests_service.read(simple_identity, req.id).data["status"]
+    assert status == "accepted"
+
+    data = {
+        **basic_record_data,
+        "metadata": {**basic_record_data["metadata"], "title": "Changed title"},
+    }
+    resolved.clear()
+    records_service.update_draft(simple_identity, draft.id, data)
+    assert resolved == [draft.id]
+    status = current_requests_service.read(simple_identity, req.id).data["status"]
+    assert status == "pending_resubmission"
+
+
+class InPlaceTitleComponent(ServiceComponent):
+    """Change the title of a draft in place, as well as in its stored data."""
+
+    def update_draft(
+        self,
+        identity,  # noqa: ARG002
+        data=None,
+        record=None,
+        errors=None,  # noqa: ARG002
+    ):
+        """Set the new title in the nested metadata shared with the model."""
+        record.model.json["metadata"]["title"] = data["metadata"]["title"]
+
+
+def test_update_draft_snapshot_before_components(
+    app,
+    db,
+    curator_role,
+    location,
+    simple_identity,
+    curator_identity,
+    basic_record_data,
+    monkeypatch,
+):
+    """Test that the snapshot is taken before the components change the draft."""
+    records_service = current_rdm_records.records_service
+    draft = records_service.create(identity=simple_identity, data=basic_record_data)
+    req = current_curations_service.create(
+        identity=simple_identity,
+        data={"topic": {"record": draft.id}},
+    )
+    current_requests_service.execute_action(curator_identity, req.id, "review")
+    current_requests_service.execute_action(curator_identity, req.id, "accept")
+
+    components = app.config["RDM_RECORDS_SERVICE_COMPONENTS"]
+    assert components[0] is CurationSnapshotComponent
+    monkeypatch.setitem(
+        app.config,
+        "RDM_RECORDS_SERVICE_COMPONENTS",
+        [components[0], InPlaceTitleComponent, *components[1:]],
+    )
+
+    data = {
+        **basic_record_data,
+        "metadata": {**basic_record_data["metadata"], "title": "Changed title"},
+    }
+    records_service.update_draft(simple_identity, draft.id, data)
+    status = current_requests_service.read(simple_identity, req.id).data["status"]
+    assert status == "pending_resubmission"
+    assert _draft_snapshots.get() == {}
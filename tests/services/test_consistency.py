@@ -0,0 +1,88 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (C) 2026 Graz University of Technology.
+#
+# Invenio-Curations is free software; you can redistribute it and/or modify it
+# under the terms of the MIT License; see LICENSE file for more details.
+
+"""Test the consistency checks of curation requests."""
+
+from invenio_access.permissions import system_identity
+from invenio_pidstore.models import PersistentIdentifier, PIDStatus
+from invenio_rdm_records.proxies import current_rdm_records
+from invenio_rdm_records.records.api import RDMDraft
+from invenio_requests import current_requests_service
+from invenio_requests.records.api import Request
+from invenio_requests.records.models import RequestMetadata
+
+from invenio_curations import current_curations_service
+from invenio_curations.requests import CurationRequest
+from invenio_curations.services.consistency import CurationConsistencyChecker
+
+
+def _request_ids(db) -> set[str]:
+    return {str(id_) for (id_,) in db.session.query(RequestMetadata.id)}
+
+
+def test_check_and_repair(
+    app,
+    db,
+    curator_role,
+    location,
+    simple_identity,
+    basic_record_data,
+    users,
+):
+    """Test that orphaned and duplicate requests are found and deleted."""
+    drafts, requests = [], []
+    for _ in range(3):
+        draft = current_rdm_records.records_service.create(
+            identity=simple_identity,
+            data=basic_record_data,
+        )
+        drafts.append(draft)
+        requests.append(
+            current_curations_service.create(
+                identity=simple_identity,
+                data={"topic": {"record": draft.id}},
+            ),
+        )
+    orphaned, tombstoned, tracked = requests
+
+    # the draft was deleted bypassing the service
+    db.session.delete(PersistentIdentifier.get("recid", drafts[0].id))
+    # the record was deleted, its request holds the review history
+    PersistentIdentifier.get("recid", drafts[1].id).status = PIDStatus.DELETED
+    # a second open request created bypassing the curations service
+    duplicate = current_requests_service.create(
+        system_identity,
+        {"title": "Duplicate"},
+        CurationRequest,
+        curator_role,
+        creator=users[0],
+        topic=RDMDraft.pid.resolve(drafts[2].id, registered_only=False),
+    )
+    db.session.commit()
+    Request.index.refresh()
+
+    checker = CurationConsistencyChecker(app, batch_size=1, workers=1)
+    report = checker.check()
+
+    assert report.orphaned == [orphaned.id]
+    assert report.tombstoned == [tombstoned.id]
+    assert report.duplicates == {drafts[2].id: [tracked.id, duplicate.id]}
+    assert report.untracked == {duplicate.id: ("record", drafts[2].id)}
+
+    # checking is a dry run
+    assert {orphaned.id, tombstoned.id, duplicate.id} <= _request_ids(db)
+
+    assert checker.repair(report) == {}
+    remaining = _request_ids(db)
+    assert {tombstoned.id, tracked.id} <= remaining
+    assert orphaned.id not in remaining
+    assert duplicate.id not in remaining
+
+    # the requests of deleted records are only deleted on request
+    assert checker.repair(checker.check(), delete_tombstoned=True) == {}
+    assert tombstoned.id not in _request_ids(db)
+    assert tracked.id in _request_ids(db)
@@ -0,0 +1,75 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (C) 2026 Graz University of Technology.
+#
+# Invenio-Curations is free software; you can redistribute it and/or modify it
+# under the terms of the MIT License; see LICENSE file for more details.
+
+"""Test the curation permission generators."""
+
+from invenio_rdm_records.proxies import current_rdm_records
+from invenio_rdm_records.records.api import RDMDraft
+from invenio_requests import current_requests_service
+
+from invenio_curations import current_curations_service
+
+ACTIONS = ["preview", "view", "read", "read_files", "read_draft", "draft_read_files"]
+
+
+def test_curation_condition_evaluated_once_per_request(
+    app,
+    db,
+    curator_role,
+    location,
+    simple_identity,
+    curator_identity,
+    basic_record_data,
+    monkeypatch,
+):
+    """Test that all permission checks of a request share the curation lookup."""
+    records_service = current_rdm_records.records_service
+    draft = records_service.create(identity=simple_identity, data=basic_record_data)
+    req = current_curations_service.create(
+        identity=simple_identity,
+        data={"topic": {"record": draft.id}},
+    )
+    record = RDMDraft.pid.resolve(draft.id, registered_only=False)
+
+    reviews = []
+    get_review = current_curations_service.get_review
+
+    def _get_review(identity, topic, **kwargs):  # noqa: ANN202, ANN003
+        reviews.append(topic["id"])
+        return get_review(identity, topic, **kwargs)
+
+    monkeypatch.setattr(current_curations_service, "get_review", _get_review)
+
+    def _check_permissions() -> None:
+        for action in ACTIONS:
+            assert records_service.check_permission(
+                curator_identity,
+                action,
+                record=record,
+            )
+
+    with app.test_request_context():
+        _check_permissions()
+        assert reviews == [draft.id]
+
+        # the cached evaluation is dropped when the curation request changes
+        current_requests_service.execute_action(curator_identity, req.id, "review")
+        reviews.clear()
+        _check_permissions()
+        assert reviews == [draft.id]
+
+    # outside of a request, each permission check looks the curation request up
+    reviews.clear()
+    _check_permissions()
+    assert len(reviews) >= len(ACTIONS)
+
+    # the cache can be disabled
+    monkeypatch.setitem(app.config, "CURATIONS_PERMISSIONS_CACHE", value=False)
+    reviews.clear()
+    with app.test_request_context():
+        _check_permissions()
+    assert len(reviews) >= len(ACTIONS)
@@ -0,0 +1,195 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (C) 2026 Graz University of Technology.
+#
+# Invenio-Curations is free software; you can redistribute it and/or modify it
+# under the terms of the MIT License; see LICENSE file for more details.
+
+"""Query budgets of curation operations.
+
+Regressions in this package typically show up as additional queries per request
+(e.g. another permission generator calling ``get_review``). The overall number of
+queries mostly depends on InvenioRDM itself, hence the budgets are relative to a
+reference: the same operation without curations, or by a user not curating. They
+bound the SQL statements sent to the database engine and the search requests sent
+to the search engine, as well as the searches of the curations service.
+"""
+
+from collections.abc import Iterator
+from contextlib import contextmanager
+
+import pytest
+from invenio_rdm_records.proxies import current_rdm_records
+from invenio_requests import current_requests_service
+from invenio_requests.records.api import Request
+from invenio_search.engine import dsl
+
+from invenio_curations import current_curations_service
+from invenio_curations.services.components import (
+    CurationComponent,
+    CurationSnapshotComponent,
+)
+
+CURATOR_CHECK_STATEMENTS = 2
+"""SQL statements looking up if a user is privileged, until the result is cached."""
+
+
+@contextmanager
+def without_curation_component(app) -> Iterator[None]:
+    """Use the records service without the curation components."""
+    components = app.config["RDM_RECORDS_SERVICE_COMPONENTS"]
+    app.config["RDM_RECORDS_SERVICE_COMPONENTS"] = [
+        component
+        for component in components
+        if component not in {CurationComponent, CurationSnapshotComponent}
+    ]
+    try:
+        yield
+    finally:
+        app.config["RDM_RECORDS_SERVICE_COMPONENTS"] = components
+
+
+@pytest.fixture
+def draft_under_curation(simple_identity, curator_role, basic_record_data):
+    """Factory of drafts with an open curation request."""
+
+    def create() -> tuple:
+        draft = current_rdm_records.records_service.create(
+            identity=simple_identity,
+            data=basic_record_data,
+        )
+        request = current_curations_service.create(
+            identity=simple_identity,
+            data={"topic": {"record": draft.id}},
+        )
+        Request.index.refresh()
+        return draft, request
+
+    return create
+
+
+def test_publish_query_budget(
+    app,
+    db,
+    location,
+    simple_identity,
+    curator_identity,
+    basic_record_data,
+    draft_under_curation,
+    query_budget,
+):
+    """Publishing an accepted draft reads the stored acceptance only."""
+    reference_draft = current_rdm_records.records_service.create(
+        identity=simple_identity,
+        data=basic_record_data,
+    )
+    with without_curation_component(app), query_budget() as (reference, _):
+        current_rdm_records.records_service.publish(
+            simple_identity,
+            reference_draft.id,
+        )
+
+    draft, request = draft_under_curation()
+    current_requests_service.execute_action(curator_identity, request.id, "review")
+    current_requests_service.execute_action(curator_identity, request.id, "accept")
+    Request.index.refresh()
+
+    # one statement for the acceptance stored with the topic of the request
+    with query_budget(
+        db=reference.db + 1,
+        search=reference.search,
+        curation_search=0,
+    ):
+        current_rdm_records.records_service.publish(simple_identity, draft.id)
+
+
+def test_update_draft_query_budget(
+    app,
+    db,
+    location,
+    simple_identity,
+    draft_under_curation,
+    basic_record_data,
+    query_budget,
+):
+    """Saving a draft under curation looks up the request with a single search."""
+    data = {
+        **basic_record_data,
+        "metadata": {
+            **basic_record_data["metadata"],
+            "description": "Updated description",
+        },
+    }
+    reference_draft, _ = draft_under_curation()
+    with without_curation_component(app), query_budget() as (reference, _):
+        current_rdm_records.records_service.update_draft(
+            simple_identity,
+            reference_draft.id,
+            data,
+        )
+
+    draft, _ = draft_under_curation()
+    with query_budget(
+        db=reference.db + CURATOR_CHECK_STATEMENTS,
+        search=reference.search + 1,
+        curation_search=1,
+    ):
+        current_rdm_records.records_service.update_draft(
+            simple_identity,
+            draft.id,
+            data,
+        )
+
+
+def test_read_draft_as_moderator_query_budget(
+    app,
+    db,
+    location,
+    simple_identity,
+    curator_identity,
+    draft_under_curation,
+    query_budget,
+):
+    """Reading a draft as a moderator costs as much as reading it as its owner."""
+    draft, _ = draft_under_curation()
+
+    with app.test_request_context(), query_budget() as (reference, _):
+        current_rdm_records.records_service.read_draft(
+            simple_identity,
+            draft.id,
+        ).to_dict()
+
+    # the curation request is looked up once, for all permission checks
+    with (
+        app.test_request_context(),
+        query_budget(
+            db=reference.db + CURATOR_CHECK_STATEMENTS,
+            search=reference.search,
+            curation_search=1,
+        ),
+    ):
+        current_rdm_records.records_service.read_draft(
+            curator_identity,
+            draft.id,
+        ).to_dict()
+
+
+def test_search_curation_queue_query_budget(
+    app,
+    db,
+    location,
+    curator_identity,
+    draft_under_curation,
+    query_budget,
+):
+    """Listing the curation queue costs as much as searching the requests."""
+    draft_under_curation()
+
+    with query_budget() as (reference, _):
+        current_requests_service.search(
+            curator_identity,
+            extra_filter=dsl.Q("term", type="rdm-curation"),
+        ).to_dict()
+
+    with query_budget(db=reference.db, search=1, curation_search=1):
+        current_curations_service.search(curator_identity).to_dict()
@@ -7,14 +7,36 @@
 
 """Test curation services module."""
 
+from datetime import UTC, datetime, timedelta
+from uuid import uuid4
+
 import pytest
+from flask_principal import Identity, RoleNeed, UserNeed
+from invenio_access.permissions import system_identity
+from invenio_cache import current_cache
 from invenio_rdm_records.proxies import current_rdm_records
+from invenio_rdm_records.records.api import RDMDraft
 from invenio_rdm_records.requests import CommunitySubmission
 from invenio_records_resources.services.errors import PermissionDeniedError
 from invenio_requests import current_request_type_registry, current_requests_service
+from invenio_requests.customizations.event_types import CommentEventType
 from invenio_requests.errors import CannotExecuteActionError
+from invenio_requests.proxies import current_events_service
+from invenio_requests.records.api import Request
+from invenio_requests.records.models import RequestEventModel, RequestMetadata
+from marshmallow import ValidationError
+from sqlalchemy.orm.exc import NoResultFound
 
-from invenio_curations import current_curations_service
+from invenio_curations import current_curations_service, models
+from invenio_curations.models import CurationTransition
+from invenio_curations.services.errors import (
+    CurationClaimNotHeldError,
+    CurationRequestClaimedError,
+    NoUnclaimedCurationRequestError,
+    OpenRecordCurationRequestAlreadyExistsError,
+)
+from invenio_curations.services.service import _WORKLOAD_KEY
+from invenio_curations.services.utils import is_identity_privileged
 
 
 def test_create_curation_request(
@@ -41,6 +63,65 @@ def test_create_curation_request(
     assert res.data["type"] == "rdm-curation"
 
 
+def test_create_curation_request_unique_per_topic(
+    app,
+    db,
+    curator_role,
+    location,
+    simple_identity,
+    basic_record_data,
+):
+    """Test that only one curation request is created per topic."""
+    draft = current_rdm_records.records_service.create(
+        identity=simple_identity,
+        data=basic_record_data,
+    )
+    res = current_curations_service.create(
+        identity=simple_identity,
+        data={"topic": {"record": draft.id}},
+    )
+
+    # no index refresh in between, the database ensures the uniqueness
+    with pytest.raises(OpenRecordCurationRequestAlreadyExistsError):
+        current_curations_service.create(
+            identity=simple_identity,
+            data={"topic": {"record": draft.id}},
+        )
+
+    existing = current_curations_service.create(
+        identity=simple_identity,
+        data={"topic": {"record": draft.id}},
+        exist_ok=True,
+    )
+    assert existing.id == res.id
+
+
+def test_update_curation_request_title(
+    app,
+    db,
+    curator_role,
+    location,
+    simple_identity,
+    basic_record_data,
+):
+    """Test that the request title is only written if it changed."""
+    draft = current_rdm_records.records_service.create(
+        identity=simple_identity,
+        data=basic_record_data,
+    )
+    request = current_curations_service.create(
+        identity=simple_identity,
+        data={"topic": {"record": draft.id}},
+    ).to_dict()
+
+    assert not current_curations_service.update_title(request, draft.to_dict())
+
+    updated_draft = {"id": draft.id, "metadata": {"title": "New title"}}
+    assert current_curations_service.update_title(request, updated_draft)
+    request = current_requests_service.read(system_identity, request["id"]).to_dict()
+    assert request["title"] == "RDM Curation: New title"
+
+
 def test_curation_basic_flow(
     app,
     db,
@@ -172,6 +253,35 @@ def test_curation_permissions_non_community(
         )
 
 
+def test_self_assigned_receiver_cannot_accept(
+    app,
+    db,
+    curator_role,
+    location,
+    simple_identity,
+    basic_record_data,
+):
+    """Test that submitters cannot choose themselves as the receiver."""
+    draft = current_rdm_records.records_service.create(
+        identity=simple_identity,
+        data=basic_record_data,
+    )
+    req = current_curations_service.create(
+        identity=simple_identity,
+        data={
+            "topic": {"record": draft.id},
+            "receiver": {"user": str(simple_identity.id)},
+        },
+    )
+    assert "user" not in req.data["receiver"]
+
+    with pytest.raises(PermissionDeniedError):
+        current_requests_service.execute_action(simple_identity, req.id, "review")
+
+    with pytest.raises(PermissionDeniedError):
+        current_requests_service.execute_action(simple_identity, req.id, "accept")
+
+
 def test_curation_permissions_community_w_curations(
     app,
     db,
@@ -274,3 +384,750 @@ def test_curation_permissions_community_wo_curations(
         com_req.id,
         "accept",
     )
+
+
+def test_curation_stats(
+    app,
+    db,
+    curator_role,
+    location,
+    simple_identity,
+    curator_identity,
+    basic_record_data,
+):
+    """Test the aggregated curation queue statistics."""
+    draft = current_rdm_records.records_service.create(
+        identity=simple_identity,
+        data=basic_record_data,
+    )
+    current_curations_service.create(
+        identity=simple_identity,
+        data={"topic": {"record": draft.id}},
+    )
+    Request.index.refresh()
+
+    with pytest.raises(PermissionDeniedError):
+        current_curations_service.get_stats(simple_identity)
+
+    stats = current_curations_service.get_stats(curator_identity)
+
+    assert stats["total"] >= 1
+    assert stats["status"]["submitted"] >= 1
+    assert stats["open"]["total"] >= 1
+    assert sum(stats["open"]["age"].values()) == stats["open"]["total"]
+    assert stats["transitions"]["created->submitted"]["count"] >= 1
+
+
+def test_curation_transition_metrics(
+    app,
+    db,
+    curator_role,
+    location,
+    simple_identity,
+    curator_identity,
+    basic_record_data,
+    monkeypatch,
+):
+    """Test the durations and histograms of the status transitions."""
+    clock = [datetime(2100, 1, 1)]  # noqa: DTZ001
+    monkeypatch.setattr(models, "utcnow", lambda: clock[0])
+    monkeypatch.setitem(app.config, "CURATIONS_TRANSITION_BUCKETS", [60, 3600])
+
+    draft = current_rdm_records.records_service.create(
+        identity=simple_identity,
+        data=basic_record_data,
+    )
+    req = current_curations_service.create(
+        identity=simple_identity,
+        data={"topic": {"record": draft.id}},
+    )
+    for seconds, identity, action in [
+        (30, curator_identity, "review"),
+        (1800, curator_identity, "critique"),
+        (7200, simple_identity, "resubmit"),
+        (10, curator_identity, "review"),
+    ]:
+        clock[0] += timedelta(seconds=seconds)
+        current_requests_service.execute_action(identity, req.id, action)
+
+    # the first transition of a request without a start time has no duration
+    CurationTransition.record(uuid4(), None, "submitted")
+    CurationTransition.record(
+        uuid4(),
+        None,
+        "submitted",
+        since=clock[0] - timedelta(seconds=5),
+    )
+
+    transitions = (
+        CurationTransition.query.filter_by(request_id=req.id)
+        .order_by(CurationTransition.created)
+        .all()
+    )
+    assert [(t.status_from, t.status_to) for t in transitions] == [
+        ("created", "submitted"),
+        ("submitted", "review"),
+        ("review", "critiqued"),
+        ("critiqued", "resubmitted"),
+        ("resubmitted", "review"),
+    ]
+    # the first transition took from the creation of the request until 2100
+    assert [t.duration for t in transitions[1:]] == [30, 1800, 7200, 10]
+
+    histograms = current_curations_service.get_stats(curator_identity)["transitions"]
+    assert {key: h["buckets"] for key, h in histograms.items()} == {
+        "created->submitted": {"60": 0, "3600": 0, "+Inf": 1},
+        "submitted->review": {"60": 1, "3600": 1, "+Inf": 1},
+        "review->critiqued": {"60": 0, "3600": 1, "+Inf": 1},
+        "critiqued->resubmitted": {"60": 0, "3600": 0, "+Inf": 1},
+        "resubmitted->review": {"60": 1, "3600": 1, "+Inf": 1},
+        "None->submitted": {"60": 1, "3600": 1, "+Inf": 1},
+    }
+    assert histograms["submitted->review"]["sum"] == 30  # noqa: PLR2004
+    assert histograms["None->submitted"] == {
+        "count": 1,
+        "sum": 5,
+        "buckets": {"60": 1, "3600": 1, "+Inf": 1},
+    }
+
+
+def test_curation_bulk_action(
+    app,
+    db,
+    curator_role,
+    location,
+    simple_identity,
+    curator_identity,
+    basic_record_data,
+    monkeypatch,
+):
+    """Test executing an action on many curation requests at once."""
+    request_ids = []
+    for _ in range(2):
+        draft = current_rdm_records.records_service.create(
+            identity=simple_identity,
+            data=basic_record_data,
+        )
+        req = current_curations_service.create(
+            identity=simple_identity,
+            data={"topic": {"record": draft.id}},
+        )
+        request_ids.append(req.id)
+
+    indexer_cls = type(current_requests_service.indexer)
+    indexed, bulk_indexed = [], []
+    monkeypatch.setattr(
+        indexer_cls,
+        "index",
+        lambda _, record, **__: indexed.append(str(record.id)),
+    )
+    monkeypatch.setattr(
+        indexer_cls,
+        "bulk_index",
+        lambda _, ids: bulk_indexed.append(list(ids)),
+    )
+
+    res = current_curations_service.bulk_execute_action(
+        curator_identity,
+        "review",
+        {"ids": [*request_ids, "not-a-uuid"]},
+    )
+
+    assert {hit["id"] for hit in res["hits"]} == set(request_ids)
+    assert all(hit["status"] == "review" for hit in res["hits"])
+    assert [error["id"] for error in res["errors"]] == ["not-a-uuid"]
+    # the requests are indexed with a single bulk request
+    assert not set(indexed) & set(request_ids)
+    assert bulk_indexed == [[hit["id"] for hit in res["hits"]]]
+
+    # the accept action is only allowed from "review"
+    res = current_curations_service.bulk_execute_action(
+        curator_identity,
+        "accept",
+        {"ids": request_ids[:1]},
+    )
+    assert res["hits"] == [{"id": request_ids[0], "status": "accepted"}]
+
+    res = current_curations_service.bulk_execute_action(
+        curator_identity,
+        "review",
+        {"ids": request_ids},
+    )
+    assert res["hits"] == []
+    assert len(res["errors"]) == len(request_ids)
+
+    # the IDs are required and limited in number
+    monkeypatch.setitem(app.config, "CURATIONS_BULK_ACTION_MAX_ITEMS", 1)
+    for data in [{}, {"ids": []}, {"ids": "not-a-list"}, {"ids": request_ids}]:
+        with pytest.raises(ValidationError):
+            current_curations_service.bulk_execute_action(
+                curator_identity,
+                "review",
+                data,
+            )
+
+
+def test_create_curation_requests_for_drafts(
+    app,
+    db,
+    curator_role,
+    location,
+    simple_identity,
+    basic_record_data,
+    users,
+):
+    """Test the creation of curation requests for many drafts."""
+    drafts = [
+        current_rdm_records.records_service.create(
+            identity=simple_identity,
+            data=basic_record_data,
+        )
+        for _ in range(3)
+    ]
+    current_curations_service.create(
+        identity=simple_identity,
+        data={"topic": {"record": drafts[0].id}},
+    )
+
+    record_ids = [draft.id for draft in drafts]
+    res = current_curations_service.create_for_drafts(
+        system_identity,
+        [*record_ids, "does-not-exist"],
+        creator={"user": str(users[0].id)},
+    )
+
+    assert len(res["created"]) == len(drafts) - 1
+    assert res["existing"] == [drafts[0].id]
+    assert res["missing"] == ["does-not-exist"]
+
+
+def test_expire_stale_curation_requests(
+    app,
+    db,
+    curator_role,
+    location,
+    simple_identity,
+    basic_record_data,
+):
+    """Test expiring curation requests without activity."""
+    draft = current_rdm_records.records_service.create(
+        identity=simple_identity,
+        data=basic_record_data,
+    )
+    req = current_curations_service.create(
+        identity=simple_identity,
+        data={"topic": {"record": draft.id}},
+    )
+    Request.index.refresh()
+
+    # nothing is older than a week
+    res = current_curations_service.expire_stale(
+        datetime.now(UTC) - timedelta(days=7),
+    )
+    assert req.id not in [hit["id"] for hit in res["hits"]]
+
+    res = current_curations_service.expire_stale(
+        datetime.now(UTC) + timedelta(days=1),
+        dry_run=True,
+    )
+    assert req.id in [hit["id"] for hit in res["hits"]]
+    assert current_requests_service.read(simple_identity, req.id).data["status"] == (
+        "submitted"
+    )
+
+    res = current_curations_service.expire_stale(
+        datetime.now(UTC) + timedelta(days=1),
+    )
+    assert {"id": req.id, "status": "expired"} in res["hits"]
+
+
+def test_expire_stale_curation_requests_bulk_indexed(
+    app,
+    db,
+    curator_role,
+    location,
+    simple_identity,
+    basic_record_data,
+    monkeypatch,
+):
+    """Test that the expired requests are indexed with one bulk request per batch."""
+    request_ids = []
+    for _ in range(3):
+        draft = current_rdm_records.records_service.create(
+            identity=simple_identity,
+            data=basic_record_data,
+        )
+        req = current_curations_service.create(
+            identity=simple_identity,
+            data={"topic": {"record": draft.id}},
+        )
+        request_ids.append(req.id)
+    Request.index.refresh()
+
+    indexer_cls = type(current_requests_service.indexer)
+    indexed, bulk_indexed = [], []
+    monkeypatch.setattr(
+        indexer_cls,
+        "index",
+        lambda _, record, **__: indexed.append(str(record.id)),
+    )
+    monkeypatch.setattr(
+        indexer_cls,
+        "bulk_index",
+        lambda _, ids: bulk_indexed.append(list(ids)),
+    )
+
+    batch_size = 2
+    res = current_curations_service.expire_stale(
+        datetime.now(UTC) + timedelta(days=1),
+        batch_size=batch_size,
+    )
+
+    expired = [hit["id"] for hit in res["hits"]]
+    assert set(request_ids) <= set(expired)
+    assert not set(indexed) & set(request_ids)
+    assert [id_ for ids in bulk_indexed for id_ in ids] == expired
+    assert all(len(ids) <= batch_size for ids in bulk_indexed)
+
+
+def test_expire_stale_curation_requests_with_recent_comment(
+    app,
+    db,
+    curator_role,
+    location,
+    simple_identity,
+    basic_record_data,
+):
+    """Test that requests with an ongoing discussion are not expired."""
+    draft = current_rdm_records.records_service.create(
+        identity=simple_identity,
+        data=basic_record_data,
+    )
+    req = current_curations_service.create(
+        identity=simple_identity,
+        data={"topic": {"record": draft.id}},
+    )
+    comment = current_events_service.create(
+        simple_identity,
+        req.id,
+        {"payload": {"content": "Still working on it", "format": "html"}},
+        CommentEventType,
+    )
+
+    # the request itself was last updated long ago
+    long_ago = datetime.now(UTC).replace(tzinfo=None) - timedelta(days=30)
+    db.session.query(RequestMetadata).filter_by(id=req.id).update(
+        {"updated": long_ago},
+    )
+    db.session.commit()
+    current_requests_service.indexer.index(Request.get_record(req.id))
+    Request.index.refresh()
+
+    week_ago = datetime.now(UTC) - timedelta(days=7)
+    res = current_curations_service.expire_stale(week_ago, dry_run=True)
+    assert req.id not in [hit["id"] for hit in res["hits"]]
+
+    # without a recent comment, the discussion is abandoned
+    db.session.query(RequestEventModel).filter_by(id=comment.id).update(
+        {"created": long_ago, "updated": long_ago},
+    )
+    db.session.commit()
+    res = current_curations_service.expire_stale(week_ago)
+    assert {"id": req.id, "status": "expired"} in res["hits"]
+
+
+def test_accepted_records(
+    app,
+    db,
+    curator_role,
+    location,
+    simple_identity,
+    curator_identity,
+    basic_record_data,
+):
+    """Test checking the acceptance of many records at once."""
+    drafts = [
+        current_rdm_records.records_service.create(
+            identity=simple_identity,
+            data=basic_record_data,
+        )
+        for _ in range(2)
+    ]
+    requests = [
+        current_curations_service.create(
+            identity=simple_identity,
+            data={"topic": {"record": draft.id}},
+        )
+        for draft in drafts
+    ]
+    current_requests_service.execute_action(curator_identity, requests[0].id, "review")
+    current_requests_service.execute_action(curator_identity, requests[0].id, "accept")
+    Request.index.refresh()
+
+    record_ids = [draft.id for draft in drafts]
+    with current_curations_service.prefetch_acceptances(record_ids) as accepted:
+        assert accepted == {drafts[0].id}
+        assert current_curations_service.prefetched_acceptance(drafts[0].data)
+        assert not current_curations_service.prefetched_acceptance(drafts[1].data)
+
+    assert current_curations_service.prefetched_acceptance(drafts[0].data) is None
+
+
+def test_accepted_marker_published_record_edit(
+    app,
+    db,
+    curator_role,
+    location,
+    simple_identity,
+    curator_identity,
+    basic_record_data,
+):
+    """Test that the accepted revision is the one of the edited draft."""
+    records_service = current_rdm_records.records_service
+    draft = records_service.create(identity=simple_identity, data=basic_record_data)
+    req = current_curations_service.create(
+        identity=simple_identity,
+        data={"topic": {"record": draft.id}},
+    )
+    current_requests_service.execute_action(curator_identity, req.id, "review")
+    current_requests_service.execute_action(curator_identity, req.id, "accept")
+    records_service.publish(simple_identity, draft.id)
+
+    records_service.edit(simple_identity, draft.id)
+    data = {
+        **basic_record_data,
+        "metadata": {**basic_record_data["metadata"], "title": "Edited title"},
+    }
+    records_service.update_draft(simple_identity, draft.id, data)
+    current_requests_service.execute_action(simple_identity, req.id, "resubmit")
+    current_requests_service.execute_action(curator_identity, req.id, "review")
+    current_requests_service.execute_action(curator_identity, req.id, "accept")
+
+    # the topic resolves to the published record, with a different revision
+    edited_draft = RDMDraft.pid.resolve(draft.id, registered_only=False)
+    published_record = Request.get_record(req.id).topic.resolve()
+    assert published_record.revision_id != edited_draft.revision_id
+
+    assert current_curations_service.accepted_marker(edited_draft) is True
+    records_service.publish(simple_identity, draft.id)
+
+
+def test_get_review_summary(
+    app,
+    db,
+    curator_role,
+    location,
+    simple_identity,
+    basic_record_data,
+):
+    """Test looking up only the main fields of a curation request."""
+    draft = current_rdm_records.records_service.create(
+        identity=simple_identity,
+        data=basic_record_data,
+    )
+    record = RDMDraft.pid.resolve(draft.id, registered_only=False)
+    assert current_curations_service.get_review_summary(record) is None
+
+    req = current_curations_service.create(
+        identity=simple_identity,
+        data={"topic": {"record": draft.id}},
+    )
+    Request.index.refresh()
+
+    summary = current_curations_service.get_review_summary(record)
+    assert summary == {
+        "id": req.id,
+        "status": "submitted",
+        "is_open": True,
+        "title": req.data["title"],
+    }
+
+
+def test_is_identity_privileged(app, db, users):
+    """Test that the cached privileged decision follows role changes."""
+    user = users[0]
+    identity = Identity(user.id)
+    privileged_roles = current_curations_service.privileged_roles
+    assert not is_identity_privileged(privileged_roles, identity)
+
+    datastore = app.extensions["security"].datastore
+    role = datastore.find_or_create_role(name=privileged_roles[0])
+    datastore.add_role_to_user(user, role)
+    datastore.commit()
+    assert is_identity_privileged(privileged_roles, identity)
+
+    datastore.remove_role_from_user(user, role)
+    datastore.commit()
+    assert not is_identity_privileged(privileged_roles, identity)
+
+
+def test_claim_curation_requests(
+    app,
+    db,
+    curator_role,
+    location,
+    simple_identity,
+    curator_identity,
+    basic_record_data,
+    users,
+):
+    """Test that curators claim requests for their reviews."""
+    other_curator = Identity(users[3].id)
+    other_curator.provides.add(UserNeed(users[3].id))
+    other_curator.provides.add(RoleNeed(curator_role.id))
+
+    draft = current_rdm_records.records_service.create(
+        identity=simple_identity,
+        data=basic_record_data,
+    )
+    req = current_curations_service.create(
+        identity=simple_identity,
+        data={"topic": {"record": draft.id}},
+    )
+    Request.index.refresh()
+
+    claim = current_curations_service.claim_next(curator_identity)
+    assert claim["request_id"] == req.id
+    with pytest.raises(CurationRequestClaimedError):
+        current_curations_service.claim(other_curator, req.id)
+    with pytest.raises(CurationClaimNotHeldError):
+        current_curations_service.heartbeat(other_curator, req.id)
+    with pytest.raises(NoUnclaimedCurationRequestError):
+        current_curations_service.claim_next(other_curator)
+
+    res = current_curations_service.search(curator_identity, params={"unclaimed": True})
+    assert res.total == 0
+
+    current_curations_service.heartbeat(curator_identity, req.id)
+    current_curations_service.release(curator_identity, req.id)
+
+    # reviewing claims the request again
+    current_requests_service.execute_action(other_curator, req.id, "review")
+    with pytest.raises(CurationRequestClaimedError):
+        current_curations_service.claim(curator_identity, req.id)
+
+
+def test_claim_assigned_curation_request(
+    app,
+    db,
+    curator_role,
+    location,
+    simple_identity,
+    basic_record_data,
+    users,
+    monkeypatch,
+):
+    """Test that curators cannot claim requests assigned to other curators."""
+    datastore = app.extensions["security"].datastore
+    datastore.add_role_to_user(users[1], curator_role)
+    datastore.add_role_to_user(users[3], curator_role)
+    datastore.commit()
+    monkeypatch.setitem(
+        app.config,
+        "CURATIONS_ASSIGNMENT_STRATEGY",
+        "invenio_curations.services.assignment:RoundRobinAssignment",
+    )
+
+    draft = current_rdm_records.records_service.create(
+        identity=simple_identity,
+        data=basic_record_data,
+    )
+    req = current_curations_service.create(
+        identity=simple_identity,
+        data={"topic": {"record": draft.id}},
+    )
+
+    curators = {}
+    for user in [users[1], users[3]]:
+        identity = Identity(user.id)
+        identity.provides.add(UserNeed(user.id))
+        identity.provides.add(RoleNeed(curator_role.id))
+        curators[str(user.id)] = identity
+    assignee = curators.pop(req.data["receiver"]["user"])
+    [other_curator] = curators.values()
+
+    with pytest.raises(CannotExecuteActionError):
+        current_curations_service.claim(other_curator, req.id)
+    claim = current_curations_service.claim(assignee, req.id)
+    assert claim["user_id"] == str(assignee.id)
+
+
+def test_release_other_request(
+    app,
+    db,
+    curator_role,
+    location,
+    curator_identity,
+    basic_record_data,
+    community_simple,
+    com_owner_identity,
+):
+    """Test that only claims on curation requests can be released."""
+    draft = current_rdm_records.records_service.create(
+        identity=com_owner_identity,
+        data=basic_record_data,
+    )
+    community_submission = current_request_type_registry.lookup(
+        CommunitySubmission.type_id,
+    )
+    com_req = current_requests_service.create(
+        com_owner_identity,
+        {},
+        community_submission,
+        {"community": str(community_simple.id)},
+        topic={"record": draft.id},
+    )
+
+    with pytest.raises(NoResultFound):
+        current_curations_service.claim(curator_identity, com_req.id)
+    with pytest.raises(NoResultFound):
+        current_curations_service.release(curator_identity, com_req.id)
+
+
+def test_bulk_review_claimed_curation_request(
+    app,
+    db,
+    curator_role,
+    location,
+    simple_identity,
+    curator_identity,
+    basic_record_data,
+    users,
+):
+    """Test that a bulk review reports the requests claimed by other curators."""
+    other_curator = Identity(users[3].id)
+    other_curator.provides.add(UserNeed(users[3].id))
+    other_curator.provides.add(RoleNeed(curator_role.id))
+
+    request_ids = []
+    for _ in range(2):
+        draft = current_rdm_records.records_service.create(
+            identity=simple_identity,
+            data=basic_record_data,
+        )
+        req = current_curations_service.create(
+            identity=simple_identity,
+            data={"topic": {"record": draft.id}},
+        )
+        request_ids.append(req.id)
+
+    claimed_id, free_id = request_ids
+    current_curations_service.claim(other_curator, claimed_id)
+
+    res = current_curations_service.bulk_execute_action(
+        curator_identity,
+        "review",
+        {"ids": request_ids},
+    )
+    assert res["hits"] == [{"id": free_id, "status": "review"}]
+    assert [error["id"] for error in res["errors"]] == [claimed_id]
+
+    # the failed review did not roll back the others
+    assert (
+        current_requests_service.read(curator_identity, free_id).data["status"]
+        == "review"
+    )
+    assert (
+        current_requests_service.read(curator_identity, claimed_id).data["status"]
+        == "submitted"
+    )
+
+
+def test_assign_curation_requests(
+    app,
+    db,
+    curator_role,
+    location,
+    simple_identity,
+    curator_identity,
+    basic_record_data,
+    users,
+    monkeypatch,
+):
+    """Test that curation requests are assigned to the curators in turn."""
+    datastore = app.extensions["security"].datastore
+    datastore.add_role_to_user(users[1], curator_role)
+    datastore.add_role_to_user(users[3], curator_role)
+    datastore.commit()
+    monkeypatch.setitem(
+        app.config,
+        "CURATIONS_ASSIGNMENT_STRATEGY",
+        "invenio_curations.services.assignment:RoundRobinAssignment",
+    )
+
+    requests = []
+    for _ in range(2):
+        draft = current_rdm_records.records_service.create(
+            identity=simple_identity,
+            data=basic_record_data,
+        )
+        requests.append(
+            current_curations_service.create(
+                identity=simple_identity,
+                data={"topic": {"record": draft.id}},
+            ),
+        )
+    Request.index.refresh()
+
+    receivers = {req.data["receiver"]["user"]: req for req in requests}
+    assert set(receivers) == {str(users[1].id), str(users[3].id)}
+
+    # the other curators can still review the request
+    other_req = next(
+        req for id_, req in receivers.items() if id_ != str(curator_identity.id)
+    )
+    res = current_curations_service.search(curator_identity)
+    assert res.total == len(requests)
+    current_requests_service.execute_action(curator_identity, other_req.id, "review")
+
+
+def test_assign_least_loaded_curator(
+    app,
+    db,
+    curator_role,
+    location,
+    simple_identity,
+    basic_record_data,
+    users,
+    monkeypatch,
+):
+    """Test that curation requests are assigned to the least loaded curators."""
+    datastore = app.extensions["security"].datastore
+    datastore.add_role_to_user(users[1], curator_role)
+    datastore.add_role_to_user(users[3], curator_role)
+    datastore.commit()
+    monkeypatch.setitem(
+        app.config,
+        "CURATIONS_ASSIGNMENT_STRATEGY",
+        "invenio_curations.services.assignment:LeastLoadedAssignment",
+    )
+    current_cache.delete(_WORKLOAD_KEY)
+    curators = [str(users[1].id), str(users[3].id)]
+    workload = current_curations_service.get_workload(curators)
+
+    receivers = []
+    for _ in range(3):
+        draft = current_rdm_records.records_service.create(
+            identity=simple_identity,
+            data=basic_record_data,
+        )
+        req = current_curations_service.create(
+            identity=simple_identity,
+            data={"topic": {"record": draft.id}},
+        )
+        receivers.append(req.data["receiver"]["user"])
+
+    # each request goes to the curator with the fewest requests, the first one on a tie
+    expected = []
+    for _ in receivers:
+        curator = min(curators, key=workload.__getitem__)
+        expected.append(curator)
+        workload[curator] += 1
+    assert receivers == expected
+
+    # the assignments are counted until the workload index is computed again
+    assert current_curations_service.get_workload(curators) == workload
+
+    current_cache.delete(_WORKLOAD_KEY)
+    Request.index.refresh()
+    assert current_curations_service.get_workload(curators) == workload
@@ -7,9 +7,12 @@
 
 """Module tests."""
 
+import subprocess
+import sys
+
 from flask import Flask
 
-from invenio_curations import InvenioCurations, __version__
+from invenio_curations import InvenioCurations, __version__, config
 
 
 def test_version() -> None:
@@ -28,3 +31,46 @@ def test_init() -> None:
     assert "invenio-curations" not in app.extensions
     ext.init_app(app)
     assert "invenio-curations" in app.extensions
+
+
+def test_init_config() -> None:
+    """Test that the lazy configuration values are set as defaults too."""
+    assert {"CURATIONS_FACETS", "CURATIONS_NOTIFICATIONS_BUILDERS"} <= set(dir(config))
+
+    app = Flask("testapp")
+    app.config["CURATIONS_FACETS"] = {}
+    InvenioCurations(app)
+    assert app.config["CURATIONS_FACETS"] == {}
+    assert "status" in config.CURATIONS_FACETS
+    assert app.config["CURATIONS_NOTIFICATIONS_BUILDERS"] == (
+        config.CURATIONS_NOTIFICATIONS_BUILDERS
+    )
+
+
+def test_import_time() -> None:
+    """Test that the entry point modules do not import the heavy modules."""
+    modules = [
+        "invenio_curations",
+        "invenio_curations.config",
+        "invenio_curations.tasks",
+    ]
+    result = subprocess.run(  # noqa: S603
+        [sys.executable, "-X", "importtime", "-c", f"import {', '.join(modules)}"],
+        capture_output=True,
+        check=True,
+        text=True,
+    )
+
+    # lines look like: "import time:   self [us] | cumulative | imported package"
+    imported = {
+        line.rsplit("|", 1)[-1].strip()
+        for line in result.stderr.splitlines()
+        if line.startswith("import time:")
+    }
+    heavy_modules = {
+        "invenio_rdm_records",
+        "invenio_curations.services.service",
+        "invenio_curations.notifications.builders",
+        "invenio_curations.resources",
+    }
+    assert not heavy_modules & imported
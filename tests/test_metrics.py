@@ -0,0 +1,102 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (C) 2026 Graz University of Technology.
+#
+# Invenio-Curations is free software; you can redistribute it and/or modify it
+# under the terms of the MIT License; see LICENSE file for more details.
+
+"""Test the curations metrics."""
+
+import pytest
+from invenio_rdm_records.proxies import current_rdm_records
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+from invenio_curations import current_curations_service
+from invenio_curations.metrics import (
+    CurationsMetricsBackend,
+    InMemoryMetricsBackend,
+    _count_db_query,
+)
+from invenio_curations.proxies import current_curations
+from invenio_curations.services.errors import (
+    OpenRecordCurationRequestAlreadyExistsError,
+)
+
+
+def _listens() -> bool:
+    """Check if the SQL statements are counted."""
+    return event.contains(Engine, "before_cursor_execute", _count_db_query)
+
+
+@pytest.fixture
+def metrics_backend(app, monkeypatch):
+    """Collect the metrics in memory, counting the SQL statements."""
+    monkeypatch.setitem(
+        app.config,
+        "CURATIONS_METRICS_BACKEND",
+        InMemoryMetricsBackend,
+    )
+    current_curations.init_metrics(app)
+    yield current_curations.metrics
+    current_curations.metrics = CurationsMetricsBackend()
+    event.remove(Engine, "before_cursor_execute", _count_db_query)
+
+
+def test_default_backend_does_not_count_statements(app):
+    """Test that the default backend does not listen to the SQL statements."""
+    if _listens():
+        event.remove(Engine, "before_cursor_execute", _count_db_query)
+
+    current_curations.init_metrics(app)
+
+    assert type(current_curations.metrics) is CurationsMetricsBackend
+    assert not _listens()
+
+
+def test_instrumented_operations(
+    app,
+    db,
+    curator_role,
+    location,
+    simple_identity,
+    curator_identity,
+    basic_record_data,
+    metrics_backend,
+):
+    """Test that the calls, durations and queries of the operations are recorded."""
+    assert _listens()
+
+    draft = current_rdm_records.records_service.create(
+        identity=simple_identity,
+        data=basic_record_data,
+    )
+    current_curations_service.create(
+        identity=simple_identity,
+        data={"topic": {"record": draft.id}},
+    )
+    current_curations_service.search(curator_identity)
+
+    counters = metrics_backend.counters
+    observations = metrics_backend.observations
+    for operation in ["create", "search"]:
+        key = (("operation", operation),)
+        assert (
+            counters[("curations_operations_total", *key, ("status", "success"))] == 1
+        )
+        [duration] = observations[("curations_operation_duration_seconds", *key)]
+        assert duration > 0
+
+    create = (("operation", "create"),)
+    search = (("operation", "search"),)
+    # the creation resolves the draft and stores the request
+    [db_queries] = observations[("curations_operation_db_queries", *create)]
+    assert db_queries > 0
+    assert observations[("curations_operation_search_queries", *search)] == [1]
+
+    with pytest.raises(OpenRecordCurationRequestAlreadyExistsError):
+        current_curations_service.create(
+            identity=simple_identity,
+            data={"topic": {"record": draft.id}},
+        )
+    assert counters[("curations_operations_total", *create, ("status", "error"))] == 1
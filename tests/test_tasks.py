@@ -0,0 +1,158 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (C) 2026 Graz University of Technology.
+#
+# Invenio-Curations is free software; you can redistribute it and/or modify it
+# under the terms of the MIT License; see LICENSE file for more details.
+
+"""Test curation tasks."""
+
+import pytest
+from celery import current_app as current_celery_app
+from invenio_cache import current_cache
+from invenio_rdm_records.proxies import current_rdm_records
+from sqlalchemy.exc import OperationalError
+
+from invenio_curations import tasks
+from invenio_curations.models import CurationTopic
+from invenio_curations.tasks import _PENDING_SCHEDULED_KEY
+
+
+@pytest.fixture
+def pending_queue(app):
+    """Empty queue of pending curation requests, without a scheduled run."""
+    current_cache.delete(_PENDING_SCHEDULED_KEY)
+    with current_celery_app.pool.acquire(block=True) as connection:
+        queue = connection.SimpleQueue(app.config["CURATIONS_PENDING_QUEUE"])
+        queue.clear()
+        yield queue
+        queue.clear()
+        queue.close()
+
+
+@pytest.fixture
+def created_records(monkeypatch):
+    """Record the creations of curation requests, failing for some records."""
+    created = []
+
+    def _create(record_ids, user_id) -> None:
+        if "broken" in record_ids:
+            msg = "Invalid record"
+            raise ValueError(msg)
+        if "unreachable" in record_ids:
+            statement, msg = "SELECT 1", "Connection lost"
+            raise OperationalError(statement, {}, Exception(msg))
+        created.extend(record_ids)
+
+    monkeypatch.setattr(tasks, "_create_curation_requests", _create)
+    return created
+
+
+@pytest.fixture
+def scheduled_runs(monkeypatch):
+    """Record the scheduled runs of the pending curations task."""
+    scheduled = []
+    monkeypatch.setattr(
+        tasks.process_pending_curations,
+        "apply_async",
+        lambda **kwargs: scheduled.append(kwargs),
+    )
+    return scheduled
+
+
+def test_schedule_record_curation(app, pending_queue, scheduled_runs):
+    """Test that records queued within the delay are processed by one run."""
+    record_ids = ["abcd-1234", "efgh-5678"]
+    for record_id in record_ids:
+        tasks.schedule_record_curation(record_id, user_id="1")
+
+    assert pending_queue.qsize() == len(record_ids)
+    assert scheduled_runs == [{"countdown": app.config["CURATIONS_PENDING_DELAY"]}]
+
+
+def test_request_record_curation_shim(app, pending_queue, scheduled_runs):
+    """Test that the deprecated task queues the record like the scheduling."""
+    with pytest.deprecated_call():
+        tasks.request_record_curation({"id": "abcd-1234"}, user_id="1")
+
+    assert pending_queue.get(block=False).payload == {
+        "id": "abcd-1234",
+        "user_id": "1",
+    }
+    assert len(scheduled_runs) == 1
+
+
+def test_process_pending_curations(
+    app,
+    db,
+    curator_role,
+    location,
+    simple_identity,
+    basic_record_data,
+    pending_queue,
+    scheduled_runs,
+):
+    """Test that the queued records get their curation requests."""
+    record_ids = []
+    for _ in range(2):
+        draft = current_rdm_records.records_service.create(
+            identity=simple_identity,
+            data=basic_record_data,
+        )
+        record_ids.append(draft.id)
+        tasks.schedule_record_curation(draft.id, user_id=str(simple_identity.id))
+
+    tasks.process_pending_curations()
+
+    assert set(CurationTopic.get_request_ids("record", record_ids)) == set(record_ids)
+    assert pending_queue.qsize() == 0
+
+
+def test_process_pending_curations_drain(
+    app,
+    pending_queue,
+    scheduled_runs,
+    created_records,
+    monkeypatch,
+):
+    """Test that another run is triggered if more records are queued."""
+    monkeypatch.setitem(app.config, "CURATIONS_BULK_CREATE_CHUNK_SIZE", 1)
+    delayed = []
+    monkeypatch.setattr(
+        tasks.process_pending_curations,
+        "delay",
+        lambda: delayed.append(True),
+    )
+
+    tasks.schedule_record_curation("abcd-1234")
+    tasks.schedule_record_curation("efgh-5678")
+    tasks.process_pending_curations()
+
+    assert created_records == ["abcd-1234"]
+    assert delayed == [True]
+    assert pending_queue.qsize() == 1
+
+
+def test_process_pending_curations_errors(
+    app,
+    pending_queue,
+    scheduled_runs,
+    created_records,
+):
+    """Test that only the records failing with transient errors are requeued."""
+    # invalid records are dropped, without holding back the others
+    tasks.schedule_record_curation("broken")
+    tasks.schedule_record_curation("abcd-1234")
+    tasks.process_pending_curations()
+
+    assert created_records == ["abcd-1234"]
+    assert pending_queue.qsize() == 0
+
+    # on transient errors, the records are kept for the retry
+    tasks.schedule_record_curation("unreachable", user_id="1")
+    tasks.schedule_record_curation("efgh-5678", user_id="2")
+    with pytest.raises(OperationalError):
+        tasks.process_pending_curations()
+
+    assert created_records == ["abcd-1234", "efgh-5678"]
+    assert pending_queue.qsize() == 1
@@ -0,0 +1,43 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (C) 2026 Graz University of Technology.
+#
+# Invenio-Curations is free software; you can redistribute it and/or modify it
+# under the terms of the MIT License; see LICENSE file for more details.
+
+"""Test the curation UI pages."""
+
+from invenio_accounts.testutils import login_user_via_session
+from invenio_rdm_records.proxies import current_rdm_records
+
+from invenio_curations import current_curations_service
+
+
+def test_request_details_timeline_page_size(
+    app,
+    db,
+    client,
+    curator_role,
+    location,
+    users,
+    simple_identity,
+    basic_record_data,
+    monkeypatch,
+):
+    """Test that the curation request page passes its timeline page size."""
+    draft = current_rdm_records.records_service.create(
+        identity=simple_identity,
+        data=basic_record_data,
+    )
+    req = current_curations_service.create(
+        identity=simple_identity,
+        data={"topic": {"record": draft.id}},
+    )
+    monkeypatch.setitem(app.config, "CURATIONS_TIMELINE_PAGE_SIZE", 7)
+
+    login_user_via_session(client, email=users[0].email)
+    res = client.get(f"/me/requests/{req.id}")
+
+    assert res.status_code == 200  # noqa: PLR2004
+    # the page size is rendered into the config of the timeline by the parent page
+    assert '"size": 7' in res.get_data(as_text=True)